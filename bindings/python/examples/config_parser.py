@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """Example: Using vexy_json for configuration files"""
 
-import vexy_json
+import io
 import sys
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import vexy_json
 
 # Example configuration with forgiving JSON features
 CONFIG_TEMPLATE = """
@@ -72,8 +77,29 @@ CONFIG_TEMPLATE = """
 """
 
 
+def _freeze(value):
+    """Return a read-only view of a parsed value
+
+    Objects become ``MappingProxyType`` views and arrays become tuples, so
+    a single parse can be shared without callers mutating it.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Parsed once at import; load_config() hands out this read-only view
+_DEFAULT_CONFIG = _freeze(vexy_json.parse(CONFIG_TEMPLATE))
+
+
 def load_config(filename=None):
-    """Load configuration from file or use default template"""
+    """Load configuration from file or use default template
+
+    The default template is parsed once and returned as a shared read-only
+    view; parse ``CONFIG_TEMPLATE`` yourself for a copy you can modify.
+    """
     if filename:
         try:
             config = vexy_json.load(filename)
@@ -83,29 +109,50 @@ def load_config(filename=None):
             sys.exit(1)
     else:
         print("Using default configuration template")
-        config = vexy_json.parse(CONFIG_TEMPLATE)
+        config = _DEFAULT_CONFIG
 
     return config
 
 
 def print_config(config, indent=0):
-    """Pretty print configuration"""
-    prefix = "  " * indent
-
-    if isinstance(config, dict):
-        for key, value in config.items():
-            if isinstance(value, (dict, list)):
-                print(f"{prefix}{key}:")
-                print_config(value, indent + 1)
+    """Pretty print configuration
+
+    Walks the tree with an explicit stack and writes the result once, so
+    deep configurations cost neither recursion nor one write per line.
+    """
+    buf = io.StringIO()
+    # Entries are (node, indent) for containers still to expand, or plain
+    # strings for output that is ready to be written.
+    stack = deque([(config, indent)])
+
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            buf.write(entry)
+            continue
+
+        node, level = entry
+        prefix = "  " * level
+        if isinstance(node, Mapping):
+            items = [(f"{prefix}{key}", value) for key, value in node.items()]
+            scalar = "{}: {}\n"
+            nested = "{}:\n"
+        elif isinstance(node, (list, tuple)):
+            items = [(prefix, item) for item in node]
+            scalar = "{}- {}\n"
+            nested = "{}-\n"
+        else:
+            continue
+
+        # Push children in reverse so they pop off in document order
+        for label, value in reversed(items):
+            if isinstance(value, (Mapping, list, tuple)):
+                stack.append((value, level + 1))
+                stack.append(nested.format(label))
             else:
-                print(f"{prefix}{key}: {value}")
-    elif isinstance(config, list):
-        for item in config:
-            if isinstance(item, (dict, list)):
-                print(f"{prefix}-")
-                print_config(item, indent + 1)
-            else:
-                print(f"{prefix}- {item}")
+                stack.append(scalar.format(label, value))
+
+    sys.stdout.write(buf.getvalue())
 
 
 def validate_config(config):
@@ -161,8 +208,9 @@ def main():
 
     # Example: Save configuration
     if not config_file:
+        # The shared default is read-only, so write out a fresh parse of it
         output_file = "config_example.json"
-        vexy_json.dump(config, output_file, indent=2)
+        vexy_json.dump(vexy_json.parse(CONFIG_TEMPLATE), output_file, indent=2)
         print(f"\nSaved example configuration to: {output_file}")
 
 
@@ -1,6 +1,6 @@
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PyString};
 use pythonize::{depythonize, pythonize};
 use serde_json::Value as JsonValue;
 use vexy_json_core::{
@@ -250,6 +250,27 @@ impl Parser {
         }
     }
 
+    /// Parse a list of JSON strings in one call and return a list of results
+    ///
+    /// Crossing the Python/Rust boundary once for the whole batch avoids the
+    /// per-call overhead of `parse` when handling many small messages.
+    fn parse_many(&self, py: Python, inputs: &Bound<'_, PyList>) -> PyResult<Py<PyList>> {
+        let results = PyList::empty(py);
+        for (i, item) in inputs.iter().enumerate() {
+            let input = item.downcast::<PyString>()?.to_str()?;
+            match self.parser.parse(input) {
+                Ok(value) => results.append(json_to_python(py, &value)?)?,
+                Err(e) => {
+                    return Err(PyValueError::new_err(format!(
+                        "Parse error in input {}: {}",
+                        i, e
+                    )))
+                }
+            }
+        }
+        Ok(results.unbind())
+    }
+
     /// Parse JSON string and return result with repair information
     fn parse_detailed(&self, py: Python, input: &str) -> PyResult<ParseResult> {
         // For now, we'll just parse normally since repair tracking needs more work
@@ -5,6 +5,7 @@ import vexy_json
 import json
 import tempfile
 import os
+import importlib.util
 
 
 class TestBasicParsing:
@@ -170,13 +171,18 @@ class TestParser:
         parser = vexy_json.Parser()
 
         # Parse multiple inputs with same parser
-        results = []
         inputs = ['{"a": 1}', "[1, 2, 3]", '"hello"', "true"]
 
-        for input_str in inputs:
-            results.append(parser.parse(input_str))
-
+        # parse_many crosses into Rust once for the whole batch
+        results = parser.parse_many(inputs)
         assert results == [{"a": 1}, [1, 2, 3], "hello", True]
+        assert results == [parser.parse(input_str) for input_str in inputs]
+
+    def test_parse_many_reports_failing_input(self):
+        parser = vexy_json.Parser(vexy_json.Options(enable_repair=False))
+
+        with pytest.raises(ValueError, match="input 1"):
+            parser.parse_many(['{"a": 1}', "{{{invalid}}}"])
 
 
 class TestFileOperations:
@@ -287,5 +293,42 @@ class TestCompatibility:
         assert vexy_json.__version__ is not None
 
 
+class TestExamples:
+    """Test the example scripts shipped with the bindings"""
+
+    @staticmethod
+    def load_config_parser():
+        path = os.path.join(
+            os.path.dirname(__file__), os.pardir, "examples", "config_parser.py"
+        )
+        spec = importlib.util.spec_from_file_location("config_parser", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_print_config_nested(self, capsys):
+        config_parser = self.load_config_parser()
+        config_parser.print_config({"a": {"b": 1, "c": [1, {"d": None}]}, "e": None})
+        assert capsys.readouterr().out == (
+            "a:\n  b: 1\n  c:\n    - 1\n    -\n      d: None\ne: None\n"
+        )
+
+    def test_default_config_is_shared_and_read_only(self):
+        config_parser = self.load_config_parser()
+        config = config_parser.load_config()
+        assert config is config_parser.load_config()
+        assert config["server"]["port"] == 8080
+        assert config["features"]["beta_features"][0] == "dark_mode"
+        with pytest.raises(TypeError):
+            config["server"]["port"] = 9090
+        config_parser.validate_config(config)
+
+    def test_print_config_scalar_top_level(self, capsys):
+        config_parser = self.load_config_parser()
+        for value in (None, 42, "text"):
+            config_parser.print_config(value)
+        assert capsys.readouterr().out == ""
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
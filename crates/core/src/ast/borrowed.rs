@@ -0,0 +1,93 @@
+// this_file: src/ast/borrowed.rs
+
+//! Borrowed JSON values that reference the input text.
+
+use crate::ast::{Number, Value};
+use rustc_hash::FxHashMap;
+use std::borrow::Cow;
+
+/// A parsed JSON value whose strings borrow from the input where possible.
+///
+/// Strings and keys without escape sequences are slices of the original
+/// input; only escaped strings allocate. Use [`BorrowedValue::into_owned`]
+/// when the data has to outlive the input.
+#[derive(Debug, Clone, PartialEq)]
+pub enum BorrowedValue<'a> {
+    /// JSON null value
+    Null,
+    /// JSON boolean value
+    Bool(bool),
+    /// Integer number
+    I64(i64),
+    /// Floating-point number
+    F64(f64),
+    /// String, borrowed from the input unless it contained escapes
+    Str(Cow<'a, str>),
+    /// JSON array
+    Array(Vec<BorrowedValue<'a>>),
+    /// Object members in document order. With duplicate keys the last one
+    /// wins, as it does for [`Value::Object`].
+    Object(Vec<(Cow<'a, str>, BorrowedValue<'a>)>),
+}
+
+impl<'a> BorrowedValue<'a> {
+    /// Returns the member stored under `key` if this is an object.
+    pub fn get(&self, key: &str) -> Option<&BorrowedValue<'a>> {
+        match self {
+            BorrowedValue::Object(members) => {
+                members.iter().rev().find(|(k, _)| k == key).map(|(_, v)| v)
+            }
+            _ => None,
+        }
+    }
+
+    /// Returns the string slice if this is a string.
+    pub fn as_str(&self) -> Option<&str> {
+        match self {
+            BorrowedValue::Str(s) => Some(s),
+            _ => None,
+        }
+    }
+
+    /// Converts into an owned [`Value`], copying borrowed strings.
+    pub fn into_owned(self) -> Value {
+        match self {
+            BorrowedValue::Null => Value::Null,
+            BorrowedValue::Bool(b) => Value::Bool(b),
+            BorrowedValue::I64(i) => Value::Number(Number::Integer(i)),
+            BorrowedValue::F64(f) => Value::Number(Number::Float(f)),
+            BorrowedValue::Str(s) => Value::String(s.into_owned()),
+            BorrowedValue::Array(items) => {
+                Value::Array(items.into_iter().map(BorrowedValue::into_owned).collect())
+            }
+            BorrowedValue::Object(members) => {
+                let mut map =
+                    FxHashMap::with_capacity_and_hasher(members.len(), Default::default());
+                for (key, value) in members {
+                    map.insert(key.into_owned(), value.into_owned());
+                }
+                Value::Object(map)
+            }
+        }
+    }
+}
+
+impl From<Value> for BorrowedValue<'static> {
+    fn from(value: Value) -> Self {
+        match value {
+            Value::Null => BorrowedValue::Null,
+            Value::Bool(b) => BorrowedValue::Bool(b),
+            Value::Number(Number::Integer(i)) => BorrowedValue::I64(i),
+            Value::Number(Number::Float(f)) => BorrowedValue::F64(f),
+            Value::String(s) => BorrowedValue::Str(Cow::Owned(s)),
+            Value::Array(items) => {
+                BorrowedValue::Array(items.into_iter().map(BorrowedValue::from).collect())
+            }
+            Value::Object(map) => BorrowedValue::Object(
+                map.into_iter()
+                    .map(|(k, v)| (Cow::Owned(k), BorrowedValue::from(v)))
+                    .collect(),
+            ),
+        }
+    }
+}
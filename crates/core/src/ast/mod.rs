@@ -6,16 +6,19 @@
 //! - `Token`: Lexical tokens produced by the lexer
 //! - `Value`: Parsed JSON values with support for all vexy_json extensions
 //! - `Number`: Numeric value representation supporting integers and floats
+//! - `BorrowedValue`: Parsed values whose strings borrow from the input
 //!
 //! These types form the foundation of the parsing pipeline, from lexical analysis
 //! through to final value construction.
 
+pub mod borrowed;
 pub mod builder;
 pub mod token;
 pub mod value;
 pub mod visitor;
 
 // Re-export all public types for convenient access
+pub use borrowed::BorrowedValue;
 pub use builder::{ArrayBuilder, ObjectBuilder, ValueBuilder};
 pub use token::Token;
 pub use value::{Number, Value};
@@ -268,25 +268,23 @@ impl ContextWindow {
 }
 
 /// Converts a byte position to line/column coordinates.
-fn byte_to_line_col(input: &str, byte_pos: usize) -> LineCol {
-    let mut line = 1;
-    let mut column = 1;
-    let mut current_pos = 0;
-
-    for ch in input.chars() {
-        if current_pos >= byte_pos {
-            break;
-        }
-
-        if ch == '\n' {
-            line += 1;
-            column = 1;
-        } else {
-            column += 1;
-        }
-
-        current_pos += ch.len_utf8();
-    }
+/// Recovers the 1-based line and column of `byte_pos` in `input`.
+///
+/// Positions are only tracked as byte offsets while parsing; line and column
+/// are computed here on demand, with one `memchr` pass over the prefix, so
+/// the hot loops never pay for them. Columns count characters.
+pub(crate) fn byte_to_line_col<T: AsRef<[u8]> + ?Sized>(input: &T, byte_pos: usize) -> LineCol {
+    let input = input.as_ref();
+    let prefix = &input[..byte_pos.min(input.len())];
+    let line = memchr::memchr_iter(b'\n', prefix).count() + 1;
+    let line_start = memchr::memrchr(b'\n', prefix).map_or(0, |i| i + 1);
+    // Characters that start before `byte_pos`: every byte except UTF-8
+    // continuation bytes.
+    let column = prefix[line_start..]
+        .iter()
+        .filter(|&&b| (b as i8) >= -0x40)
+        .count()
+        + 1;
 
     LineCol { line, column }
 }
@@ -337,6 +335,10 @@ mod tests {
         assert_eq!(byte_to_line_col(input, 5), LineCol::new(1, 6)); // '\n' position
         assert_eq!(byte_to_line_col(input, 6), LineCol::new(2, 1)); // 'w' position
         assert_eq!(byte_to_line_col(input, 12), LineCol::new(3, 1)); // 'f' position
+        assert_eq!(byte_to_line_col(input, 100), LineCol::new(3, 4)); // past the end
+
+        // Columns count characters, not bytes
+        assert_eq!(byte_to_line_col("é\nüx", 5), LineCol::new(2, 2));
     }
 
     #[test]
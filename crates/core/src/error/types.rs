@@ -1,7 +1,7 @@
 // this_file: src/error/types.rs
 
 use crate::error::terminal::{ColorScheme, TerminalFormatter};
-use crate::error::Span;
+use crate::error::{LineCol, Span};
 use thiserror::Error;
 
 /// Structured error codes for programmatic error handling.
@@ -362,6 +362,16 @@ impl Error {
         }
     }
 
+    /// Returns the 1-based line and column of the error in `input`, if the
+    /// error has a position.
+    ///
+    /// Parsing only tracks byte offsets; this rescans the prefix of `input`
+    /// once, so it is meant for the error path only.
+    pub fn line_col(&self, input: &str) -> Option<LineCol> {
+        self.position()
+            .map(|pos| crate::error::span::byte_to_line_col(input, pos))
+    }
+
     /// Returns a span covering the error location, if available.
     ///
     /// This provides more precise location information than just a position,
@@ -7,10 +7,79 @@
 //! - SIMD acceleration where available
 
 use crate::ast::Token;
+use crate::error::span::byte_to_line_col;
 use crate::error::{Error, Result, Span};
-use crate::lexer::{JsonLexer, LexerConfig, LexerStats};
+use crate::lexer::{JsonLexer, LexerConfig, LexerMode, LexerStats};
+use crate::optimization::simd::{find_string_end, leading_whitespace, StructuralIndex};
+use memchr::memchr2;
 use std::time::Instant;
 
+/// Inputs shorter than this are lexed without building a structural index;
+/// the extra pass over the input does not pay off for small documents.
+const INDEX_MIN_LEN: usize = 1024;
+
+/// What the lexer does with a token's first byte.
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum ByteAction {
+    /// Single-byte punctuation
+    Punct(Token),
+    /// Opening quote of a string delimited by this byte
+    String,
+    /// Start of a number
+    Number,
+    /// `/`, which may open a comment
+    Slash,
+    /// `#` line comment
+    HashComment,
+    /// Start of an unquoted identifier or keyword
+    Identifier,
+    /// Not allowed here
+    Invalid,
+}
+
+/// Builds the first-byte dispatch table for one lexer mode.
+///
+/// The options only change what a handful of first bytes mean, so each
+/// mode gets its own table and the token loop does a single lookup instead
+/// of re-checking the mode for every token.
+const fn dispatch_table(forgiving: bool) -> [ByteAction; 256] {
+    let mut table = [ByteAction::Invalid; 256];
+    table[b'{' as usize] = ByteAction::Punct(Token::LeftBrace);
+    table[b'}' as usize] = ByteAction::Punct(Token::RightBrace);
+    table[b'[' as usize] = ByteAction::Punct(Token::LeftBracket);
+    table[b']' as usize] = ByteAction::Punct(Token::RightBracket);
+    table[b',' as usize] = ByteAction::Punct(Token::Comma);
+    table[b':' as usize] = ByteAction::Punct(Token::Colon);
+    table[b'"' as usize] = ByteAction::String;
+    table[b'-' as usize] = ByteAction::Number;
+    table[b'+' as usize] = ByteAction::Number;
+    table[b'.' as usize] = ByteAction::Number;
+    let mut b = b'0';
+    while b <= b'9' {
+        table[b as usize] = ByteAction::Number;
+        b += 1;
+    }
+
+    if forgiving {
+        table[b'\'' as usize] = ByteAction::String;
+        table[b'/' as usize] = ByteAction::Slash;
+        table[b'#' as usize] = ByteAction::HashComment;
+        table[b'_' as usize] = ByteAction::Identifier;
+        table[b'$' as usize] = ByteAction::Identifier;
+        let mut b = b'a';
+        while b <= b'z' {
+            table[b as usize] = ByteAction::Identifier;
+            table[(b - b'a' + b'A') as usize] = ByteAction::Identifier;
+            b += 1;
+        }
+    }
+
+    table
+}
+
+static STRICT_DISPATCH: [ByteAction; 256] = dispatch_table(false);
+static FORGIVING_DISPATCH: [ByteAction; 256] = dispatch_table(true);
+
 /// Fast hand-optimized lexer implementation
 pub struct FastLexer<'a> {
     /// Input bytes for faster access
@@ -25,6 +94,12 @@ pub struct FastLexer<'a> {
     stats: LexerStats,
     /// Start time for stats
     start_time: Option<Instant>,
+    /// Offsets of all token starts, when the input allows building one
+    index: Option<StructuralIndex>,
+    /// Forward-only cursor into `index`
+    cursor: usize,
+    /// First-byte dispatch table for the configured mode
+    dispatch: &'static [ByteAction; 256],
 }
 
 impl<'a> FastLexer<'a> {
@@ -36,6 +111,18 @@ impl<'a> FastLexer<'a> {
             None
         };
 
+        let index = if input.len() >= INDEX_MIN_LEN {
+            StructuralIndex::build(input.as_bytes())
+        } else {
+            None
+        };
+
+        let dispatch = if config.mode == LexerMode::Strict {
+            &STRICT_DISPATCH
+        } else {
+            &FORGIVING_DISPATCH
+        };
+
         FastLexer {
             input: input.as_bytes(),
             position: 0,
@@ -43,6 +130,9 @@ impl<'a> FastLexer<'a> {
             config,
             stats: LexerStats::default(),
             start_time,
+            index,
+            cursor: 0,
+            dispatch,
         }
     }
 
@@ -50,16 +140,26 @@ impl<'a> FastLexer<'a> {
     #[inline(always)]
     fn skip_whitespace(&mut self) -> bool {
         let start = self.position;
-        while self.position < self.input.len() {
-            match self.input[self.position] {
-                b' ' | b'\t' | b'\r' => self.position += 1,
-                b'\n' => {
-                    self.position += 1;
-                    // Newline handling for newline_as_comma would go here
+
+        // Most tokens are followed by at most one space, so only hand the
+        // rest of the run to the block classifier once we know it exists.
+        // Newline handling for newline_as_comma would go here
+        if matches!(
+            self.input.get(self.position),
+            Some(b' ' | b'\t' | b'\r' | b'\n')
+        ) {
+            self.position = match &self.index {
+                // Everything up to the next token start is whitespace.
+                Some(index) => index
+                    .next_after(&mut self.cursor, self.position)
+                    .unwrap_or(self.input.len()),
+                None => {
+                    let rest = self.position + 1;
+                    rest + leading_whitespace(&self.input[rest..])
                 }
-                _ => break,
-            }
+            };
         }
+
         self.position > start
     }
 
@@ -67,26 +167,28 @@ impl<'a> FastLexer<'a> {
     #[inline]
     fn parse_string(&mut self, quote: u8) -> Result<(Token, Span)> {
         let start = self.position;
-        self.position += 1; // Skip opening quote
-
-        while self.position < self.input.len() {
-            match self.input[self.position] {
-                b'\\' => {
-                    // Skip escape sequence
-                    self.position += 1;
-                    if self.position < self.input.len() {
-                        self.position += 1;
-                    }
-                }
-                b if b == quote => {
-                    self.position += 1; // Skip closing quote
-                    return Ok((Token::String, Span::new(start, self.position)));
-                }
-                _ => self.position += 1,
+        let body = start + 1; // Skip opening quote
+
+        // The index records closing quotes, so the string ends at the next
+        // token start. Fall back to scanning if it does not hold a match.
+        let indexed_end = self.index.as_ref().and_then(|index| {
+            index
+                .next_after(&mut self.cursor, start)
+                .filter(|&end| self.input[end] == quote)
+        });
+        let end = indexed_end
+            .or_else(|| find_string_end(&self.input[body..], quote).map(|len| body + len));
+
+        match end {
+            Some(end) => {
+                self.position = end + 1; // Skip closing quote
+                Ok((Token::String, Span::new(start, self.position)))
+            }
+            None => {
+                self.position = self.input.len();
+                Err(Error::UnterminatedString(start))
             }
         }
-
-        Err(Error::UnterminatedString(start))
     }
 
     /// Parse a number token
@@ -267,12 +369,8 @@ impl<'a> FastLexer<'a> {
     /// Skip single-line comment
     #[inline]
     fn skip_single_line_comment(&mut self) {
-        while self.position < self.input.len() {
-            match self.input[self.position] {
-                b'\n' | b'\r' => break,
-                _ => self.position += 1,
-            }
-        }
+        self.position += memchr2(b'\n', b'\r', &self.input[self.position..])
+            .unwrap_or(self.input.len() - self.position);
     }
 
     /// Skip multi-line comment
@@ -281,7 +379,12 @@ impl<'a> FastLexer<'a> {
         let start = self.position - 2; // We already consumed /*
         let mut depth = 1;
 
-        while self.position + 1 < self.input.len() {
+        // Only `/` and `*` can open or close a comment, so jump between them.
+        while let Some(offset) = memchr2(b'/', b'*', &self.input[self.position..]) {
+            self.position += offset;
+            if self.position + 1 >= self.input.len() {
+                break;
+            }
             if self.input[self.position] == b'/' && self.input[self.position + 1] == b'*' {
                 self.position += 2;
                 depth += 1;
@@ -309,73 +412,39 @@ impl<'a> FastLexer<'a> {
             }
 
             let ch = self.input[self.position];
-            match ch {
-                b'{' => {
-                    let span = Span::new(self.position, self.position + 1);
-                    self.position += 1;
-                    return Ok((Token::LeftBrace, span));
-                }
-                b'}' => {
-                    let span = Span::new(self.position, self.position + 1);
-                    self.position += 1;
-                    return Ok((Token::RightBrace, span));
-                }
-                b'[' => {
-                    let span = Span::new(self.position, self.position + 1);
-                    self.position += 1;
-                    return Ok((Token::LeftBracket, span));
-                }
-                b']' => {
-                    let span = Span::new(self.position, self.position + 1);
-                    self.position += 1;
-                    return Ok((Token::RightBracket, span));
-                }
-                b',' => {
-                    let span = Span::new(self.position, self.position + 1);
-                    self.position += 1;
-                    return Ok((Token::Comma, span));
-                }
-                b':' => {
+            match self.dispatch[ch as usize] {
+                ByteAction::Punct(token) => {
                     let span = Span::new(self.position, self.position + 1);
                     self.position += 1;
-                    return Ok((Token::Colon, span));
+                    return Ok((token, span));
                 }
-                b'"' => return self.parse_string(b'"'),
-                b'\'' if self.config.mode != crate::lexer::LexerMode::Strict => {
-                    return self.parse_string(b'\'');
-                }
-                b'-' | b'+' | b'.' | b'0'..=b'9' => return self.parse_number(),
-                b'/' => {
-                    if self.position + 1 < self.input.len() {
-                        match self.input[self.position + 1] {
-                            b'/' if self.config.mode != crate::lexer::LexerMode::Strict => {
-                                self.position += 2;
-                                self.skip_single_line_comment();
-                                continue; // Skip comment and continue
-                            }
-                            b'*' if self.config.mode != crate::lexer::LexerMode::Strict => {
-                                self.position += 2;
-                                self.skip_multi_line_comment()?;
-                                continue; // Skip comment and continue
-                            }
-                            _ => {}
+                ByteAction::String => return self.parse_string(ch),
+                ByteAction::Number => return self.parse_number(),
+                ByteAction::Slash => {
+                    match self.input.get(self.position + 1) {
+                        Some(b'/') => {
+                            self.position += 2;
+                            self.skip_single_line_comment();
+                            continue; // Skip comment and continue
                         }
+                        Some(b'*') => {
+                            self.position += 2;
+                            self.skip_multi_line_comment()?;
+                            continue; // Skip comment and continue
+                        }
+                        _ => {}
                     }
                     return Err(Error::UnexpectedChar('/', self.position));
                 }
-                b'#' if self.config.mode != crate::lexer::LexerMode::Strict => {
+                ByteAction::HashComment => {
                     self.position += 1;
                     self.skip_single_line_comment();
                     continue; // Skip comment and continue
                 }
-                b'a'..=b'z' | b'A'..=b'Z' | b'_' | b'$' => {
-                    if self.config.mode != crate::lexer::LexerMode::Strict {
-                        return self.parse_identifier();
-                    } else {
-                        return Err(Error::UnexpectedChar(ch as char, self.position));
-                    }
+                ByteAction::Identifier => return self.parse_identifier(),
+                ByteAction::Invalid => {
+                    return Err(Error::UnexpectedChar(ch as char, self.position))
                 }
-                _ => return Err(Error::UnexpectedChar(ch as char, self.position)),
             }
         }
     }
@@ -420,19 +489,9 @@ impl<'a> JsonLexer for FastLexer<'a> {
             return (0, 0);
         }
 
-        let mut line = 1;
-        let mut col = 1;
-
-        for i in 0..self.position.min(self.input.len()) {
-            if self.input[i] == b'\n' {
-                line += 1;
-                col = 1;
-            } else {
-                col += 1;
-            }
-        }
-
-        (line, col)
+        // Computed on demand so that lexing only ever tracks byte offsets.
+        let pos = byte_to_line_col(self.input, self.position);
+        (pos.line, pos.column)
     }
 
     fn is_eof(&self) -> bool {
@@ -500,6 +559,85 @@ mod tests {
         assert_eq!(lexer.next_token().unwrap().0, Token::RightBrace);
     }
 
+    #[test]
+    fn test_fast_lexer_long_whitespace_runs() {
+        let config = LexerConfig {
+            mode: LexerMode::Forgiving,
+            ..Default::default()
+        };
+        let input = format!(
+            "{{{}\"key\":{}1{}}}",
+            " ".repeat(70),
+            "\n\t".repeat(20),
+            " "
+        );
+        let mut lexer = FastLexer::new(&input, config);
+
+        assert_eq!(lexer.next_token().unwrap().0, Token::LeftBrace);
+        let (token, span) = lexer.next_token().unwrap();
+        assert_eq!(token, Token::String);
+        assert_eq!(span.start, 71);
+        assert_eq!(lexer.next_token().unwrap().0, Token::Colon);
+        assert_eq!(lexer.next_token().unwrap().0, Token::Number);
+        assert_eq!(lexer.next_token().unwrap().0, Token::RightBrace);
+        assert_eq!(lexer.next_token().unwrap().0, Token::Eof);
+    }
+
+    #[test]
+    fn test_fast_lexer_indexed_matches_plain() {
+        let config = LexerConfig {
+            mode: LexerMode::Forgiving,
+            ..Default::default()
+        };
+        let item = r#"{"name": "item \"quoted\"", "tags": [true, null, -1.5e3],   key: 42},"#;
+        // Forgiving constructs are classified byte by byte; the odd length
+        // puts them at every offset within a block.
+        let forgiving = "{'it\\'s': 1, # \"x\n /* a /* b */ [ */ k: \"v\"}, // ' \n";
+        let input = format!(
+            "[{}\n{}{}]",
+            item.repeat(INDEX_MIN_LEN / item.len() + 1),
+            forgiving.repeat(64),
+            item
+        );
+        assert!(StructuralIndex::build(input.as_bytes()).is_some());
+
+        let mut indexed = FastLexer::new(&input, config.clone());
+        assert!(indexed.index.is_some());
+        let mut plain = FastLexer::new(&input, config);
+        plain.index = None;
+
+        loop {
+            let expected = plain.next_token().unwrap();
+            assert_eq!(indexed.next_token().unwrap(), expected);
+            if expected.0 == Token::Eof {
+                break;
+            }
+        }
+    }
+
+    #[test]
+    fn test_fast_lexer_strict_dispatch() {
+        for input in ["'a'", "# comment", "// comment", "key", "/"] {
+            let config = LexerConfig {
+                mode: LexerMode::Strict,
+                ..Default::default()
+            };
+            let mut lexer = FastLexer::new(input, config);
+            assert!(
+                matches!(lexer.next_token(), Err(Error::UnexpectedChar(_, 0))),
+                "input: {input:?}"
+            );
+        }
+
+        let config = LexerConfig {
+            mode: LexerMode::Forgiving,
+            ..Default::default()
+        };
+        let mut lexer = FastLexer::new("# comment\n'a' key", config);
+        assert_eq!(lexer.next_token().unwrap().0, Token::String);
+        assert_eq!(lexer.next_token().unwrap().0, Token::UnquotedString);
+    }
+
     #[test]
     fn test_fast_lexer_stats() {
         let config = LexerConfig {
@@ -4,6 +4,7 @@
 //! adapted to implement the JsonLexer trait.
 
 use crate::ast::Token;
+use crate::error::span::byte_to_line_col;
 use crate::error::{Error, Result, Span};
 use crate::lexer::JsonLexer;
 use logos::Logos;
@@ -13,9 +14,6 @@ pub struct LogosLexer<'a> {
     lexer: logos::Lexer<'a, Token>,
     input: &'a str,
     peeked: Option<(Token, Span)>,
-    line: usize,
-    column: usize,
-    last_newline_pos: usize,
 }
 
 impl<'a> LogosLexer<'a> {
@@ -25,22 +23,6 @@ impl<'a> LogosLexer<'a> {
             lexer: Token::lexer(input),
             input,
             peeked: None,
-            line: 1,
-            column: 1,
-            last_newline_pos: 0,
-        }
-    }
-
-    fn update_position(&mut self, span: &Span) {
-        let text = &self.input[self.last_newline_pos..span.start];
-        for ch in text.chars() {
-            if ch == '\n' {
-                self.line += 1;
-                self.column = 1;
-                self.last_newline_pos = span.start;
-            } else {
-                self.column += 1;
-            }
         }
     }
 
@@ -76,7 +58,6 @@ impl<'a> JsonLexer for LogosLexer<'a> {
             Some(token_result) => {
                 let logos_span = self.lexer.span();
                 let span = Span::new(logos_span.start, logos_span.end);
-                self.update_position(&span);
 
                 match token_result {
                     Ok(token) => Ok((token, span)),
@@ -105,7 +86,9 @@ impl<'a> JsonLexer for LogosLexer<'a> {
     }
 
     fn line_col(&self) -> (usize, usize) {
-        (self.line, self.column)
+        // Computed on demand instead of counting lines for every token.
+        let pos = byte_to_line_col(self.input, self.lexer.span().start);
+        (pos.line, pos.column)
     }
 
     fn is_eof(&self) -> bool {
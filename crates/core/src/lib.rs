@@ -48,6 +48,8 @@ pub mod parallel_chunked;
 /// WebAssembly bindings for browser usage.
 #[cfg(feature = "wasm")]
 pub use ast::{Number, Token, Value};
+
+pub use ast::BorrowedValue;
 pub use error::{EnhancedParseResult, ParsingTier, RepairAction, RepairType};
 pub use error::{Error, ParseResult, Result};
 pub use lazy::{
@@ -57,11 +59,12 @@ pub use lazy::{
 pub use lexer::Lexer;
 pub use parallel::{parse_ndjson_parallel, parse_parallel, ParallelConfig, ParallelParser};
 pub use parser::{
-    parse, parse_iterative, parse_optimized, parse_optimized_v2, parse_optimized_v2_with_options,
-    parse_optimized_v3, parse_optimized_v3_with_options, parse_optimized_with_options, 
-    parse_recursive, parse_v2_with_stats, parse_v3_with_stats,
-    parse_with_detailed_repair_tracking, parse_with_fallback, parse_with_options, parse_with_stats,
-    IterativeParser, Parser, ParserOptions, RecursiveDescentParser,
+    is_strict_json, parse, parse_borrowed, parse_borrowed_in, parse_iterative, parse_number_array,
+    parse_number_array_as, parse_optimized, parse_optimized_v2, parse_optimized_v2_with_options,
+    parse_optimized_v3, parse_optimized_v3_with_options, parse_optimized_with_options,
+    parse_recursive, parse_v2_with_stats, parse_v3_with_stats, parse_with_detailed_repair_tracking,
+    parse_with_fallback, parse_with_options, parse_with_stats, IterativeParser, NumberArray,
+    NumberElement, Parser, ParserOptions, RecursiveDescentParser,
 };
 pub use repair::JsonRepairer;
 pub use streaming::{
@@ -0,0 +1,165 @@
+// this_file: crates/core/src/optimization/simd/escape.rs
+
+//! JSON string escaping for serializers.
+//!
+//! Most strings written by a serializer contain nothing that needs escaping,
+//! so the writer searches for the next `"`, `\` or control byte and copies
+//! the clean span in between with a single `push_str`. The search uses a
+//! 32-byte AVX2 kernel for spans of at least [`SIMD_THRESHOLD`] bytes, and
+//! an 8-byte SWAR loop for shorter spans (where the indirect call would
+//! dominate) and on CPUs without AVX2.
+
+use super::swar;
+use std::sync::OnceLock;
+
+/// Spans shorter than this are scanned without SIMD.
+pub const SIMD_THRESHOLD: usize = 32;
+
+/// Whether `byte` has to be escaped inside a JSON string.
+#[inline(always)]
+fn needs_escape(byte: u8) -> bool {
+    byte == b'"' || byte == b'\\' || byte < 0x20
+}
+
+/// Scalar search for the first byte that has to be escaped.
+#[inline]
+pub fn find_json_escape_scalar(bytes: &[u8]) -> Option<usize> {
+    bytes.iter().position(|&b| needs_escape(b))
+}
+
+/// SWAR search for the first byte that has to be escaped.
+///
+/// Tests eight bytes per step for `"`, `\` and control characters.
+#[inline]
+pub fn find_json_escape_swar(bytes: &[u8]) -> Option<usize> {
+    let mut pos = 0;
+    while pos + swar::WORD_SIZE <= bytes.len() {
+        let word = swar::load(bytes, pos);
+        let mask =
+            swar::eq_bytes(word, b'"') | swar::eq_bytes(word, b'\\') | swar::lt_bytes(word, 0x20);
+        if mask != 0 {
+            return Some(pos + swar::first_lane(mask));
+        }
+        pos += swar::WORD_SIZE;
+    }
+
+    find_json_escape_scalar(&bytes[pos..]).map(|offset| pos + offset)
+}
+
+#[cfg(target_arch = "x86_64")]
+fn find_json_escape_avx2(bytes: &[u8]) -> Option<usize> {
+    // SAFETY: only selected by `select_finder` after AVX2 was detected.
+    unsafe { super::stage1_avx2::find_json_escape(bytes) }
+}
+
+fn select_finder() -> fn(&[u8]) -> Option<usize> {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            return find_json_escape_avx2;
+        }
+    }
+
+    find_json_escape_swar
+}
+
+static FIND_ESCAPE: OnceLock<fn(&[u8]) -> Option<usize>> = OnceLock::new();
+
+pub(super) fn init_dispatch() {
+    FIND_ESCAPE.get_or_init(select_finder);
+}
+
+/// Return the offset of the first byte in `bytes` that has to be escaped
+/// in a JSON string (`"`, `\` or a control character below `0x20`).
+#[inline]
+pub fn find_json_escape(bytes: &[u8]) -> Option<usize> {
+    if bytes.len() < SIMD_THRESHOLD {
+        return find_json_escape_swar(bytes);
+    }
+    (FIND_ESCAPE.get_or_init(select_finder))(bytes)
+}
+
+/// Append `s` to `out` as a quoted JSON string literal.
+pub fn escape_json_string(out: &mut String, s: &str) {
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+
+    out.reserve(s.len() + 2);
+    out.push('"');
+
+    let bytes = s.as_bytes();
+    let mut start = 0;
+    while let Some(offset) = find_json_escape(&bytes[start..]) {
+        let pos = start + offset;
+        // Escapable bytes are ASCII, so `pos` is always a char boundary.
+        out.push_str(&s[start..pos]);
+        match bytes[pos] {
+            b'"' => out.push_str("\\\""),
+            b'\\' => out.push_str("\\\\"),
+            b'\n' => out.push_str("\\n"),
+            b'\r' => out.push_str("\\r"),
+            b'\t' => out.push_str("\\t"),
+            0x08 => out.push_str("\\b"),
+            0x0C => out.push_str("\\f"),
+            byte => {
+                out.push_str("\\u00");
+                out.push(HEX[(byte >> 4) as usize] as char);
+                out.push(HEX[(byte & 0x0F) as usize] as char);
+            }
+        }
+        start = pos + 1;
+    }
+
+    out.push_str(&s[start..]);
+    out.push('"');
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn escaped(s: &str) -> String {
+        let mut out = String::new();
+        escape_json_string(&mut out, s);
+        out
+    }
+
+    #[test]
+    fn test_find_json_escape() {
+        assert_eq!(find_json_escape(b""), None);
+        assert_eq!(find_json_escape(b"plain"), None);
+        assert_eq!(find_json_escape(b"a\"b"), Some(1));
+
+        let mut long = vec![b'x'; 100];
+        assert_eq!(find_json_escape(&long), None);
+        for (pos, byte) in [(0, b'"'), (31, b'\\'), (32, 0x1F), (70, b'\n'), (99, 0x00)] {
+            long[pos] = byte;
+            assert_eq!(find_json_escape(&long), Some(pos), "byte {byte:#04x}");
+            assert_eq!(find_json_escape_scalar(&long), Some(pos));
+            assert_eq!(find_json_escape_swar(&long), Some(pos));
+            long[pos] = b'x';
+        }
+
+        // Bytes at or above 0x20 never need escaping, including non-ASCII.
+        let high: Vec<u8> = (0x20..=0xFFu8)
+            .filter(|&b| b != b'"' && b != b'\\')
+            .collect();
+        assert_eq!(find_json_escape(&high), None);
+        assert_eq!(find_json_escape_swar(&high), None);
+    }
+
+    #[test]
+    fn test_escape_json_string() {
+        assert_eq!(escaped(""), r#""""#);
+        assert_eq!(escaped("hello"), r#""hello""#);
+        assert_eq!(escaped("a\"b\\c"), r#""a\"b\\c""#);
+        assert_eq!(escaped("\n\r\t\u{8}\u{c}"), r#""\n\r\t\b\f""#);
+        assert_eq!(escaped("\u{1}\u{1f}"), r#""\u0001\u001f""#);
+        assert_eq!(escaped("héllo \"wörld\""), r#""héllo \"wörld\"""#);
+
+        let long = format!("{}\"{}", "ü".repeat(40), "x".repeat(40));
+        assert_eq!(
+            escaped(&long),
+            format!("\"{}\\\"{}\"", "ü".repeat(40), "x".repeat(40))
+        );
+    }
+}
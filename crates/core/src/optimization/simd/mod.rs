@@ -1,15 +1,46 @@
-// this_file: crates/core/src/optimization/simd.rs
+// this_file: crates/core/src/optimization/simd/mod.rs
 
 //! SIMD-accelerated string parsing optimizations.
 //!
 //! This module provides SIMD-accelerated versions of string parsing functions
 //! that can significantly improve performance for large strings. All functions
 //! include scalar fallbacks for non-SIMD architectures.
+//!
+//! The x86_64 kernels use SSE2 directly: it is part of the x86_64 baseline,
+//! so no runtime feature check is needed.
 
 use crate::error::{Error, Result};
 #[cfg(target_arch = "x86_64")]
 use std::arch::x86_64::*;
 
+pub mod escape;
+pub mod stage1;
+#[cfg(target_arch = "x86_64")]
+pub mod stage1_avx2;
+#[cfg(target_arch = "x86_64")]
+pub mod stage1_avx512;
+#[cfg(target_arch = "aarch64")]
+pub mod stage1_neon;
+pub mod string_mask;
+pub mod structural_index;
+pub mod swar;
+
+pub use escape::{escape_json_string, find_json_escape};
+pub use stage1::{classify_block, classify_block64, leading_whitespace};
+pub use string_mask::{find_string_end, Stage1Block, Stage1Scanner, StringScanner};
+pub use structural_index::StructuralIndex;
+
+/// Resolve every runtime-dispatched kernel for the running CPU.
+///
+/// Kernels are otherwise selected lazily on first use. Calling this once at
+/// startup (the Python module does so on import) moves feature detection
+/// out of the first parse; afterwards each call is a plain indirect call.
+pub fn init_dispatch() {
+    stage1::init_dispatch();
+    string_mask::init_dispatch();
+    escape::init_dispatch();
+}
+
 /// SIMD-accelerated backslash detection for fast string escape analysis.
 ///
 /// This function uses SIMD instructions to quickly scan for backslashes in strings,
@@ -24,13 +55,14 @@ pub fn has_backslash_simd(s: &str) -> bool {
 
     #[cfg(target_arch = "x86_64")]
     {
-        if is_x86_feature_detected!("sse2") {
-            return unsafe { has_backslash_sse2(s.as_bytes()) };
-        }
+        unsafe { has_backslash_sse2(s.as_bytes()) }
     }
 
-    // Fallback to scalar implementation
-    s.contains('\\')
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        // Fallback to scalar implementation
+        s.contains('\\')
+    }
 }
 
 /// SIMD-accelerated string validation for JSON compliance.
@@ -46,13 +78,14 @@ pub fn validate_json_string_simd(s: &str) -> bool {
 
     #[cfg(target_arch = "x86_64")]
     {
-        if is_x86_feature_detected!("sse2") {
-            return unsafe { validate_json_string_sse2(s.as_bytes()) };
-        }
+        unsafe { validate_json_string_sse2(s.as_bytes()) }
     }
 
-    // Fallback to scalar validation
-    validate_json_string_scalar(s)
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        // Fallback to scalar validation
+        validate_json_string_scalar(s)
+    }
 }
 
 /// SIMD-accelerated whitespace skipping for faster tokenization.
@@ -67,13 +100,14 @@ pub fn skip_whitespace_simd(s: &str) -> usize {
 
     #[cfg(target_arch = "x86_64")]
     {
-        if is_x86_feature_detected!("sse2") {
-            return unsafe { skip_whitespace_sse2(s.as_bytes()) };
-        }
+        unsafe { skip_whitespace_sse2(s.as_bytes()) }
     }
 
-    // Fallback to scalar implementation
-    skip_whitespace_scalar(s)
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        // Fallback to scalar implementation
+        skip_whitespace_scalar(s)
+    }
 }
 
 /// SIMD-accelerated number parsing for improved performance.
@@ -217,6 +251,7 @@ unsafe fn skip_whitespace_sse2(bytes: &[u8]) -> usize {
 }
 
 // Scalar fallback implementations
+#[cfg(not(target_arch = "x86_64"))]
 #[inline(always)]
 fn validate_json_string_scalar(s: &str) -> bool {
     for byte in s.bytes() {
@@ -227,6 +262,7 @@ fn validate_json_string_scalar(s: &str) -> bool {
     true
 }
 
+#[cfg(not(target_arch = "x86_64"))]
 #[inline(always)]
 fn skip_whitespace_scalar(s: &str) -> usize {
     let mut i = 0;
@@ -380,13 +416,14 @@ fn unescape_with_simd_scan(s: &str) -> Result<String> {
 fn find_next_backslash_simd(bytes: &[u8]) -> Option<usize> {
     #[cfg(target_arch = "x86_64")]
     {
-        if is_x86_feature_detected!("sse2") {
-            return unsafe { find_next_backslash_sse2(bytes) };
-        }
+        unsafe { find_next_backslash_sse2(bytes) }
     }
 
-    // Fallback to scalar search
-    bytes.iter().position(|&b| b == b'\\')
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        // Fallback to scalar search
+        bytes.iter().position(|&b| b == b'\\')
+    }
 }
 
 #[cfg(target_arch = "x86_64")]
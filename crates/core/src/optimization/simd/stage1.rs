@@ -0,0 +1,295 @@
+// this_file: crates/core/src/optimization/simd/stage1.rs
+
+//! Portable stage-1 structural classification.
+//!
+//! The lexer hot path is memory-bound: on large documents almost all of the
+//! time goes into loading input bytes and comparing each one against the
+//! handful of characters that matter (`{}[]:,"` and whitespace). Stage 1
+//! classifies whole 32-byte blocks at once so that the lexer can jump over
+//! runs of uninteresting bytes instead of branching on every one of them.
+//!
+//! Classification uses a pair of 16-entry nibble tables: a byte belongs to a
+//! class when `LOW_NIBBLE_TABLE[byte & 0xF] & HIGH_NIBBLE_TABLE[byte >> 4]`
+//! has the class bit set. The same tables drive the scalar fallback, the
+//! `VPSHUFB` and NEON `TBL` kernels and the 64-byte `VPERMB` kernel, so every
+//! implementation produces identical masks.
+
+use std::sync::OnceLock;
+
+/// Size of a stage-1 block in bytes.
+pub const BLOCK_SIZE: usize = 32;
+
+// Class bits. `{`/`[` and `}`/`]` share a bit because they share a low
+// nibble; the remaining characters get one bit each.
+const OPEN_BIT: u8 = 0x01; // '{' '['
+const CLOSE_BIT: u8 = 0x02; // '}' ']'
+const COMMA_BIT: u8 = 0x04; // ','
+const COLON_BIT: u8 = 0x08; // ':'
+const QUOTE_BIT: u8 = 0x10; // '"'
+const SPACE_BIT: u8 = 0x20; // ' '
+const TAB_LF_BIT: u8 = 0x40; // '\t' '\n'
+const CR_BIT: u8 = 0x80; // '\r'
+
+/// Class bits that mark a structural character (`{}[]:,"`).
+pub(crate) const STRUCTURAL_CLASS: u8 = OPEN_BIT | CLOSE_BIT | COMMA_BIT | COLON_BIT | QUOTE_BIT;
+
+/// Class bits that mark JSON whitespace (space, tab, line feed, carriage return).
+pub(crate) const WHITESPACE_CLASS: u8 = SPACE_BIT | TAB_LF_BIT | CR_BIT;
+
+/// Lookup table indexed by the low nibble of a byte.
+pub(crate) const LOW_NIBBLE_TABLE: [u8; 16] = [
+    SPACE_BIT,              // 0x_0: ' '
+    0,                      // 0x_1
+    QUOTE_BIT,              // 0x_2: '"'
+    0,                      // 0x_3
+    0,                      // 0x_4
+    0,                      // 0x_5
+    0,                      // 0x_6
+    0,                      // 0x_7
+    0,                      // 0x_8
+    TAB_LF_BIT,             // 0x_9: '\t'
+    TAB_LF_BIT | COLON_BIT, // 0x_A: '\n' ':'
+    OPEN_BIT,               // 0x_B: '[' '{'
+    COMMA_BIT,              // 0x_C: ','
+    CLOSE_BIT | CR_BIT,     // 0x_D: ']' '}' '\r'
+    0,                      // 0x_E
+    0,                      // 0x_F
+];
+
+/// Lookup table indexed by the high nibble of a byte.
+pub(crate) const HIGH_NIBBLE_TABLE: [u8; 16] = [
+    TAB_LF_BIT | CR_BIT,               // 0x0_: '\t' '\n' '\r'
+    0,                                 // 0x1_
+    SPACE_BIT | QUOTE_BIT | COMMA_BIT, // 0x2_: ' ' '"' ','
+    COLON_BIT,                         // 0x3_: ':'
+    0,                                 // 0x4_
+    OPEN_BIT | CLOSE_BIT,              // 0x5_: '[' ']'
+    0,                                 // 0x6_
+    OPEN_BIT | CLOSE_BIT,              // 0x7_: '{' '}'
+    0,                                 // 0x8_
+    0,                                 // 0x9_
+    0,                                 // 0xA_
+    0,                                 // 0xB_
+    0,                                 // 0xC_
+    0,                                 // 0xD_
+    0,                                 // 0xE_
+    0,                                 // 0xF_
+];
+
+/// Signature shared by all block classifiers.
+pub type ClassifyFn = fn(&[u8; BLOCK_SIZE]) -> (u32, u32);
+
+/// Classify a single byte using the nibble tables.
+#[inline(always)]
+const fn byte_class(byte: u8) -> u8 {
+    LOW_NIBBLE_TABLE[(byte & 0x0F) as usize] & HIGH_NIBBLE_TABLE[(byte >> 4) as usize]
+}
+
+/// Scalar block classifier used when no SIMD kernel is available.
+///
+/// Returns `(structural, whitespace)` bitmasks where bit `i` describes
+/// `input[i]`.
+pub fn classify_block_scalar(input: &[u8; BLOCK_SIZE]) -> (u32, u32) {
+    let mut structural = 0u32;
+    let mut whitespace = 0u32;
+
+    for (i, &byte) in input.iter().enumerate() {
+        let class = byte_class(byte);
+        if class & STRUCTURAL_CLASS != 0 {
+            structural |= 1 << i;
+        }
+        if class & WHITESPACE_CLASS != 0 {
+            whitespace |= 1 << i;
+        }
+    }
+
+    (structural, whitespace)
+}
+
+#[cfg(target_arch = "x86_64")]
+fn classify_block_avx2(input: &[u8; BLOCK_SIZE]) -> (u32, u32) {
+    // SAFETY: only selected by `select_classifier` after AVX2 was detected.
+    unsafe { super::stage1_avx2::classify_block(input) }
+}
+
+#[cfg(target_arch = "aarch64")]
+fn classify_block_neon(input: &[u8; BLOCK_SIZE]) -> (u32, u32) {
+    // SAFETY: only selected by `select_classifier` after NEON was detected.
+    unsafe { super::stage1_neon::classify_block(input) }
+}
+
+fn select_classifier() -> ClassifyFn {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            return classify_block_avx2;
+        }
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    {
+        if std::arch::is_aarch64_feature_detected!("neon") {
+            return classify_block_neon;
+        }
+    }
+
+    classify_block_scalar
+}
+
+static CLASSIFY: OnceLock<ClassifyFn> = OnceLock::new();
+
+pub(super) fn init_dispatch() {
+    CLASSIFY.get_or_init(select_classifier);
+    CLASSIFY64.get_or_init(select_wide_classifier);
+}
+
+/// Classify a 32-byte block into structural and whitespace bitmasks.
+///
+/// The best kernel for the running CPU is detected on first use and cached,
+/// so repeated calls pay for a single indirect call only.
+#[inline]
+pub fn classify_block(input: &[u8; BLOCK_SIZE]) -> (u32, u32) {
+    (CLASSIFY.get_or_init(select_classifier))(input)
+}
+
+/// Size of a wide stage-1 block in bytes.
+pub const WIDE_BLOCK_SIZE: usize = 2 * BLOCK_SIZE;
+
+/// Signature shared by all 64-byte block classifiers.
+pub type Classify64Fn = fn(&[u8; WIDE_BLOCK_SIZE]) -> (u64, u64);
+
+/// Classify a 64-byte block as two halves with [`classify_block`].
+pub fn classify_block64_portable(input: &[u8; WIDE_BLOCK_SIZE]) -> (u64, u64) {
+    let (lo, hi) = input.split_at(BLOCK_SIZE);
+    let (lo_structural, lo_whitespace) = classify_block(lo.try_into().unwrap());
+    let (hi_structural, hi_whitespace) = classify_block(hi.try_into().unwrap());
+    (
+        lo_structural as u64 | (hi_structural as u64) << 32,
+        lo_whitespace as u64 | (hi_whitespace as u64) << 32,
+    )
+}
+
+#[cfg(target_arch = "x86_64")]
+fn classify_block64_avx512(input: &[u8; WIDE_BLOCK_SIZE]) -> (u64, u64) {
+    // SAFETY: only selected by `select_wide_classifier` after AVX-512 VBMI
+    // was detected.
+    unsafe { super::stage1_avx512::classify_block64(input) }
+}
+
+fn select_wide_classifier() -> Classify64Fn {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx512f")
+            && is_x86_feature_detected!("avx512bw")
+            && is_x86_feature_detected!("avx512vbmi")
+        {
+            return classify_block64_avx512;
+        }
+    }
+
+    classify_block64_portable
+}
+
+static CLASSIFY64: OnceLock<Classify64Fn> = OnceLock::new();
+
+/// Classify a 64-byte block into structural and whitespace bitmasks.
+///
+/// Uses a single AVX-512 VBMI pass where available and two
+/// [`classify_block`] calls otherwise.
+#[inline]
+pub fn classify_block64(input: &[u8; WIDE_BLOCK_SIZE]) -> (u64, u64) {
+    (CLASSIFY64.get_or_init(select_wide_classifier))(input)
+}
+
+/// Count the whitespace bytes at the start of `bytes`.
+///
+/// Full blocks are classified at once; the tail shorter than a block is
+/// handled byte by byte.
+#[inline]
+pub fn leading_whitespace(bytes: &[u8]) -> usize {
+    let mut pos = 0;
+
+    while let Some(block) = bytes.get(pos..pos + BLOCK_SIZE) {
+        let (_, whitespace) = classify_block(block.try_into().unwrap());
+        let run = whitespace.trailing_ones() as usize;
+        pos += run;
+        if run < BLOCK_SIZE {
+            return pos;
+        }
+    }
+
+    while pos < bytes.len() && byte_class(bytes[pos]) & WHITESPACE_CLASS != 0 {
+        pos += 1;
+    }
+
+    pos
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn block_from(s: &str) -> [u8; BLOCK_SIZE] {
+        let mut block = [b'a'; BLOCK_SIZE];
+        block[..s.len()].copy_from_slice(s.as_bytes());
+        block
+    }
+
+    #[test]
+    fn test_byte_class_covers_exactly_json_characters() {
+        for byte in 0..=255u8 {
+            let class = byte_class(byte);
+            let is_structural = matches!(byte, b'{' | b'}' | b'[' | b']' | b':' | b',' | b'"');
+            let is_whitespace = matches!(byte, b' ' | b'\t' | b'\n' | b'\r');
+            assert_eq!(
+                class & STRUCTURAL_CLASS != 0,
+                is_structural,
+                "byte {byte:#04x}"
+            );
+            assert_eq!(
+                class & WHITESPACE_CLASS != 0,
+                is_whitespace,
+                "byte {byte:#04x}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_classify_block_masks() {
+        let block = block_from(r#"{"a": [1, 2]}"#);
+        let (structural, whitespace) = classify_block(&block);
+
+        assert_eq!(structural, classify_block_scalar(&block).0);
+        // '{' '"' '"' ':' '[' ',' ']' '}'
+        let expected = [0, 1, 3, 4, 6, 8, 11, 12]
+            .iter()
+            .fold(0u32, |m, i| m | (1 << i));
+        assert_eq!(structural, expected);
+        assert_eq!(whitespace, (1 << 5) | (1 << 9));
+    }
+
+    #[test]
+    fn test_classify_block64_matches_halves() {
+        let mut block = [b'a'; WIDE_BLOCK_SIZE];
+        block[..13].copy_from_slice(br#"{"a": [1, 2]}"#);
+        block[50..63].copy_from_slice(br#"{"a": [1, 2]}"#);
+
+        let (structural, whitespace) = classify_block64(&block);
+        assert_eq!((structural, whitespace), classify_block64_portable(&block));
+        assert_eq!(structural.count_ones(), 16);
+        assert_eq!(whitespace, (1 << 5) | (1 << 9) | (1 << 55) | (1 << 59));
+    }
+
+    #[test]
+    fn test_leading_whitespace() {
+        assert_eq!(leading_whitespace(b""), 0);
+        assert_eq!(leading_whitespace(b"x"), 0);
+        assert_eq!(leading_whitespace(b" \t\r\nx"), 4);
+
+        let long = format!("{}{{}}", " \n".repeat(40));
+        assert_eq!(leading_whitespace(long.as_bytes()), 80);
+
+        let all_space = " ".repeat(70);
+        assert_eq!(leading_whitespace(all_space.as_bytes()), 70);
+    }
+}
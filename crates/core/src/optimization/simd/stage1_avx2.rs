@@ -0,0 +1,134 @@
+// this_file: crates/core/src/optimization/simd/stage1_avx2.rs
+
+//! AVX2 stage-1 kernels.
+//!
+//! Classifies a 32-byte block into structural and whitespace bitmasks with
+//! two `VPSHUFB` nibble lookups, in the style of simdjson's stage 1. The
+//! lookup tables are shared with the scalar fallback in
+//! [`super::stage1`] so both paths always agree. The byte masks used for
+//! string tracking in [`super::string_mask`] and the serializer's escape
+//! search in [`super::escape`] live here as well.
+
+use super::stage1::{HIGH_NIBBLE_TABLE, LOW_NIBBLE_TABLE, STRUCTURAL_CLASS, WHITESPACE_CLASS};
+use super::string_mask::{ByteMasks, MASK_BLOCK_SIZE};
+use std::arch::x86_64::*;
+
+/// Classify a 32-byte block using AVX2.
+///
+/// Returns `(structural, whitespace)` bitmasks where bit `i` describes
+/// `input[i]`.
+///
+/// # Safety
+///
+/// The caller must ensure the CPU supports AVX2.
+#[target_feature(enable = "avx2")]
+pub unsafe fn classify_block(input: &[u8; 32]) -> (u32, u32) {
+    let chunk = _mm256_loadu_si256(input.as_ptr() as *const __m256i);
+
+    // `_mm256_shuffle_epi8` works per 128-bit lane, so the 16-entry tables
+    // are broadcast into both lanes.
+    let low_table =
+        _mm256_broadcastsi128_si256(_mm_loadu_si128(LOW_NIBBLE_TABLE.as_ptr() as *const __m128i));
+    let high_table =
+        _mm256_broadcastsi128_si256(_mm_loadu_si128(HIGH_NIBBLE_TABLE.as_ptr() as *const __m128i));
+    let nibble_mask = _mm256_set1_epi8(0x0F);
+
+    let low_nibbles = _mm256_and_si256(chunk, nibble_mask);
+    let high_nibbles = _mm256_and_si256(_mm256_srli_epi16(chunk, 4), nibble_mask);
+
+    let classes = _mm256_and_si256(
+        _mm256_shuffle_epi8(low_table, low_nibbles),
+        _mm256_shuffle_epi8(high_table, high_nibbles),
+    );
+
+    let zero = _mm256_setzero_si256();
+    let structural = _mm256_and_si256(classes, _mm256_set1_epi8(STRUCTURAL_CLASS as i8));
+    let whitespace = _mm256_and_si256(classes, _mm256_set1_epi8(WHITESPACE_CLASS as i8));
+
+    let structural_mask = !(_mm256_movemask_epi8(_mm256_cmpeq_epi8(structural, zero)) as u32);
+    let whitespace_mask = !(_mm256_movemask_epi8(_mm256_cmpeq_epi8(whitespace, zero)) as u32);
+
+    (structural_mask, whitespace_mask)
+}
+
+#[target_feature(enable = "avx2")]
+#[inline]
+unsafe fn eq_mask(lo: __m256i, hi: __m256i, needle: u8) -> u64 {
+    let needle = _mm256_set1_epi8(needle as i8);
+    let lo_mask = _mm256_movemask_epi8(_mm256_cmpeq_epi8(lo, needle)) as u32;
+    let hi_mask = _mm256_movemask_epi8(_mm256_cmpeq_epi8(hi, needle)) as u32;
+    lo_mask as u64 | (hi_mask as u64) << 32
+}
+
+/// Compute the string-tracking byte masks of a 64-byte block using AVX2.
+///
+/// # Safety
+///
+/// The caller must ensure the CPU supports AVX2.
+#[target_feature(enable = "avx2")]
+pub unsafe fn byte_masks(input: &[u8; MASK_BLOCK_SIZE], quote: u8) -> ByteMasks {
+    let lo = _mm256_loadu_si256(input.as_ptr() as *const __m256i);
+    let hi = _mm256_loadu_si256(input.as_ptr().add(32) as *const __m256i);
+
+    ByteMasks {
+        quote: eq_mask(lo, hi, quote),
+        backslash: eq_mask(lo, hi, b'\\'),
+        forgiving: eq_mask(lo, hi, b'\'') | eq_mask(lo, hi, b'/') | eq_mask(lo, hi, b'#'),
+    }
+}
+
+/// Find the first byte of `bytes` that has to be escaped in a JSON string.
+///
+/// # Safety
+///
+/// The caller must ensure the CPU supports AVX2.
+#[target_feature(enable = "avx2")]
+pub unsafe fn find_json_escape(bytes: &[u8]) -> Option<usize> {
+    let quote = _mm256_set1_epi8(b'"' as i8);
+    let backslash = _mm256_set1_epi8(b'\\' as i8);
+    let control_max = _mm256_set1_epi8(0x1F);
+    let zero = _mm256_setzero_si256();
+
+    let mut pos = 0;
+    while pos + 32 <= bytes.len() {
+        let chunk = _mm256_loadu_si256(bytes.as_ptr().add(pos) as *const __m256i);
+        // Unsigned saturating `chunk - 0x1F` is zero exactly for bytes <= 0x1F.
+        let controls = _mm256_cmpeq_epi8(_mm256_subs_epu8(chunk, control_max), zero);
+        let specials = _mm256_or_si256(
+            _mm256_cmpeq_epi8(chunk, quote),
+            _mm256_cmpeq_epi8(chunk, backslash),
+        );
+        let mask = _mm256_movemask_epi8(_mm256_or_si256(controls, specials)) as u32;
+        if mask != 0 {
+            return Some(pos + mask.trailing_zeros() as usize);
+        }
+        pos += 32;
+    }
+
+    super::escape::find_json_escape_swar(&bytes[pos..]).map(|offset| pos + offset)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::super::stage1::classify_block_scalar;
+    use super::*;
+
+    #[test]
+    fn test_avx2_matches_scalar() {
+        if !is_x86_feature_detected!("avx2") {
+            return;
+        }
+
+        let mut block = [0u8; 32];
+        for seed in 0..=255u8 {
+            for (i, byte) in block.iter_mut().enumerate() {
+                *byte = seed
+                    .wrapping_mul(31)
+                    .wrapping_add((i as u8).wrapping_mul(7));
+            }
+            let expected = classify_block_scalar(&block);
+            let actual = unsafe { classify_block(&block) };
+            assert_eq!(actual, expected, "mismatch for seed {seed}");
+        }
+    }
+}
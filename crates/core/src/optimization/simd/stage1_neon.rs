@@ -0,0 +1,88 @@
+// this_file: crates/core/src/optimization/simd/stage1_neon.rs
+
+//! NEON stage-1 kernel for ARM64 (Apple Silicon, Graviton).
+//!
+//! Mirrors the AVX2 classifier in [`super::stage1_avx2`]: each 16-byte half
+//! of a block goes through two `TBL` nibble lookups against the shared tables
+//! from [`super::stage1`], so all kernels agree bit for bit. NEON has no
+//! movemask instruction; the byte masks are weighted by their bit position
+//! and folded with pairwise adds instead.
+
+use super::stage1::{HIGH_NIBBLE_TABLE, LOW_NIBBLE_TABLE, STRUCTURAL_CLASS, WHITESPACE_CLASS};
+use std::arch::aarch64::*;
+
+/// Collapse two all-ones/all-zeros byte masks into a 32-bit bitmask where
+/// bit `i` is set when byte `i` of `lo ++ hi` is set.
+#[target_feature(enable = "neon")]
+#[inline]
+unsafe fn movemask32(lo: uint8x16_t, hi: uint8x16_t) -> u32 {
+    const WEIGHTS: [u8; 16] = [1, 2, 4, 8, 16, 32, 64, 128, 1, 2, 4, 8, 16, 32, 64, 128];
+    let weights = vld1q_u8(WEIGHTS.as_ptr());
+
+    // Each pairwise add halves the number of bytes per source: after three
+    // rounds the first four bytes hold the masks of bytes 0-7, 8-15, 16-23
+    // and 24-31.
+    let sum = vpaddq_u8(vandq_u8(lo, weights), vandq_u8(hi, weights));
+    let sum = vpaddq_u8(sum, sum);
+    let sum = vpaddq_u8(sum, sum);
+    vgetq_lane_u32::<0>(vreinterpretq_u32_u8(sum))
+}
+
+/// Look up the class bits of every byte in `chunk`.
+#[target_feature(enable = "neon")]
+#[inline]
+unsafe fn classes(chunk: uint8x16_t, low_table: uint8x16_t, high_table: uint8x16_t) -> uint8x16_t {
+    let low_nibbles = vandq_u8(chunk, vdupq_n_u8(0x0F));
+    let high_nibbles = vshrq_n_u8::<4>(chunk);
+    vandq_u8(
+        vqtbl1q_u8(low_table, low_nibbles),
+        vqtbl1q_u8(high_table, high_nibbles),
+    )
+}
+
+/// Classify a 32-byte block using NEON.
+///
+/// Returns `(structural, whitespace)` bitmasks where bit `i` describes
+/// `input[i]`.
+///
+/// # Safety
+///
+/// The caller must ensure the CPU supports NEON, which every AArch64 CPU
+/// does.
+#[target_feature(enable = "neon")]
+pub unsafe fn classify_block(input: &[u8; 32]) -> (u32, u32) {
+    let low_table = vld1q_u8(LOW_NIBBLE_TABLE.as_ptr());
+    let high_table = vld1q_u8(HIGH_NIBBLE_TABLE.as_ptr());
+
+    let lo = classes(vld1q_u8(input.as_ptr()), low_table, high_table);
+    let hi = classes(vld1q_u8(input.as_ptr().add(16)), low_table, high_table);
+
+    let structural = vdupq_n_u8(STRUCTURAL_CLASS);
+    let whitespace = vdupq_n_u8(WHITESPACE_CLASS);
+
+    (
+        movemask32(vtstq_u8(lo, structural), vtstq_u8(hi, structural)),
+        movemask32(vtstq_u8(lo, whitespace), vtstq_u8(hi, whitespace)),
+    )
+}
+
+#[cfg(test)]
+mod tests {
+    use super::super::stage1::classify_block_scalar;
+    use super::*;
+
+    #[test]
+    fn test_neon_matches_scalar() {
+        let mut block = [0u8; 32];
+        for seed in 0..=255u8 {
+            for (i, byte) in block.iter_mut().enumerate() {
+                *byte = seed
+                    .wrapping_mul(31)
+                    .wrapping_add((i as u8).wrapping_mul(7));
+            }
+            let expected = classify_block_scalar(&block);
+            let actual = unsafe { classify_block(&block) };
+            assert_eq!(actual, expected, "mismatch for seed {seed}");
+        }
+    }
+}
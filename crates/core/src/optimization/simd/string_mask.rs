@@ -0,0 +1,501 @@
+// this_file: crates/core/src/optimization/simd/string_mask.rs
+
+//! In-string bitmasks for 64-byte blocks.
+//!
+//! Knowing which bytes of a block sit inside a string literal lets stage 1
+//! discard quoted structural characters without tracking a per-byte state
+//! machine. Following simdjson, the mask is built in three steps:
+//!
+//! 1. find the bytes escaped by an odd-length run of backslashes,
+//! 2. drop escaped quotes from the quote bitmask,
+//! 3. take the prefix-XOR of the remaining quotes, which is a single
+//!    carry-less multiply by an all-ones operand (`PCLMULQDQ`).
+//!
+//! Bit `i` of the result is set when byte `i` is inside a string; the
+//! opening quote is inside, the closing quote is not. Carries for the escape
+//! run and the inside-string state are threaded from block to block.
+//!
+//! Only double-quoted strings are tracked. Single-quoted strings and
+//! comments can each hide the other's delimiters, so combining several
+//! quote masks does not give a correct answer. Blocks where any of `'`,
+//! `/` or `#` appear outside a double-quoted string are reported through
+//! [`Stage1Block::needs_scalar`] and must be classified byte by byte; see
+//! [`Stage1Scanner::resume`] for handing control back afterwards.
+
+use super::stage1::classify_block64;
+use memchr::memchr2;
+#[cfg(target_arch = "x86_64")]
+use std::arch::x86_64::*;
+use std::sync::OnceLock;
+
+/// Size of a block handled by the in-string scanner.
+pub const MASK_BLOCK_SIZE: usize = 64;
+
+const EVEN_BITS: u64 = 0x5555_5555_5555_5555;
+
+/// Per-byte bitmasks of the characters that drive string tracking.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct ByteMasks {
+    /// Positions of the quote character being tracked.
+    pub quote: u64,
+    /// Positions of `\`.
+    pub backslash: u64,
+    /// Positions of `'`, `/` and `#`, which start forgiving constructs.
+    pub forgiving: u64,
+}
+
+/// Scalar version of the byte mask computation.
+pub fn byte_masks_scalar(input: &[u8; MASK_BLOCK_SIZE], quote: u8) -> ByteMasks {
+    let mut masks = ByteMasks::default();
+
+    for (i, &byte) in input.iter().enumerate() {
+        let bit = 1u64 << i;
+        if byte == quote {
+            masks.quote |= bit;
+        }
+        if byte == b'\\' {
+            masks.backslash |= bit;
+        }
+        if matches!(byte, b'\'' | b'/' | b'#') {
+            masks.forgiving |= bit;
+        }
+    }
+
+    masks
+}
+
+/// Prefix-XOR of `mask` using shifts, for CPUs without `PCLMULQDQ`.
+///
+/// Bit `i` of the result is the XOR of bits `0..=i` of `mask`.
+#[inline]
+pub fn prefix_xor_scalar(mut mask: u64) -> u64 {
+    mask ^= mask << 1;
+    mask ^= mask << 2;
+    mask ^= mask << 4;
+    mask ^= mask << 8;
+    mask ^= mask << 16;
+    mask ^= mask << 32;
+    mask
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "pclmulqdq")]
+unsafe fn prefix_xor_clmul_kernel(mask: u64) -> u64 {
+    // Multiplying by all ones without carries XORs every lower bit into
+    // each position, which is exactly the prefix-XOR.
+    let product = _mm_clmulepi64_si128(_mm_set_epi64x(0, mask as i64), _mm_set1_epi8(-1), 0);
+    _mm_cvtsi128_si64(product) as u64
+}
+
+#[cfg(target_arch = "x86_64")]
+fn prefix_xor_clmul(mask: u64) -> u64 {
+    // SAFETY: only selected by `select_kernels` after PCLMULQDQ was detected.
+    unsafe { prefix_xor_clmul_kernel(mask) }
+}
+
+#[cfg(target_arch = "x86_64")]
+fn byte_masks_avx2(input: &[u8; MASK_BLOCK_SIZE], quote: u8) -> ByteMasks {
+    // SAFETY: only selected by `select_kernels` after AVX2 was detected.
+    unsafe { super::stage1_avx2::byte_masks(input, quote) }
+}
+
+#[derive(Clone, Copy)]
+struct Kernels {
+    prefix_xor: fn(u64) -> u64,
+    byte_masks: fn(&[u8; MASK_BLOCK_SIZE], u8) -> ByteMasks,
+    /// Whether `byte_masks` is a vector kernel rather than the scalar loop.
+    vector_masks: bool,
+}
+
+fn select_kernels() -> Kernels {
+    #[allow(unused_mut)]
+    let mut kernels = Kernels {
+        prefix_xor: prefix_xor_scalar,
+        byte_masks: byte_masks_scalar,
+        vector_masks: false,
+    };
+
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("pclmulqdq") {
+            kernels.prefix_xor = prefix_xor_clmul;
+        }
+        if is_x86_feature_detected!("avx2") {
+            kernels.byte_masks = byte_masks_avx2;
+            kernels.vector_masks = true;
+        }
+    }
+
+    kernels
+}
+
+static KERNELS: OnceLock<Kernels> = OnceLock::new();
+
+pub(super) fn init_dispatch() {
+    KERNELS.get_or_init(select_kernels);
+}
+
+#[inline]
+fn kernels() -> Kernels {
+    *KERNELS.get_or_init(select_kernels)
+}
+
+/// Prefix-XOR of `mask`, using `PCLMULQDQ` when the CPU supports it.
+#[inline]
+pub fn prefix_xor(mask: u64) -> u64 {
+    (kernels().prefix_xor)(mask)
+}
+
+/// Compute the [`ByteMasks`] of a block, using AVX2 when available.
+#[inline]
+pub fn byte_masks(input: &[u8; MASK_BLOCK_SIZE], quote: u8) -> ByteMasks {
+    (kernels().byte_masks)(input, quote)
+}
+
+/// Return the bytes escaped by a preceding backslash.
+///
+/// `prev_escaped` carries a pending escape from the previous block in its
+/// lowest bit and is updated for the next block.
+#[inline]
+fn find_escaped(backslash: u64, prev_escaped: &mut u64) -> u64 {
+    // A backslash that is itself escaped cannot start an escape.
+    let backslash = backslash & !*prev_escaped;
+    let follows_escape = (backslash << 1) | *prev_escaped;
+
+    // Backslash runs that start on an odd bit are shifted onto even bits
+    // by the addition below, after which every other bit is an escape.
+    let odd_sequence_starts = backslash & !EVEN_BITS & !follows_escape;
+    let (sequences_starting_on_even_bits, overflow) =
+        odd_sequence_starts.overflowing_add(backslash);
+    *prev_escaped = overflow as u64;
+
+    let invert_mask = sequences_starting_on_even_bits << 1;
+    (EVEN_BITS ^ invert_mask) & follows_escape
+}
+
+/// String tracking result for one block.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct StringBlock {
+    /// Unescaped quote positions.
+    pub quote: u64,
+    /// Bytes inside a string, including the opening quote.
+    pub in_string: u64,
+}
+
+impl StringBlock {
+    /// Bytes inside a string excluding the opening quote but including the
+    /// closing one, i.e. the bytes a tokenizer must never treat as structural.
+    #[inline]
+    pub fn string_tail(&self) -> u64 {
+        self.in_string ^ self.quote
+    }
+}
+
+/// Tracks the inside-string state across consecutive 64-byte blocks.
+#[derive(Clone, Copy)]
+pub struct StringScanner {
+    prev_escaped: u64,
+    prev_in_string: u64,
+    prefix_xor: fn(u64) -> u64,
+}
+
+impl Default for StringScanner {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl StringScanner {
+    /// Create a scanner positioned outside of any string.
+    pub fn new() -> Self {
+        StringScanner {
+            prev_escaped: 0,
+            prev_in_string: 0,
+            prefix_xor: kernels().prefix_xor,
+        }
+    }
+
+    /// Create a scanner positioned just after an opening quote.
+    pub fn inside_string() -> Self {
+        StringScanner {
+            prev_in_string: !0,
+            ..Self::new()
+        }
+    }
+
+    /// Whether the last scanned block ended inside a string.
+    #[inline]
+    pub fn in_string(&self) -> bool {
+        self.prev_in_string != 0
+    }
+
+    /// Whether the last scanned block ended with a dangling backslash.
+    #[inline]
+    pub fn pending_escape(&self) -> bool {
+        self.prev_escaped != 0
+    }
+
+    /// Advance over one block given its quote and backslash bitmasks.
+    #[inline]
+    pub fn next(&mut self, quote: u64, backslash: u64) -> StringBlock {
+        let escaped = find_escaped(backslash, &mut self.prev_escaped);
+        let quote = quote & !escaped;
+        let in_string = (self.prefix_xor)(quote) ^ self.prev_in_string;
+        // Broadcast the top bit so the next block starts in the same state.
+        self.prev_in_string = ((in_string as i64) >> 63) as u64;
+
+        StringBlock { quote, in_string }
+    }
+}
+
+/// Stage-1 classification of a 64-byte block with strings masked out.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct Stage1Block {
+    /// Structural characters outside strings, plus opening quotes.
+    pub structural: u64,
+    /// Whitespace outside strings.
+    pub whitespace: u64,
+    /// Bytes inside double-quoted strings.
+    pub in_string: u64,
+    /// Unescaped double quotes, both opening and closing.
+    pub quote: u64,
+    /// Set when the block contains `'`, `/` or `#` outside a string. The
+    /// masks of this block are then unreliable and the caller has to
+    /// classify it another way, starting from the scanner state before it.
+    pub needs_scalar: bool,
+}
+
+/// Classifies consecutive 64-byte blocks of a document.
+#[derive(Clone, Copy, Default)]
+pub struct Stage1Scanner {
+    strings: StringScanner,
+}
+
+impl Stage1Scanner {
+    /// Create a scanner for the start of a document.
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Create a scanner that continues after bytes classified elsewhere,
+    /// either inside a double-quoted string or between tokens.
+    pub fn resume(in_string: bool, pending_escape: bool) -> Self {
+        let strings = if in_string {
+            StringScanner::inside_string()
+        } else {
+            StringScanner::new()
+        };
+        Stage1Scanner {
+            strings: StringScanner {
+                prev_escaped: pending_escape as u64,
+                ..strings
+            },
+        }
+    }
+
+    /// Whether the last scanned block ended inside a string.
+    #[inline]
+    pub fn in_string(&self) -> bool {
+        self.strings.in_string()
+    }
+
+    /// Whether the last scanned block ended with a dangling backslash.
+    #[inline]
+    pub fn pending_escape(&self) -> bool {
+        self.strings.pending_escape()
+    }
+
+    /// Classify the next block of the document.
+    pub fn next_block(&mut self, input: &[u8; MASK_BLOCK_SIZE]) -> Stage1Block {
+        let (structural, whitespace) = classify_block64(input);
+
+        let masks = byte_masks(input, b'"');
+        let strings = self.strings.next(masks.quote, masks.backslash);
+
+        Stage1Block {
+            structural: structural & !strings.string_tail(),
+            whitespace: whitespace & !strings.in_string,
+            in_string: strings.in_string,
+            quote: strings.quote,
+            needs_scalar: masks.forgiving & !strings.in_string != 0,
+        }
+    }
+}
+
+/// Find the closing quote of a string literal.
+///
+/// `bytes` starts right after the opening `quote`. Returns the offset of the
+/// first unescaped `quote`, or `None` when the string is unterminated.
+#[inline]
+pub fn find_string_end(bytes: &[u8], quote: u8) -> Option<usize> {
+    let kernels = kernels();
+    let mut prev_escaped = 0;
+    let mut pos = 0;
+
+    // Without a vector kernel the per-block masks cost a loop over every
+    // byte, so go straight to `memchr2`.
+    if kernels.vector_masks {
+        while let Some(block) = bytes.get(pos..pos + MASK_BLOCK_SIZE) {
+            let masks = (kernels.byte_masks)(block.try_into().unwrap(), quote);
+            let quotes = masks.quote & !find_escaped(masks.backslash, &mut prev_escaped);
+            if quotes != 0 {
+                return Some(pos + quotes.trailing_zeros() as usize);
+            }
+            pos += MASK_BLOCK_SIZE;
+        }
+    }
+
+    find_string_end_memchr(&bytes[pos..], quote, prev_escaped != 0).map(|offset| pos + offset)
+}
+
+/// Find the closing quote by jumping between quotes and backslashes.
+///
+/// `escaped` tells whether the first byte is escaped by a backslash that
+/// precedes `bytes`.
+#[inline]
+fn find_string_end_memchr(bytes: &[u8], quote: u8, escaped: bool) -> Option<usize> {
+    let mut pos = escaped as usize;
+
+    loop {
+        pos += memchr2(quote, b'\\', bytes.get(pos..)?)?;
+        if bytes[pos] == quote {
+            return Some(pos);
+        }
+        // Skip the backslash and the byte it escapes.
+        pos += 2;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Reference in-string mask computed one byte at a time.
+    fn in_string_reference(input: &[u8]) -> Vec<bool> {
+        let mut inside = false;
+        let mut escaped = false;
+        input
+            .iter()
+            .map(|&byte| {
+                if inside && escaped {
+                    escaped = false;
+                    return true;
+                }
+                if inside && byte == b'\\' {
+                    escaped = true;
+                    return true;
+                }
+                if byte == b'"' {
+                    inside = !inside;
+                    // The opening quote counts as inside, the closing one not.
+                    return inside;
+                }
+                inside
+            })
+            .collect()
+    }
+
+    fn scan_in_string(input: &[u8]) -> Vec<bool> {
+        let mut scanner = StringScanner::new();
+        let mut result = Vec::new();
+        for chunk in input.chunks(MASK_BLOCK_SIZE) {
+            let mut block = [b' '; MASK_BLOCK_SIZE];
+            block[..chunk.len()].copy_from_slice(chunk);
+            let masks = byte_masks(&block, b'"');
+            let strings = scanner.next(masks.quote, masks.backslash);
+            result.extend((0..chunk.len()).map(|i| strings.in_string & (1 << i) != 0));
+        }
+        result
+    }
+
+    #[test]
+    fn test_prefix_xor() {
+        assert_eq!(prefix_xor_scalar(0), 0);
+        assert_eq!(prefix_xor_scalar(1), !0);
+        assert_eq!(prefix_xor_scalar(0b1001), 0b0111);
+        for mask in [
+            0u64,
+            1,
+            0b1001,
+            0x8000_0000_0000_0001,
+            0xDEAD_BEEF_0BAD_F00D,
+        ] {
+            assert_eq!(prefix_xor(mask), prefix_xor_scalar(mask));
+        }
+    }
+
+    #[test]
+    fn test_byte_masks_match_scalar() {
+        let mut block = [0u8; MASK_BLOCK_SIZE];
+        for seed in 0..=255u8 {
+            for (i, byte) in block.iter_mut().enumerate() {
+                *byte = seed
+                    .wrapping_mul(13)
+                    .wrapping_add((i as u8).wrapping_mul(29));
+            }
+            for quote in [b'"', b'\''] {
+                assert_eq!(byte_masks(&block, quote), byte_masks_scalar(&block, quote));
+            }
+        }
+    }
+
+    #[test]
+    fn test_in_string_mask_matches_reference() {
+        let inputs: [&[u8]; 5] = [
+            br#"{"a": "b", "c": [1, "d\"e"]}"#,
+            br#"["\\", "\\\"", "x\\\\\"y", ""]"#,
+            br#"{"key with { and [ inside": "value } ] , :"}"#,
+            &[b'"'; 130],
+            br#"["a string long enough to cross the block boundary \" and keep going", {"k": "v"}]"#,
+        ];
+
+        for input in inputs {
+            assert_eq!(scan_in_string(input), in_string_reference(input));
+        }
+
+        // A backslash at the very end of a block escapes the next block's
+        // first byte.
+        let mut split = vec![b'"'];
+        split.extend(std::iter::repeat(b'x').take(MASK_BLOCK_SIZE - 2));
+        split.extend_from_slice(br#"\"still inside" , "#);
+        assert_eq!(scan_in_string(&split), in_string_reference(&split));
+    }
+
+    #[test]
+    fn test_stage1_block_masks_strings_and_flags_forgiving() {
+        let mut block = [b' '; MASK_BLOCK_SIZE];
+        let text = br##"{"a,b": [1, "#/'"]}"##;
+        block[..text.len()].copy_from_slice(text);
+
+        let result = Stage1Scanner::new().next_block(&block);
+        let expected = [0, 1, 6, 8, 10, 12, 17, 18]
+            .iter()
+            .fold(0u64, |m, i| m | (1 << i));
+        assert_eq!(result.structural, expected);
+        assert!(!result.needs_scalar);
+
+        let text = br#"{"a": 1 // comment"#;
+        block[..text.len()].copy_from_slice(text);
+        assert!(Stage1Scanner::new().next_block(&block).needs_scalar);
+    }
+
+    #[test]
+    fn test_find_string_end() {
+        assert_eq!(find_string_end(b"abc\"", b'"'), Some(3));
+        assert_eq!(find_string_end(br#"a\"b""#, b'"'), Some(4));
+        assert_eq!(find_string_end(br#"a\\"b"#, b'"'), Some(3));
+        assert_eq!(find_string_end(b"it\\'s'", b'\''), Some(5));
+        assert_eq!(find_string_end(b"unterminated", b'"'), None);
+        assert_eq!(find_string_end(b"dangling\\", b'"'), None);
+
+        let mut long = "x".repeat(MASK_BLOCK_SIZE - 1);
+        long.push_str("\\\"");
+        long.push_str(&"y".repeat(MASK_BLOCK_SIZE));
+        long.push('"');
+        assert_eq!(find_string_end(long.as_bytes(), b'"'), Some(long.len() - 1));
+
+        assert_eq!(find_string_end_memchr(br#"a\\\"b"c"#, b'"', false), Some(6));
+        assert_eq!(find_string_end_memchr(br#""x""#, b'"', true), Some(2));
+        assert_eq!(find_string_end_memchr(b"x\\", b'"', false), None);
+    }
+}
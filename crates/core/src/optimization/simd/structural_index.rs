@@ -0,0 +1,361 @@
+// this_file: crates/core/src/optimization/simd/structural_index.rs
+
+//! Structural index over a whole document.
+//!
+//! Stage 1 runs once over the input and records the offset of every token
+//! start: structural characters, both quotes of every string, and the first
+//! byte of each scalar atom (numbers, literals, unquoted keys). The lexer then
+//! reaches the next token or the end of a string with a single array load
+//! instead of scanning the bytes in between.
+//!
+//! Blocks without forgiving constructs are classified with vector kernels
+//! (see [`Stage1Scanner`]). When a block contains `'`, `/` or `#` outside a
+//! double-quoted string, that block and any that follow until the document is
+//! back between tokens are classified byte by byte with the same rules as the
+//! lexer: comments are skipped (block comments nest), single-quoted strings
+//! are indexed by their quotes, and comment starts count as token starts.
+
+use super::string_mask::{Stage1Block, Stage1Scanner, MASK_BLOCK_SIZE};
+
+/// Sorted byte offsets of all token starts in a document.
+#[derive(Debug, Clone, Default)]
+pub struct StructuralIndex {
+    positions: Vec<u32>,
+}
+
+/// Where the byte-by-byte classifier is in the document.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum Context {
+    /// Between tokens or inside an atom
+    Tokens,
+    /// Inside a string opened by `quote`
+    String { quote: u8, escaped: bool },
+    /// Inside a `//` or `#` comment
+    LineComment,
+    /// Inside a `/* */` comment, nested `depth` levels deep
+    BlockComment { depth: u32 },
+}
+
+/// Byte-by-byte classifier for blocks that hold forgiving constructs.
+struct ScalarClassifier {
+    context: Context,
+    /// Next byte to classify; may run one byte past a block when a two-byte
+    /// comment delimiter straddles the boundary.
+    pos: usize,
+    /// Whether the previous byte ends a token, so the next byte may start one.
+    prev_boundary: bool,
+}
+
+impl ScalarClassifier {
+    /// Take over at `pos` from the vector scanner state before that block.
+    fn resume(scanner: &Stage1Scanner, prev_boundary: u64, pos: usize) -> Self {
+        let context = if scanner.in_string() {
+            Context::String {
+                quote: b'"',
+                escaped: scanner.pending_escape(),
+            }
+        } else {
+            Context::Tokens
+        };
+        ScalarClassifier {
+            context,
+            pos,
+            prev_boundary: prev_boundary != 0,
+        }
+    }
+
+    /// Classify `input[self.pos..end]`, appending token starts to `positions`.
+    fn classify(&mut self, input: &[u8], end: usize, positions: &mut Vec<u32>) {
+        while self.pos < end {
+            let pos = self.pos;
+            let byte = input[pos];
+            let next = input.get(pos + 1).copied();
+            self.pos += 1;
+
+            match self.context {
+                Context::Tokens => match byte {
+                    b' ' | b'\t' | b'\n' | b'\r' => self.prev_boundary = true,
+                    b'{' | b'}' | b'[' | b']' | b',' | b':' => {
+                        positions.push(pos as u32);
+                        self.prev_boundary = true;
+                    }
+                    b'"' | b'\'' => {
+                        positions.push(pos as u32);
+                        self.context = Context::String {
+                            quote: byte,
+                            escaped: false,
+                        };
+                    }
+                    b'#' => {
+                        positions.push(pos as u32);
+                        self.context = Context::LineComment;
+                    }
+                    b'/' if next == Some(b'/') || next == Some(b'*') => {
+                        positions.push(pos as u32);
+                        self.pos += 1;
+                        self.context = if next == Some(b'/') {
+                            Context::LineComment
+                        } else {
+                            Context::BlockComment { depth: 1 }
+                        };
+                    }
+                    _ => {
+                        if self.prev_boundary {
+                            positions.push(pos as u32);
+                        }
+                        self.prev_boundary = false;
+                    }
+                },
+                Context::String { quote, escaped } => {
+                    if escaped {
+                        self.context = Context::String {
+                            quote,
+                            escaped: false,
+                        };
+                    } else if byte == b'\\' {
+                        self.context = Context::String {
+                            quote,
+                            escaped: true,
+                        };
+                    } else if byte == quote {
+                        positions.push(pos as u32);
+                        self.context = Context::Tokens;
+                        self.prev_boundary = true;
+                    }
+                }
+                Context::LineComment => {
+                    if byte == b'\n' || byte == b'\r' {
+                        // The line break itself is whitespace
+                        self.context = Context::Tokens;
+                        self.pos = pos;
+                    }
+                }
+                Context::BlockComment { depth } => match (byte, next) {
+                    (b'/', Some(b'*')) => {
+                        self.pos += 1;
+                        self.context = Context::BlockComment { depth: depth + 1 };
+                    }
+                    (b'*', Some(b'/')) => {
+                        self.pos += 1;
+                        self.context = if depth == 1 {
+                            self.prev_boundary = true;
+                            Context::Tokens
+                        } else {
+                            Context::BlockComment { depth: depth - 1 }
+                        };
+                    }
+                    _ => {}
+                },
+            }
+        }
+    }
+
+    /// The vector scanner state to continue with at `pos`, if it can.
+    fn handoff(&self, pos: usize) -> Option<(Stage1Scanner, u64)> {
+        if self.pos != pos {
+            return None;
+        }
+        let scanner = match self.context {
+            Context::Tokens => Stage1Scanner::resume(false, false),
+            Context::String {
+                quote: b'"',
+                escaped,
+            } => Stage1Scanner::resume(true, escaped),
+            _ => return None,
+        };
+        Some((scanner, self.prev_boundary as u64))
+    }
+}
+
+impl StructuralIndex {
+    /// Build the index for `input`.
+    ///
+    /// Returns `None` when the input is too large for 32-bit offsets.
+    pub fn build(input: &[u8]) -> Option<Self> {
+        if input.len() > u32::MAX as usize {
+            return None;
+        }
+
+        let mut index = StructuralIndex {
+            positions: Vec::with_capacity(input.len() / 8),
+        };
+        let mut scanner = Stage1Scanner::new();
+        // The start of the input counts as a token boundary.
+        let mut prev_boundary = 1u64;
+        let mut scalar: Option<ScalarClassifier> = None;
+
+        let mut offset = 0;
+        while offset < input.len() {
+            let end = (offset + MASK_BLOCK_SIZE).min(input.len());
+
+            if scalar.is_none() {
+                let before = scanner;
+                let block = match input.get(offset..offset + MASK_BLOCK_SIZE) {
+                    Some(chunk) => scanner.next_block(chunk.try_into().unwrap()),
+                    None => {
+                        // Pad with whitespace, which is never indexed.
+                        let mut padded = [b' '; MASK_BLOCK_SIZE];
+                        padded[..end - offset].copy_from_slice(&input[offset..end]);
+                        scanner.next_block(&padded)
+                    }
+                };
+                if !block.needs_scalar {
+                    index.push_block(&block, offset as u32, &mut prev_boundary);
+                    offset = end;
+                    continue;
+                }
+                scalar = Some(ScalarClassifier::resume(&before, prev_boundary, offset));
+            }
+
+            if let Some(classifier) = &mut scalar {
+                classifier.classify(input, end, &mut index.positions);
+                if let Some((resumed, boundary)) = classifier.handoff(end) {
+                    scanner = resumed;
+                    prev_boundary = boundary;
+                    scalar = None;
+                }
+            }
+            offset = end;
+        }
+
+        Some(index)
+    }
+
+    /// Append the token starts of one block.
+    #[inline]
+    fn push_block(&mut self, block: &Stage1Block, offset: u32, prev_boundary: &mut u64) {
+        // An atom starts at every byte outside strings that is neither
+        // structural nor whitespace but follows a byte that is.
+        let boundary = block.structural | block.whitespace | block.quote;
+        let atoms = !(boundary | block.in_string) & ((boundary << 1) | *prev_boundary);
+        *prev_boundary = boundary >> 63;
+
+        let mut bits = block.structural | block.quote | atoms;
+        self.positions.reserve(bits.count_ones() as usize);
+        while bits != 0 {
+            self.positions.push(offset + bits.trailing_zeros());
+            bits &= bits - 1;
+        }
+    }
+
+    /// All indexed offsets in increasing order.
+    #[inline]
+    pub fn positions(&self) -> &[u32] {
+        &self.positions
+    }
+
+    /// Return the first indexed offset greater than `pos`.
+    ///
+    /// `cursor` is a position in the index that only ever moves forward, so a
+    /// pass over the document costs amortized O(1) per lookup.
+    #[inline]
+    pub fn next_after(&self, cursor: &mut usize, pos: usize) -> Option<usize> {
+        while let Some(&next) = self.positions.get(*cursor) {
+            if next as usize > pos {
+                return Some(next as usize);
+            }
+            *cursor += 1;
+        }
+        None
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn indexed(input: &str) -> Option<Vec<u32>> {
+        StructuralIndex::build(input.as_bytes()).map(|index| index.positions().to_vec())
+    }
+
+    #[test]
+    fn test_index_marks_token_starts() {
+        // {"a b": [1, true], key: -2.5}
+        // 0         1         2
+        // 0123456789012345678901234567890
+        let input = r#"{"a b": [1, true], key: -2.5}"#;
+        assert_eq!(
+            indexed(input).unwrap(),
+            vec![0, 1, 5, 6, 8, 9, 10, 12, 16, 17, 19, 22, 24, 28]
+        );
+    }
+
+    #[test]
+    fn test_index_spans_blocks() {
+        let input = format!(r#"{{"{}": "x\"y", "n": 12345}}"#, "k".repeat(70));
+        let positions = indexed(&input).unwrap();
+        let bytes = input.as_bytes();
+        let tokens: Vec<u8> = positions.iter().map(|&p| bytes[p as usize]).collect();
+        assert_eq!(tokens, b"{\"\":\"\",\"\":1}");
+    }
+
+    #[test]
+    fn test_index_skips_comments_and_single_quotes() {
+        let input = "{'a \"b': 1, // x: [\n  /* y /* z */ , */ c: \"d\" # e\n}";
+        let tokens: String = indexed(input)
+            .unwrap()
+            .iter()
+            .map(|&p| input.as_bytes()[p as usize] as char)
+            .collect();
+        assert_eq!(tokens, "{'':1,//c:\"\"#}");
+    }
+
+    #[test]
+    fn test_index_resumes_vector_scan_after_comments() {
+        // The comment hides a quote, straddles a block boundary and is
+        // followed by blocks the vector scanner handles again.
+        let comment = format!("/* \"{} */", "c".repeat(70));
+        let input = format!("{comment}[{}\"s\"]", "1, ".repeat(40));
+        let positions = indexed(&input).unwrap();
+        assert_eq!(positions[0], 0);
+        assert_eq!(positions[1] as usize, comment.len());
+        let tokens: Vec<u8> = positions
+            .iter()
+            .map(|&p| input.as_bytes()[p as usize])
+            .collect();
+        assert_eq!(tokens.len(), 2 + 40 * 2 + 2 + 1);
+        assert_eq!(&tokens[tokens.len() - 3..], b"\"\"]");
+    }
+
+    #[test]
+    fn test_vector_scan_matches_scalar_classifier() {
+        let pieces = [
+            r#"{"k": [1, -2.5e3, true], "s": "a \" b \\", x: null}, "#,
+            "/* c /* n */ \" */ ",
+            "'q \\' \"', ",
+            "# h \"\r\n",
+            "// l '\n",
+            "\t\t",
+        ];
+        for seed in 1..=64u64 {
+            // Mostly plain JSON, so vector and scalar blocks alternate
+            let mut state = seed;
+            let input: String = (0..64)
+                .map(|_| {
+                    state ^= state << 13;
+                    state ^= state >> 7;
+                    state ^= state << 17;
+                    let pick = (state % 12) as usize;
+                    pieces[pick.saturating_sub(6)]
+                })
+                .collect();
+            let mut reference = Vec::new();
+            let mut classifier = ScalarClassifier {
+                context: Context::Tokens,
+                pos: 0,
+                prev_boundary: true,
+            };
+            classifier.classify(input.as_bytes(), input.len(), &mut reference);
+            assert_eq!(indexed(&input).unwrap(), reference, "seed {seed}");
+        }
+    }
+
+    #[test]
+    fn test_next_after() {
+        let index = StructuralIndex::build(b"[1,  2]").unwrap();
+        let mut cursor = 0;
+        assert_eq!(index.next_after(&mut cursor, 0), Some(1));
+        assert_eq!(index.next_after(&mut cursor, 2), Some(5));
+        assert_eq!(index.next_after(&mut cursor, 6), None);
+    }
+}
@@ -0,0 +1,130 @@
+// this_file: crates/core/src/optimization/simd/swar.rs
+
+//! SIMD-within-a-register helpers for targets without vector kernels.
+//!
+//! Eight input bytes are loaded into a `u64` and tested at once with the
+//! classic "has zero byte" bit trick. The tricks may flag extra bytes above
+//! a real match (borrows propagate upwards), but the lowest flagged byte is
+//! always exact, which is all a forward search needs.
+
+/// Bytes per SWAR word.
+pub const WORD_SIZE: usize = 8;
+
+const LOW_BITS: u64 = 0x0101_0101_0101_0101;
+const HIGH_BITS: u64 = 0x8080_8080_8080_8080;
+
+/// Repeat `byte` in every lane of a word.
+#[inline(always)]
+pub const fn broadcast(byte: u8) -> u64 {
+    LOW_BITS * byte as u64
+}
+
+/// Set the high bit of every lane of `word` that is zero.
+#[inline(always)]
+pub const fn zero_bytes(word: u64) -> u64 {
+    word.wrapping_sub(LOW_BITS) & !word & HIGH_BITS
+}
+
+/// Set the high bit of every lane of `word` that equals `byte`.
+#[inline(always)]
+pub const fn eq_bytes(word: u64, byte: u8) -> u64 {
+    zero_bytes(word ^ broadcast(byte))
+}
+
+/// Set the high bit of every lane of `word` that is below `n` (`n <= 128`).
+#[inline(always)]
+pub const fn lt_bytes(word: u64, n: u8) -> u64 {
+    word.wrapping_sub(broadcast(n)) & !word & HIGH_BITS
+}
+
+/// Load the little-endian word starting at `bytes[pos]`.
+#[inline(always)]
+pub fn load(bytes: &[u8], pos: usize) -> u64 {
+    u64::from_le_bytes(bytes[pos..pos + WORD_SIZE].try_into().unwrap())
+}
+
+/// Index of the first flagged lane in a non-zero mask.
+#[inline(always)]
+pub const fn first_lane(mask: u64) -> usize {
+    (mask.trailing_zeros() / 8) as usize
+}
+
+/// Whether every lane of `word` is an ASCII digit.
+#[inline(always)]
+pub const fn all_digits(word: u64) -> bool {
+    // Digits are 0x30..=0x39: the high nibble must be 3 and adding 6 must
+    // not carry the low nibble into it.
+    (word & 0xF0F0_F0F0_F0F0_F0F0)
+        | (word.wrapping_add(0x0606_0606_0606_0606) & 0xF0F0_F0F0_F0F0_F0F0) >> 4
+        == 0x3333_3333_3333_3333
+}
+
+/// Value of the eight ASCII digits in `word`, first digit in the lowest lane.
+///
+/// Pairs of digits, then pairs of pairs, are combined with a multiply each,
+/// so the whole word folds in three steps instead of eight. The result is
+/// meaningless unless [`all_digits`] holds.
+#[inline(always)]
+pub const fn parse_eight_digits(word: u64) -> u32 {
+    const MASK: u64 = 0x0000_00FF_0000_00FF;
+    // 100 + (1_000_000 << 32) and 1 + (10_000 << 32)
+    const MUL1: u64 = 0x000F_4240_0000_0064;
+    const MUL2: u64 = 0x0000_2710_0000_0001;
+
+    let word = word.wrapping_sub(broadcast(b'0'));
+    // Every other lane now holds two digits
+    let word = word.wrapping_mul(10).wrapping_add(word >> 8);
+    ((word & MASK)
+        .wrapping_mul(MUL1)
+        .wrapping_add(((word >> 16) & MASK).wrapping_mul(MUL2))
+        >> 32) as u32
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_eight_digits() {
+        for n in (0..100_000_000u32)
+            .step_by(99_991)
+            .chain([99_999_999, 12_345_678])
+        {
+            let word = u64::from_le_bytes(format!("{n:08}").as_bytes().try_into().unwrap());
+            assert!(all_digits(word), "{n}");
+            assert_eq!(parse_eight_digits(word), n);
+        }
+
+        // Any single non-digit lane is rejected
+        for lane in 0..WORD_SIZE {
+            for byte in (0..=255u8).filter(|b| !b.is_ascii_digit()) {
+                let mut digits = *b"12345678";
+                digits[lane] = byte;
+                assert!(!all_digits(u64::from_le_bytes(digits)), "{digits:?}");
+            }
+        }
+    }
+
+    #[test]
+    fn test_first_match_is_exact() {
+        // Every lane layout around a match: the lowest flag must be exact.
+        for len in 0..WORD_SIZE {
+            for byte in 0..=255u8 {
+                let mut word = [b'a'; WORD_SIZE];
+                word[len] = byte;
+                if len > 0 {
+                    word[len - 1] = byte.wrapping_add(1);
+                }
+                let w = u64::from_le_bytes(word);
+
+                let expected = word.iter().position(|&b| b == b'"');
+                let mask = eq_bytes(w, b'"');
+                assert_eq!((mask != 0).then(|| first_lane(mask)), expected);
+
+                let expected = word.iter().position(|&b| b < 0x20);
+                let mask = lt_bytes(w, 0x20);
+                assert_eq!((mask != 0).then(|| first_lane(mask)), expected);
+            }
+        }
+    }
+}
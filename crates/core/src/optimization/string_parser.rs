@@ -6,85 +6,109 @@
 //! unnecessary allocations and use more efficient algorithms.
 
 use crate::error::{Error, Result};
+use memchr::memchr;
 
 /// Fast string unescaping that avoids allocations when no escapes are present.
+///
+/// The input is scanned once: each run of bytes up to the next backslash is
+/// found with `memchr` and copied immediately while it is still in cache, and
+/// only the escape sequences themselves are decoded byte by byte. The input
+/// is already valid UTF-8 and escapes start with an ASCII backslash, so runs
+/// are copied without being re-validated or decoded into chars.
 #[inline]
 pub fn unescape_string_optimized(s: &str) -> Result<String> {
-    // Fast path: if no backslashes, return as-is (avoid allocation)
-    if !s.contains('\\') {
+    let bytes = s.as_bytes();
+
+    // Fast path: if no backslashes, return as-is
+    let Some(first) = memchr(b'\\', bytes) else {
         return Ok(s.to_string());
-    }
+    };
 
-    // Slow path: process escape sequences
     let mut result = String::with_capacity(s.len()); // Pre-allocate expected size
-    let mut chars = s.chars();
-
-    while let Some(ch) = chars.next() {
-        if ch == '\\' {
-            match chars.next() {
-                Some('n') => result.push('\n'),
-                Some('t') => result.push('\t'),
-                Some('r') => result.push('\r'),
-                Some('\\') => result.push('\\'),
-                Some('"') => result.push('"'),
-                Some('\'') => result.push('\''),
-                Some('/') => result.push('/'),
-                Some('b') => result.push('\x08'),
-                Some('f') => result.push('\x0C'),
-                Some('u') => {
-                    // Unicode escape sequence \uXXXX - optimized version
-                    result.push(parse_unicode_escape(&mut chars)?);
-                }
-                Some('x') => {
-                    // ASCII hex escape sequence \xXX - optimized version
-                    result.push(parse_hex_escape(&mut chars)?);
-                }
-                Some(other) => {
-                    result.push('\\');
-                    result.push(other);
-                }
-                None => result.push('\\'),
+    let mut start = 0;
+    let mut pos = first;
+
+    loop {
+        result.push_str(&s[start..pos]);
+        start = pos + 1;
+
+        match bytes.get(start) {
+            Some(b'n') => result.push('\n'),
+            Some(b't') => result.push('\t'),
+            Some(b'r') => result.push('\r'),
+            Some(b'\\') => result.push('\\'),
+            Some(b'"') => result.push('"'),
+            Some(b'\'') => result.push('\''),
+            Some(b'/') => result.push('/'),
+            Some(b'b') => result.push('\x08'),
+            Some(b'f') => result.push('\x0C'),
+            Some(b'u') => {
+                // Unicode escape sequence \uXXXX
+                let (ch, len) = parse_unicode_escape(&bytes[start + 1..])?;
+                result.push(ch);
+                start += len;
+            }
+            Some(b'x') => {
+                // ASCII hex escape sequence \xXX
+                let (ch, len) = parse_hex_escape(&bytes[start + 1..])?;
+                result.push(ch);
+                start += len;
+            }
+            Some(_) => {
+                // Unknown escape: keep the backslash and let the following
+                // character be copied with the next run.
+                result.push('\\');
+                start -= 1;
+            }
+            None => {
+                result.push('\\');
+                return Ok(result);
             }
-        } else {
-            result.push(ch);
+        }
+        start += 1;
+
+        match memchr(b'\\', &bytes[start..]) {
+            Some(offset) => pos = start + offset,
+            None => break,
         }
     }
 
+    result.push_str(&s[start..]);
     Ok(result)
 }
 
+/// Decode exactly `count` hex digits from the start of `bytes`.
 #[inline]
-fn parse_unicode_escape(chars: &mut std::str::Chars<'_>) -> Result<char> {
-    let mut code = 0u32;
+fn parse_hex_digits(bytes: &[u8], count: usize) -> Result<u32> {
+    let digits = bytes.get(..count).ok_or(Error::InvalidEscape(0))?;
+    digits.iter().try_fold(0u32, |code, &b| {
+        let digit = (b as char).to_digit(16).ok_or(Error::InvalidEscape(0))?;
+        Ok((code << 4) | digit)
+    })
+}
 
-    for _ in 0..4 {
-        let hex_char = chars.next().ok_or(Error::InvalidEscape(0))?;
-        let digit = hex_char.to_digit(16).ok_or(Error::InvalidEscape(0))?;
-        code = (code << 4) | digit;
-    }
+/// Decode the `XXXX` of a `\uXXXX` escape; returns the char and the number
+/// of hex digits consumed.
+#[inline]
+fn parse_unicode_escape(bytes: &[u8]) -> Result<(char, usize)> {
+    let code = parse_hex_digits(bytes, 4)?;
 
     // Check if there's an additional hex digit immediately following
     // In strict JSON, \uXXXX should be exactly 4 hex digits
-    if let Some(next_char) = chars.clone().next() {
-        if next_char.is_ascii_hexdigit() {
-            return Err(Error::InvalidEscape(0));
-        }
+    if bytes.get(4).is_some_and(|b| b.is_ascii_hexdigit()) {
+        return Err(Error::InvalidEscape(0));
     }
 
-    std::char::from_u32(code).ok_or(Error::InvalidUnicode(0))
+    let ch = std::char::from_u32(code).ok_or(Error::InvalidUnicode(0))?;
+    Ok((ch, 4))
 }
 
+/// Decode the `XX` of a `\xXX` escape; returns the char and the number of
+/// hex digits consumed.
 #[inline]
-fn parse_hex_escape(chars: &mut std::str::Chars<'_>) -> Result<char> {
-    let mut code = 0u8;
-
-    for _ in 0..2 {
-        let hex_char = chars.next().ok_or(Error::InvalidEscape(0))?;
-        let digit = hex_char.to_digit(16).ok_or(Error::InvalidEscape(0))? as u8;
-        code = (code << 4) | digit;
-    }
-
-    Ok(code as char)
+fn parse_hex_escape(bytes: &[u8]) -> Result<(char, usize)> {
+    let code = parse_hex_digits(bytes, 2)?;
+    Ok((code as u8 as char, 2))
 }
 
 /// Optimized string content extraction that avoids unnecessary string operations.
@@ -135,6 +159,26 @@ mod tests {
         assert_eq!(result, "hello\nworld\t!");
     }
 
+    #[test]
+    fn test_unescape_edge_cases() {
+        assert_eq!(
+            unescape_string_optimized("caf\\u00e9 \\x41\\/").unwrap(),
+            "café A/"
+        );
+        assert_eq!(unescape_string_optimized("ü\\qü").unwrap(), "ü\\qü");
+        assert_eq!(unescape_string_optimized("\\ü").unwrap(), "\\ü");
+        assert_eq!(unescape_string_optimized("end\\").unwrap(), "end\\");
+        assert!(unescape_string_optimized("\\u12").is_err());
+        assert!(unescape_string_optimized("\\u00411").is_err());
+        assert!(unescape_string_optimized("\\ud800").is_err());
+
+        let long = format!("{}\\n{}", "é".repeat(40), "x".repeat(40));
+        assert_eq!(
+            unescape_string_optimized(&long).unwrap(),
+            format!("{}\n{}", "é".repeat(40), "x".repeat(40))
+        );
+    }
+
     #[test]
     fn test_extract_string_content() {
         assert_eq!(extract_string_content("\"hello\"").unwrap(), "hello");
@@ -2,9 +2,9 @@
 
 use crate::ast::{Token, Value};
 use crate::error::{Error, Result};
-use crate::parser::Parser;
+use crate::parser::{Parser, ParserCfg};
 
-impl<'a> Parser<'a> {
+impl<'a, C: ParserCfg> Parser<'a, C> {
     pub(super) fn parse_array(&mut self) -> Result<Value> {
         self.check_depth()?;
         self.state.depth += 1;
@@ -56,17 +56,17 @@ impl<'a> Parser<'a> {
                     self.skip_comments_and_newlines()?;
                     // Check for trailing comma
                     if matches!(self.current_token, Some((Token::RightBracket, _)))
-                        && !self.options.allow_trailing_commas
+                        && !self.allow_trailing_commas()
                     {
                         return Err(Error::TrailingComma(self.lexer.position()));
                     }
                 }
-                Some((Token::Newline, _)) if self.options.newline_as_comma => {
+                Some((Token::Newline, _)) if self.newline_as_comma() => {
                     self.advance()?;
                     self.skip_comments_and_newlines()?;
                     // Check for trailing newline
                     if matches!(self.current_token, Some((Token::RightBracket, _)))
-                        && !self.options.allow_trailing_commas
+                        && !self.allow_trailing_commas()
                     {
                         return Err(Error::TrailingComma(self.lexer.position()));
                     }
@@ -77,7 +77,7 @@ impl<'a> Parser<'a> {
                 _ => {
                     // If we have newline_as_comma enabled, try skipping comments and newlines
                     // to see if we find a separator or end token after comments
-                    if self.options.newline_as_comma {
+                    if self.newline_as_comma() {
                         // Save the current state in case we need to restore
                         let _saved_pos = self.lexer.position();
                         let saved_token = self.current_token;
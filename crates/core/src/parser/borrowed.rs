@@ -0,0 +1,496 @@
+// this_file: src/parser/borrowed.rs
+
+//! Zero-copy parsing into [`BorrowedValue`].
+//!
+//! The fast path accepts JSON plus the forgiving extensions that the lexer
+//! resolves on its own: comments, single quotes, unquoted keys and trailing
+//! commas. Anything else (implicit top-level values, newline separators,
+//! repairs, errors) makes it bail out, and the input is parsed again with the
+//! full [`Parser`](super::Parser) so results and errors are always the same as
+//! [`parse`].
+//!
+//! [`parse_borrowed_in`] additionally interns escaped object keys in a
+//! caller-owned [`Bump`] arena: each distinct key is decoded once per parse
+//! and shared by every object that repeats it, so a large array of records
+//! allocates its keys a single time.
+//!
+//! [`parse_number_array`] covers the other common bulk shape, a flat array of
+//! numbers, by pushing straight into a typed vector without a value tree.
+//! [`parse_number_array_as`] does the same for a caller-chosen element type,
+//! monomorphized per [`NumberElement`] so each number is converted as it is
+//! parsed.
+
+use super::number::parse_number_token;
+use super::{parse, ParserOptions};
+use crate::ast::{BorrowedValue, Number, Token, Value};
+use crate::error::{Result, Span};
+use crate::lexer::{FastLexer, JsonLexer, LexerConfig, LexerMode};
+use crate::optimization::{extract_string_content, unescape_string_optimized};
+use bumpalo::Bump;
+use memchr::memchr;
+use rustc_hash::FxHashMap;
+use std::borrow::Cow;
+
+/// Parses `input` with the default options, borrowing strings from it.
+///
+/// Produces the same value as [`parse`] but only allocates for containers
+/// and escaped strings, which makes it the cheaper choice for read-only
+/// access and validation.
+///
+/// # Examples
+///
+/// ```
+/// use vexy_json_core::parse_borrowed;
+///
+/// let value = parse_borrowed(r#"{"server": {"port": 8080}}"#).unwrap();
+/// let port = value.get("server").and_then(|s| s.get("port"));
+/// assert_eq!(port, Some(&vexy_json_core::BorrowedValue::I64(8080)));
+/// ```
+pub fn parse_borrowed(input: &str) -> Result<BorrowedValue<'_>> {
+    if let Some(value) = BorrowedParser::new(input).parse() {
+        return Ok(value);
+    }
+    parse(input).map(BorrowedValue::from)
+}
+
+/// Parses `input` like [`parse_borrowed`], interning escaped object keys in
+/// `arena`.
+///
+/// Every key in the result is borrowed, either from `input` or from the
+/// arena; repeated escaped keys decode once and share the arena copy.
+/// Escaped string values are decoded as in [`parse_borrowed`]. Reusing one
+/// arena across calls and calling [`Bump::reset`] in between frees all keys
+/// at once and keeps the arena's memory for the next document.
+///
+/// # Examples
+///
+/// ```
+/// use bumpalo::Bump;
+/// use vexy_json_core::parse_borrowed_in;
+///
+/// let arena = Bump::new();
+/// let value = parse_borrowed_in(r#"[{"caf\u00e9": 1}, {"caf\u00e9": 2}]"#, &arena).unwrap();
+/// assert_eq!(value.into_owned(), vexy_json_core::parse(r#"[{"café": 1}, {"café": 2}]"#).unwrap());
+/// ```
+pub fn parse_borrowed_in<'a>(input: &'a str, arena: &'a Bump) -> Result<BorrowedValue<'a>> {
+    if let Some(value) = BorrowedParser::with_arena(input, arena).parse() {
+        return Ok(value);
+    }
+    parse(input).map(BorrowedValue::from)
+}
+
+/// The numbers of a flat JSON array, in the narrowest type that holds all of
+/// them.
+#[derive(Debug, Clone, PartialEq)]
+pub enum NumberArray {
+    /// Every element was an integer
+    I64(Vec<i64>),
+    /// At least one element was a float, or the array was empty
+    F64(Vec<f64>),
+}
+
+/// Parses a flat array of numbers in a single pass.
+///
+/// Numbers go straight into a vector instead of a [`BorrowedValue`] tree,
+/// which is what NumPy-style consumers want. Integers stay `i64` until the
+/// first float turns the whole array into `f64`. Returns `None` for any
+/// other input, including errors, so callers can fall back to [`parse`].
+///
+/// # Examples
+///
+/// ```
+/// use vexy_json_core::{parse_number_array, NumberArray};
+///
+/// assert_eq!(parse_number_array("[1, 2, 3]"), Some(NumberArray::I64(vec![1, 2, 3])));
+/// assert_eq!(parse_number_array("[1, 2.5]"), Some(NumberArray::F64(vec![1.0, 2.5])));
+/// assert_eq!(parse_number_array(r#"[1, "two"]"#), None);
+/// ```
+pub fn parse_number_array(input: &str) -> Option<NumberArray> {
+    let mut integers = Vec::new();
+    let mut floats: Option<Vec<f64>> = None;
+    BorrowedParser::new(input).parse_numbers(|number| {
+        match number {
+            Number::Integer(i) => match &mut floats {
+                Some(floats) => floats.push(i as f64),
+                None => integers.push(i),
+            },
+            Number::Float(f) => floats
+                .get_or_insert_with(|| integers.drain(..).map(|i| i as f64).collect())
+                .push(f),
+        }
+        Some(())
+    })?;
+
+    Some(match floats {
+        Some(floats) => NumberArray::F64(floats),
+        None if integers.is_empty() => NumberArray::F64(Vec::new()),
+        None => NumberArray::I64(integers),
+    })
+}
+
+/// An element type that [`parse_number_array_as`] converts numbers into.
+pub trait NumberElement: Copy {
+    /// Convert an integer, or `None` if it does not fit.
+    fn from_i64(i: i64) -> Option<Self>;
+    /// Convert a float, or `None` if the type has no fractions.
+    fn from_f64(f: f64) -> Option<Self>;
+}
+
+macro_rules! float_element {
+    ($($t:ty),*) => {$(
+        impl NumberElement for $t {
+            #[inline(always)]
+            fn from_i64(i: i64) -> Option<Self> {
+                Some(i as $t)
+            }
+
+            #[inline(always)]
+            fn from_f64(f: f64) -> Option<Self> {
+                Some(f as $t)
+            }
+        }
+    )*};
+}
+
+macro_rules! int_element {
+    ($($t:ty),*) => {$(
+        impl NumberElement for $t {
+            #[inline(always)]
+            fn from_i64(i: i64) -> Option<Self> {
+                <$t>::try_from(i).ok()
+            }
+
+            #[inline(always)]
+            fn from_f64(_: f64) -> Option<Self> {
+                None
+            }
+        }
+    )*};
+}
+
+float_element!(f32, f64);
+int_element!(i16, i32, i64);
+
+/// Parses a flat array of numbers straight into elements of type `T`.
+///
+/// Floats become the nearest value of a float type, as with `as`. Integer
+/// types take integers that fit and reject floats. Returns `None` for
+/// anything else, like [`parse_number_array`], so callers can apply their
+/// own conversion rules to the general parse.
+///
+/// # Examples
+///
+/// ```
+/// use vexy_json_core::parse_number_array_as;
+///
+/// assert_eq!(parse_number_array_as::<f32>("[1, 2.5]"), Some(vec![1.0f32, 2.5]));
+/// assert_eq!(parse_number_array_as::<i32>("[1, -2]"), Some(vec![1, -2]));
+/// assert_eq!(parse_number_array_as::<i32>("[1, 2.5]"), None);
+/// ```
+pub fn parse_number_array_as<T: NumberElement>(input: &str) -> Option<Vec<T>> {
+    let mut elements = Vec::new();
+    BorrowedParser::new(input).parse_numbers(|number| {
+        elements.push(match number {
+            Number::Integer(i) => T::from_i64(i)?,
+            Number::Float(f) => T::from_f64(f)?,
+        });
+        Some(())
+    })?;
+    Some(elements)
+}
+
+struct BorrowedParser<'a> {
+    lexer: FastLexer<'a>,
+    input: &'a str,
+    /// Arena for decoded keys, if the caller supplied one
+    arena: Option<&'a Bump>,
+    /// Escaped key source text to its decoded copy in `arena`
+    keys: FxHashMap<&'a str, &'a str>,
+    token: (Token, Span),
+    depth: usize,
+    max_depth: usize,
+}
+
+impl<'a> BorrowedParser<'a> {
+    fn new(input: &'a str) -> Self {
+        let options = ParserOptions::default();
+        // Same lexer configuration as `Parser::new` uses for the defaults
+        let config = LexerConfig {
+            mode: LexerMode::Forgiving,
+            collect_stats: false,
+            buffer_size: 8192,
+            max_depth: options.max_depth,
+            track_positions: true,
+        };
+
+        BorrowedParser {
+            lexer: FastLexer::new(input, config),
+            input,
+            arena: None,
+            keys: FxHashMap::default(),
+            token: (Token::Eof, Span::default()),
+            depth: 0,
+            max_depth: options.max_depth,
+        }
+    }
+
+    fn with_arena(input: &'a str, arena: &'a Bump) -> Self {
+        BorrowedParser {
+            arena: Some(arena),
+            ..BorrowedParser::new(input)
+        }
+    }
+
+    /// Parses a single top-level value; `None` means "use the full parser".
+    fn parse(mut self) -> Option<BorrowedValue<'a>> {
+        self.advance()?;
+        let value = self.parse_value()?;
+        (self.token.0 == Token::Eof).then_some(value)
+    }
+
+    /// Parses a top-level array that holds only numbers, handing each one
+    /// to `push`, which may stop the parse by returning `None`.
+    #[inline]
+    fn parse_numbers(mut self, mut push: impl FnMut(Number) -> Option<()>) -> Option<()> {
+        self.advance()?;
+        if self.token.0 != Token::LeftBracket {
+            return None;
+        }
+        self.advance()?;
+
+        while self.token.0 != Token::RightBracket {
+            let (Token::Number, span) = self.token else {
+                return None;
+            };
+            match parse_number_token(self.input, span).ok()? {
+                Value::Number(number) => push(number)?,
+                _ => return None,
+            }
+            self.advance()?;
+            match self.token.0 {
+                Token::Comma => self.advance()?,
+                Token::RightBracket => break,
+                _ => return None,
+            }
+        }
+        self.advance()?;
+        (self.token.0 == Token::Eof).then_some(())
+    }
+
+    #[inline]
+    fn advance(&mut self) -> Option<()> {
+        self.token = self.lexer.next_token().ok()?;
+        Some(())
+    }
+
+    fn parse_value(&mut self) -> Option<BorrowedValue<'a>> {
+        let (token, span) = self.token;
+        let value = match token {
+            Token::LeftBrace => return self.parse_object(),
+            Token::LeftBracket => return self.parse_array(),
+            Token::String => BorrowedValue::Str(self.string(span)?),
+            Token::Number => match parse_number_token(self.input, span).ok()? {
+                Value::Number(Number::Integer(i)) => BorrowedValue::I64(i),
+                Value::Number(Number::Float(f)) => BorrowedValue::F64(f),
+                _ => return None,
+            },
+            Token::True => BorrowedValue::Bool(true),
+            Token::False => BorrowedValue::Bool(false),
+            Token::Null => BorrowedValue::Null,
+            _ => return None,
+        };
+        self.advance()?;
+        Some(value)
+    }
+
+    fn string(&self, span: Span) -> Option<Cow<'a, str>> {
+        let content = extract_string_content(&self.input[span.start..span.end]).ok()?;
+        if memchr(b'\\', content.as_bytes()).is_none() {
+            Some(Cow::Borrowed(content))
+        } else {
+            unescape_string_optimized(content).ok().map(Cow::Owned)
+        }
+    }
+
+    fn key(&mut self, span: Span) -> Option<Cow<'a, str>> {
+        let Some(arena) = self.arena else {
+            return self.string(span);
+        };
+        let content = extract_string_content(&self.input[span.start..span.end]).ok()?;
+        if memchr(b'\\', content.as_bytes()).is_none() {
+            return Some(Cow::Borrowed(content));
+        }
+        if let Some(&key) = self.keys.get(content) {
+            return Some(Cow::Borrowed(key));
+        }
+        let key: &'a str = arena.alloc_str(&unescape_string_optimized(content).ok()?);
+        self.keys.insert(content, key);
+        Some(Cow::Borrowed(key))
+    }
+
+    fn enter(&mut self) -> Option<()> {
+        self.depth += 1;
+        (self.depth < self.max_depth).then_some(())
+    }
+
+    fn parse_array(&mut self) -> Option<BorrowedValue<'a>> {
+        self.enter()?;
+        self.advance()?;
+
+        let mut items = Vec::new();
+        while self.token.0 != Token::RightBracket {
+            items.push(self.parse_value()?);
+            match self.token.0 {
+                Token::Comma => self.advance()?,
+                Token::RightBracket => break,
+                _ => return None,
+            }
+        }
+
+        self.depth -= 1;
+        self.advance()?;
+        Some(BorrowedValue::Array(items))
+    }
+
+    fn parse_object(&mut self) -> Option<BorrowedValue<'a>> {
+        self.enter()?;
+        self.advance()?;
+
+        let mut members = Vec::new();
+        while self.token.0 != Token::RightBrace {
+            let key = match self.token {
+                (Token::String, span) => self.key(span)?,
+                (Token::UnquotedString, span) => Cow::Borrowed(&self.input[span.start..span.end]),
+                _ => return None,
+            };
+            self.advance()?;
+            if self.token.0 != Token::Colon {
+                return None;
+            }
+            self.advance()?;
+
+            members.push((key, self.parse_value()?));
+            match self.token.0 {
+                Token::Comma => self.advance()?,
+                Token::RightBrace => break,
+                _ => return None,
+            }
+        }
+
+        self.depth -= 1;
+        self.advance()?;
+        Some(BorrowedValue::Object(members))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_borrowed_borrows_plain_strings() {
+        let input = r#"{"name": "vexy", 'path': "a\\b", unquoted: [1, 2.5, true, null,],}"#;
+        let value = parse_borrowed(input).unwrap();
+
+        assert!(matches!(
+            value.get("name"),
+            Some(BorrowedValue::Str(Cow::Borrowed("vexy")))
+        ));
+        assert!(
+            matches!(value.get("path"), Some(BorrowedValue::Str(Cow::Owned(s))) if s == "a\\b")
+        );
+        assert_eq!(
+            value.get("unquoted"),
+            Some(&BorrowedValue::Array(vec![
+                BorrowedValue::I64(1),
+                BorrowedValue::F64(2.5),
+                BorrowedValue::Bool(true),
+                BorrowedValue::Null,
+            ]))
+        );
+        assert_eq!(value.into_owned(), parse(input).unwrap());
+    }
+
+    #[test]
+    fn test_parse_borrowed_falls_back_to_full_parser() {
+        for input in ["a: 1, b: 2", "[1\n2]", "", "1, 2, 3", "{\"a\": 1"] {
+            assert_eq!(
+                parse_borrowed(input).map(BorrowedValue::into_owned).ok(),
+                parse(input).ok(),
+                "input: {input:?}"
+            );
+        }
+        assert!(parse_borrowed("{invalid json}").is_err() == parse("{invalid json}").is_err());
+    }
+
+    #[test]
+    fn test_parse_borrowed_duplicate_keys() {
+        let value = parse_borrowed(r#"{"a": 1, "a": 2}"#).unwrap();
+        assert_eq!(value.get("a"), Some(&BorrowedValue::I64(2)));
+    }
+
+    #[test]
+    fn test_parse_number_array() {
+        assert_eq!(
+            parse_number_array("[1, -2, 3,]"),
+            Some(NumberArray::I64(vec![1, -2, 3]))
+        );
+        assert_eq!(
+            parse_number_array("[1, 2.5, 3]"),
+            Some(NumberArray::F64(vec![1.0, 2.5, 3.0]))
+        );
+        assert_eq!(parse_number_array("[]"), Some(NumberArray::F64(vec![])));
+        for input in ["[1, null]", "{\"a\": 1}", "[1, 2] 3", "[[1]]", "[1"] {
+            assert_eq!(parse_number_array(input), None, "input: {input:?}");
+        }
+    }
+
+    #[test]
+    fn test_parse_number_array_as() {
+        assert_eq!(
+            parse_number_array_as::<f32>("[1, 2.5, 0.1]"),
+            Some(vec![1.0, 2.5, 0.1f64 as f32])
+        );
+        assert_eq!(parse_number_array_as::<f64>("[]"), Some(vec![]));
+        assert_eq!(
+            parse_number_array_as::<i32>("[1, -2, 2147483647]"),
+            Some(vec![1, -2, i32::MAX])
+        );
+        assert_eq!(parse_number_array_as::<i32>("[2147483648]"), None);
+        assert_eq!(parse_number_array_as::<i16>("[1, 2.0]"), None);
+        assert_eq!(parse_number_array_as::<i64>("[1, null]"), None);
+    }
+
+    #[test]
+    fn test_parse_borrowed_in_interns_escaped_keys() {
+        let input = r#"[{"t\u0061g": "a\tb"}, {"t\u0061g": 2}, {plain: 3}]"#;
+        let mut arena = Bump::new();
+        let value = parse_borrowed_in(input, &arena).unwrap();
+
+        let BorrowedValue::Array(items) = &value else {
+            panic!("expected an array, got {value:?}");
+        };
+        let key = |i: usize| match &items[i] {
+            BorrowedValue::Object(members) => match &members[0].0 {
+                Cow::Borrowed(key) => *key,
+                Cow::Owned(_) => panic!("key {i} was not borrowed"),
+            },
+            other => panic!("expected an object, got {other:?}"),
+        };
+        assert_eq!(key(0), "tag");
+        assert!(std::ptr::eq(key(0), key(1)));
+        assert!(matches!(
+            items[0].get("tag"),
+            Some(BorrowedValue::Str(Cow::Owned(s))) if s == "a\tb"
+        ));
+        assert_eq!(value.into_owned(), parse(input).unwrap());
+
+        arena.reset();
+        assert_eq!(
+            parse_borrowed_in("{a: 1", &arena)
+                .ok()
+                .map(BorrowedValue::into_owned),
+            parse("{a: 1").ok()
+        );
+    }
+}
@@ -0,0 +1,142 @@
+// this_file: src/parser/cfg.rs
+
+//! Compile-time parser configurations.
+//!
+//! [`Parser`] checks its syntax flags for nearly every token. A [`ParserCfg`]
+//! can fix some or all of those flags as associated constants, and each
+//! configuration gets its own monomorphized parser in which the fixed checks
+//! are constant-folded away. [`parse_with_options`](super::parse_with_options)
+//! picks [`Forgiving`] or [`Strict`] when the options match them and the
+//! flag-reading [`Runtime`] configuration otherwise.
+
+use super::{Parser, ParserOptions};
+
+/// A parser configuration that may fix syntax flags at compile time.
+///
+/// Each constant is `Some(flag)` to fix the flag or `None` to read it from
+/// the [`ParserOptions`] at run time.
+pub trait ParserCfg {
+    /// Fixed [`ParserOptions::allow_comments`]
+    const ALLOW_COMMENTS: Option<bool>;
+    /// Fixed [`ParserOptions::allow_trailing_commas`]
+    const ALLOW_TRAILING_COMMAS: Option<bool>;
+    /// Fixed [`ParserOptions::allow_unquoted_keys`]
+    const ALLOW_UNQUOTED_KEYS: Option<bool>;
+    /// Fixed [`ParserOptions::allow_single_quotes`]
+    const ALLOW_SINGLE_QUOTES: Option<bool>;
+    /// Fixed [`ParserOptions::implicit_top_level`]
+    const IMPLICIT_TOP_LEVEL: Option<bool>;
+    /// Fixed [`ParserOptions::newline_as_comma`]
+    const NEWLINE_AS_COMMA: Option<bool>;
+
+    /// Whether `options` agrees with every flag this configuration fixes.
+    fn matches(options: &ParserOptions) -> bool {
+        fn agrees(fixed: Option<bool>, flag: bool) -> bool {
+            fixed.is_none_or(|fixed| fixed == flag)
+        }
+
+        agrees(Self::ALLOW_COMMENTS, options.allow_comments)
+            && agrees(Self::ALLOW_TRAILING_COMMAS, options.allow_trailing_commas)
+            && agrees(Self::ALLOW_UNQUOTED_KEYS, options.allow_unquoted_keys)
+            && agrees(Self::ALLOW_SINGLE_QUOTES, options.allow_single_quotes)
+            && agrees(Self::IMPLICIT_TOP_LEVEL, options.implicit_top_level)
+            && agrees(Self::NEWLINE_AS_COMMA, options.newline_as_comma)
+    }
+}
+
+/// Reads every flag from the options; used for uncommon combinations.
+#[derive(Debug, Clone, Copy, Default)]
+pub struct Runtime;
+
+impl ParserCfg for Runtime {
+    const ALLOW_COMMENTS: Option<bool> = None;
+    const ALLOW_TRAILING_COMMAS: Option<bool> = None;
+    const ALLOW_UNQUOTED_KEYS: Option<bool> = None;
+    const ALLOW_SINGLE_QUOTES: Option<bool> = None;
+    const IMPLICIT_TOP_LEVEL: Option<bool> = None;
+    const NEWLINE_AS_COMMA: Option<bool> = None;
+}
+
+/// Every forgiving feature enabled, as in [`ParserOptions::default`].
+#[derive(Debug, Clone, Copy, Default)]
+pub struct Forgiving;
+
+impl ParserCfg for Forgiving {
+    const ALLOW_COMMENTS: Option<bool> = Some(true);
+    const ALLOW_TRAILING_COMMAS: Option<bool> = Some(true);
+    const ALLOW_UNQUOTED_KEYS: Option<bool> = Some(true);
+    const ALLOW_SINGLE_QUOTES: Option<bool> = Some(true);
+    const IMPLICIT_TOP_LEVEL: Option<bool> = Some(true);
+    const NEWLINE_AS_COMMA: Option<bool> = Some(true);
+}
+
+/// Every forgiving feature disabled.
+#[derive(Debug, Clone, Copy, Default)]
+pub struct Strict;
+
+impl ParserCfg for Strict {
+    const ALLOW_COMMENTS: Option<bool> = Some(false);
+    const ALLOW_TRAILING_COMMAS: Option<bool> = Some(false);
+    const ALLOW_UNQUOTED_KEYS: Option<bool> = Some(false);
+    const ALLOW_SINGLE_QUOTES: Option<bool> = Some(false);
+    const IMPLICIT_TOP_LEVEL: Option<bool> = Some(false);
+    const NEWLINE_AS_COMMA: Option<bool> = Some(false);
+}
+
+/// Flag accessors: a fixed flag is a constant, otherwise the option is read.
+impl<C: ParserCfg> Parser<'_, C> {
+    #[inline(always)]
+    pub(super) fn allow_comments(&self) -> bool {
+        C::ALLOW_COMMENTS.unwrap_or(self.options.allow_comments)
+    }
+
+    #[inline(always)]
+    pub(super) fn allow_trailing_commas(&self) -> bool {
+        C::ALLOW_TRAILING_COMMAS.unwrap_or(self.options.allow_trailing_commas)
+    }
+
+    #[inline(always)]
+    pub(super) fn allow_unquoted_keys(&self) -> bool {
+        C::ALLOW_UNQUOTED_KEYS.unwrap_or(self.options.allow_unquoted_keys)
+    }
+
+    #[inline(always)]
+    pub(super) fn allow_single_quotes(&self) -> bool {
+        C::ALLOW_SINGLE_QUOTES.unwrap_or(self.options.allow_single_quotes)
+    }
+
+    #[inline(always)]
+    pub(super) fn implicit_top_level(&self) -> bool {
+        C::IMPLICIT_TOP_LEVEL.unwrap_or(self.options.implicit_top_level)
+    }
+
+    #[inline(always)]
+    pub(super) fn newline_as_comma(&self) -> bool {
+        C::NEWLINE_AS_COMMA.unwrap_or(self.options.newline_as_comma)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_matches() {
+        let defaults = ParserOptions::default();
+        assert!(Forgiving::matches(&defaults));
+        assert!(!Strict::matches(&defaults));
+        assert!(Runtime::matches(&defaults));
+
+        let strict = ParserOptions {
+            allow_comments: false,
+            allow_trailing_commas: false,
+            allow_unquoted_keys: false,
+            allow_single_quotes: false,
+            implicit_top_level: false,
+            newline_as_comma: false,
+            ..defaults
+        };
+        assert!(Strict::matches(&strict));
+        assert!(!Forgiving::matches(&strict));
+    }
+}
@@ -4,6 +4,10 @@
 pub mod array;
 /// Boolean value parsing.
 pub mod boolean;
+/// Zero-copy parsing into borrowed values.
+pub mod borrowed;
+/// Compile-time parser configurations.
+pub mod cfg;
 /// Stack-based iterative parser implementation.
 pub mod iterative;
 /// Null value parsing.
@@ -21,6 +25,8 @@ pub mod recursive;
 pub mod state;
 /// String parsing with escape sequence handling.
 pub mod string;
+/// Allocation-free validation of strict JSON.
+pub mod validate;
 
 use self::boolean::{parse_false, parse_true};
 use self::null::parse_null;
@@ -32,6 +38,11 @@ use crate::error::{Error, ErrorContext, ErrorRecoveryEngineV2, Result, Span};
 use crate::lexer::{FastLexer, JsonLexer, Lexer, LexerConfig, LexerMode};
 use crate::optimization::ValueBuilder;
 use crate::repair::JsonRepairer;
+pub use borrowed::{
+    parse_borrowed, parse_borrowed_in, parse_number_array, parse_number_array_as, NumberArray,
+    NumberElement,
+};
+pub use cfg::{Forgiving, ParserCfg, Runtime, Strict};
 pub use iterative::{parse_iterative, IterativeParser};
 pub use optimized::{
     parse_optimized, parse_optimized_with_options, parse_with_stats, OptimizedParser,
@@ -45,6 +56,8 @@ pub use optimized_v3::{
 pub use recursive::{parse_recursive, RecursiveDescentParser};
 use rustc_hash::FxHashMap;
 pub use state::ParserState;
+use std::marker::PhantomData;
+pub use validate::is_strict_json;
 
 #[cfg(feature = "serde")]
 use serde::{Deserialize, Serialize};
@@ -53,7 +66,7 @@ use serde::{Deserialize, Serialize};
 ///
 /// These options control which forgiving features are enabled during parsing.
 /// By default, all forgiving features are enabled.
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq, Eq)]
 #[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
 #[cfg_attr(feature = "serde", serde(default))]
 pub struct ParserOptions {
@@ -82,29 +95,37 @@ pub struct ParserOptions {
     pub report_repairs: bool,
 }
 
+impl ParserOptions {
+    /// The default options, usable in constant contexts and comparisons
+    /// without building a new value.
+    pub const DEFAULT: ParserOptions = ParserOptions {
+        allow_comments: true,
+        allow_trailing_commas: true,
+        allow_unquoted_keys: true,
+        allow_single_quotes: true,
+        implicit_top_level: true,
+        newline_as_comma: true,
+        max_depth: 128,
+        enable_repair: true,
+        max_repairs: 100,
+        fast_repair: false,
+        report_repairs: true,
+    };
+}
+
 impl Default for ParserOptions {
     fn default() -> Self {
-        ParserOptions {
-            allow_comments: true,
-            allow_trailing_commas: true,
-            allow_unquoted_keys: true,
-            allow_single_quotes: true,
-            implicit_top_level: true,
-            newline_as_comma: true,
-            max_depth: 128,
-            enable_repair: true,
-            max_repairs: 100,
-            fast_repair: false,
-            report_repairs: true,
-        }
+        ParserOptions::DEFAULT
     }
 }
 
 /// The vexy_json parser.
 ///
 /// Parses tokens from a Lexer into a Value tree structure.
-/// Supports both strict JSON and various forgiving extensions.
-pub struct Parser<'a> {
+/// Supports both strict JSON and various forgiving extensions. The
+/// [`ParserCfg`] parameter can fix the syntax flags at compile time; the
+/// default [`Runtime`] configuration reads them from the options.
+pub struct Parser<'a, C = Runtime> {
     pub(super) lexer: Box<dyn JsonLexer + 'a>,
     pub(super) original_input: &'a str,
     pub(super) options: ParserOptions,
@@ -116,11 +137,27 @@ pub struct Parser<'a> {
     /// Value builder for optimized object and array construction
     #[allow(dead_code)]
     pub(super) value_builder: ValueBuilder,
+    cfg: PhantomData<C>,
 }
 
 impl<'a> Parser<'a> {
     /// Creates a new parser with the given input and options.
     pub fn new(input: &'a str, options: ParserOptions) -> Self {
+        Self::with_cfg(input, options)
+    }
+}
+
+impl<'a, C: ParserCfg> Parser<'a, C> {
+    /// Creates a parser for the configuration `C`.
+    ///
+    /// The flags `C` fixes take precedence over `options`; callers should
+    /// only pick a configuration whose [`ParserCfg::matches`] accepts them.
+    pub fn with_cfg(input: &'a str, options: ParserOptions) -> Self {
+        debug_assert!(
+            C::matches(&options),
+            "options disagree with the parser configuration"
+        );
+
         // Determine if we need forgiving features
         let needs_forgiving = options.allow_comments
             || options.allow_trailing_commas
@@ -156,6 +193,7 @@ impl<'a> Parser<'a> {
             current_token: None, // Will be populated by first advance()
             state: ParserState::new(),
             value_builder: ValueBuilder::new(),
+            cfg: PhantomData,
         }
     }
 
@@ -186,7 +224,7 @@ impl<'a> Parser<'a> {
         // Skip leading newlines when they appear after comments - they should not start implicit arrays
         // This is different from commas which can legitimately start implicit arrays
         if self.current_token.as_ref().map(|(t, _)| t) == Some(&Token::Newline)
-            && self.options.newline_as_comma
+            && self.newline_as_comma()
         {
             self.skip_comments_and_newlines()?;
             if self.current_token.as_ref().map(|(t, _)| t) == Some(&Token::Eof) {
@@ -195,7 +233,7 @@ impl<'a> Parser<'a> {
         }
 
         // Check if it starts with a separator (implicit array with null first element)
-        if self.is_separator() && self.options.implicit_top_level {
+        if self.is_separator() && self.implicit_top_level() {
             let mut array = vec![Value::Null];
             self.advance()?;
 
@@ -238,7 +276,7 @@ impl<'a> Parser<'a> {
             Some(&Token::LeftBrace) | Some(&Token::LeftBracket)
         );
 
-        let first_value = if self.options.implicit_top_level && !is_explicit_structure {
+        let first_value = if self.implicit_top_level() && !is_explicit_structure {
             self.parse_value_or_implicit()?
         } else {
             self.parse_value()?
@@ -252,7 +290,7 @@ impl<'a> Parser<'a> {
             _ if is_explicit_structure => {
                 // For explicit JSON structures (arrays/objects), check if there's a trailing comma
                 // that should start an implicit array
-                if self.options.implicit_top_level
+                if self.implicit_top_level()
                     && matches!(
                         self.current_token.as_ref().map(|(t, _)| t),
                         Some(&Token::Comma)
@@ -305,14 +343,14 @@ impl<'a> Parser<'a> {
                 if matches!(
                     self.current_token.as_ref().map(|(t, _)| t),
                     Some(&Token::Comma)
-                ) || (self.options.newline_as_comma
+                ) || (self.newline_as_comma()
                     && matches!(
                         self.current_token.as_ref().map(|(t, _)| t),
                         Some(&Token::Newline)
                     )) =>
             {
                 // Check if this is just trailing newlines/whitespace by advancing and checking
-                if self.options.newline_as_comma
+                if self.newline_as_comma()
                     && matches!(
                         self.current_token.as_ref().map(|(t, _)| t),
                         Some(&Token::Newline)
@@ -353,7 +391,7 @@ impl<'a> Parser<'a> {
                 }
 
                 // It's an implicit array (for commas)
-                if self.options.implicit_top_level {
+                if self.implicit_top_level() {
                     let mut array = vec![first_value];
                     self.advance()?;
 
@@ -397,7 +435,7 @@ impl<'a> Parser<'a> {
             }
             _ => {
                 // Check if this is another value in an implicit array (space-separated)
-                if self.options.implicit_top_level && self.is_value_token() {
+                if self.implicit_top_level() && self.is_value_token() {
                     // Create an implicit array with the first value and continue parsing
                     let mut array = vec![first_value];
 
@@ -457,7 +495,7 @@ impl<'a> Parser<'a> {
 
             match self.current_token.as_ref().map(|(t, _)| t) {
                 Some(&Token::SingleLineComment) | Some(&Token::MultiLineComment) => {
-                    if self.options.allow_comments {
+                    if self.allow_comments() {
                         continue;
                     } else {
                         return Err(Error::Custom("Comments are not allowed".to_string()));
@@ -509,7 +547,7 @@ impl<'a> Parser<'a> {
                     self.advance()?;
                 }
                 Some(&Token::Newline)
-                    if self.options.newline_as_comma || just_had_single_line_comment =>
+                    if self.newline_as_comma() || just_had_single_line_comment =>
                 {
                     just_had_single_line_comment = false;
                     self.advance()?;
@@ -525,7 +563,7 @@ impl<'a> Parser<'a> {
         matches!(
             self.current_token.as_ref().map(|(t, _)| t),
             Some(&Token::Comma)
-        ) || (self.options.newline_as_comma
+        ) || (self.newline_as_comma()
             && matches!(
                 self.current_token.as_ref().map(|(t, _)| t),
                 Some(&Token::Newline)
@@ -540,16 +578,16 @@ impl<'a> Parser<'a> {
         let remaining_input = &self.original_input[current_pos..];
 
         // Create same type of lexer as the main parser
-        let needs_forgiving = self.options.allow_comments
-            || self.options.allow_trailing_commas
-            || self.options.allow_unquoted_keys
-            || self.options.allow_single_quotes
-            || self.options.implicit_top_level
-            || self.options.newline_as_comma;
+        let needs_forgiving = self.allow_comments()
+            || self.allow_trailing_commas()
+            || self.allow_unquoted_keys()
+            || self.allow_single_quotes()
+            || self.implicit_top_level()
+            || self.newline_as_comma();
 
         let mut temp_lexer: Box<dyn JsonLexer> = if needs_forgiving {
             let config = LexerConfig {
-                mode: if self.options.allow_comments {
+                mode: if self.allow_comments() {
                     LexerMode::Forgiving
                 } else {
                     LexerMode::Strict
@@ -580,7 +618,7 @@ impl<'a> Parser<'a> {
         self.skip_comments()?;
 
         // Check if it's an implicit object (key:value pattern)
-        if self.options.implicit_top_level {
+        if self.implicit_top_level() {
             match self.current_token {
                 Some((Token::UnquotedString, _))
                 | Some((Token::String, _))
@@ -758,7 +796,7 @@ impl<'a> Parser<'a> {
             Some((Token::LeftBracket, _)) => self.parse_array(),
             None => {
                 // If we reached EOF where a value is expected, treat it as null (likely comment)
-                if self.options.allow_comments {
+                if self.allow_comments() {
                     Ok(Value::Null)
                 } else {
                     Err(Error::Expected {
@@ -770,7 +808,7 @@ impl<'a> Parser<'a> {
             }
             Some((Token::Eof, _)) => {
                 // If we reached EOF where a value is expected, treat it as null (likely comment)
-                if self.options.allow_comments {
+                if self.allow_comments() {
                     Ok(Value::Null)
                 } else {
                     Err(Error::Expected {
@@ -813,8 +851,7 @@ impl<'a> Parser<'a> {
 /// assert!(result.is_ok());
 /// ```
 pub fn parse(input: &str) -> Result<Value> {
-    let mut parser = Parser::new(input, ParserOptions::default());
-    parser.parse()
+    Parser::<Forgiving>::with_cfg(input, ParserOptions::DEFAULT).parse()
 }
 
 /// Parses a JSON string with custom options.
@@ -836,8 +873,14 @@ pub fn parse(input: &str) -> Result<Value> {
 /// assert!(result.is_ok());
 /// ```
 pub fn parse_with_options(input: &str, options: ParserOptions) -> Result<Value> {
-    let mut parser = Parser::new(input, options);
-    parser.parse()
+    // The common flag combinations get parsers with the checks compiled out
+    if Forgiving::matches(&options) {
+        Parser::<Forgiving>::with_cfg(input, options).parse()
+    } else if Strict::matches(&options) {
+        Parser::<Strict>::with_cfg(input, options).parse()
+    } else {
+        Parser::new(input, options).parse()
+    }
 }
 
 /// Enhanced parsing with three-tier fallback strategy (serde_json → vexy_json → repair)
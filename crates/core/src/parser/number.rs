@@ -2,33 +2,105 @@
 
 use crate::ast::{Number, Value};
 use crate::error::{Error, Result, Span};
+use crate::optimization::simd::swar;
+use memchr::memchr;
 
 #[inline]
 pub(super) fn parse_number_token(original_input: &str, span: Span) -> Result<Value> {
     // Extract the number content from the span
     let number_slice = &original_input[span.start..span.end];
+    let bytes = number_slice.as_bytes();
 
-    // DEBUG
-    // eprintln!("DEBUG parse_number_token: number_slice = '{}', span = {:?}", number_slice, span);
-
-    // Check if it has a trailing decimal point BEFORE normalization
-    let has_trailing_decimal = number_slice.ends_with('.');
+    // Numbers are routed by their bytes: plain decimal integers never touch
+    // floating point, radix-prefixed and underscored integers get their own
+    // parser, and everything else is a float.
+    if let Some(int) = parse_decimal_integer(bytes) {
+        return Ok(Value::Number(Number::Integer(int)));
+    }
 
     // Check for alternative number formats (hex, octal, binary)
-    if let Some(parsed_int) = parse_alternative_number_format(number_slice, span)? {
-        return Ok(Value::Number(Number::Integer(parsed_int)));
+    if is_alternative_number_format(bytes) {
+        if let Some(parsed_int) = parse_alternative_number_format(number_slice, span)? {
+            return Ok(Value::Number(Number::Integer(parsed_int)));
+        }
+    }
+
+    parse_float_token(number_slice, span)
+}
+
+/// Parse an optionally signed run of decimal digits without going through
+/// floating point.
+///
+/// Returns `None` for anything else (fractions, exponents, prefixes,
+/// separators) and for values outside the `i64` range, which are left to
+/// the float path.
+#[inline]
+fn parse_decimal_integer(bytes: &[u8]) -> Option<i64> {
+    let (negative, digits) = match bytes.first()? {
+        b'-' => (true, &bytes[1..]),
+        b'+' => (false, &bytes[1..]),
+        _ => (false, bytes),
+    };
+
+    // 19 digits always fit in a u64, so the loop below cannot overflow.
+    if digits.is_empty() || digits.len() > 19 {
+        return None;
+    }
+
+    // Eight digits at a time while they last, then one by one
+    let mut acc = 0u64;
+    let mut tail = digits;
+    while tail.len() >= swar::WORD_SIZE {
+        let word = swar::load(tail, 0);
+        if !swar::all_digits(word) {
+            return None;
+        }
+        acc = acc * 100_000_000 + swar::parse_eight_digits(word) as u64;
+        tail = &tail[swar::WORD_SIZE..];
+    }
+    for &b in tail {
+        let digit = b.wrapping_sub(b'0');
+        if digit > 9 {
+            return None;
+        }
+        acc = acc * 10 + digit as u64;
     }
 
-    // Normalize number format for Rust's parser
-    let normalized_number = if has_trailing_decimal {
-        // Convert "1." to "1.0" for Rust's parser
-        format!("{number_slice}0")
+    if negative {
+        // `i64::MIN` has no positive counterpart, hence the wrapping negation.
+        (acc <= i64::MIN.unsigned_abs()).then(|| (acc as i64).wrapping_neg())
     } else {
-        number_slice.to_string()
+        i64::try_from(acc).ok()
+    }
+}
+
+/// Whether `bytes` uses a radix prefix or underscore separators.
+#[inline]
+fn is_alternative_number_format(bytes: &[u8]) -> bool {
+    let unsigned = match bytes.first() {
+        Some(b'-' | b'+') => &bytes[1..],
+        _ => bytes,
     };
 
-    // Parse the number string
-    let number_value = match normalized_number.parse::<f64>() {
+    matches!(
+        unsigned,
+        [b'0', b'x' | b'X' | b'o' | b'O' | b'b' | b'B', ..]
+    ) || memchr(b'_', bytes).is_some()
+}
+
+/// Parse a number that is not a plain or alternative-format integer.
+fn parse_float_token(number_slice: &str, span: Span) -> Result<Value> {
+    // Check if it has a trailing decimal point
+    let has_trailing_decimal = number_slice.ends_with('.');
+
+    // Parse the number string, converting "1." to "1.0" for Rust's parser
+    let parsed = if has_trailing_decimal {
+        format!("{number_slice}0").parse::<f64>()
+    } else {
+        number_slice.parse::<f64>()
+    };
+
+    let number_value = match parsed {
         Ok(f) => {
             // Check if it's actually an integer and within i64 range
             // Don't treat scientific notation or decimal notation as integers even if they have no fractional part
@@ -173,6 +245,28 @@ mod tests {
         assert_eq!(parse_number_token("-0", Span::new(0, 2)).unwrap(), Value::Number(Number::Integer(0)));
     }
 
+    #[test]
+    fn test_parse_number_token_integer_path() {
+        // Integers above 2^53 must not lose precision through f64
+        let exact = "9007199254740993";
+        assert_eq!(parse_number_token(exact, Span::new(0, exact.len())).unwrap(), Value::Number(Number::Integer(9007199254740993)));
+        let max = "9223372036854775807";
+        assert_eq!(parse_number_token(max, Span::new(0, max.len())).unwrap(), Value::Number(Number::Integer(i64::MAX)));
+        let min = "-9223372036854775808";
+        assert_eq!(parse_number_token(min, Span::new(0, min.len())).unwrap(), Value::Number(Number::Integer(i64::MIN)));
+        assert_eq!(parse_number_token("+7", Span::new(0, 2)).unwrap(), Value::Number(Number::Integer(7)));
+
+        assert_eq!(parse_decimal_integer(b"9223372036854775808"), None);
+        assert_eq!(parse_decimal_integer(b"12a"), None);
+        assert_eq!(parse_decimal_integer(b"-1234567890123"), Some(-1234567890123));
+        assert_eq!(parse_decimal_integer(b"1234567a90123"), None);
+        assert_eq!(parse_decimal_integer(b"1.5"), None);
+        assert_eq!(parse_decimal_integer(b"-"), None);
+        assert!(is_alternative_number_format(b"-0x1f"));
+        assert!(is_alternative_number_format(b"1_000"));
+        assert!(!is_alternative_number_format(b"0.5"));
+    }
+
     #[test]
     fn test_parse_number_token_floats() {
         // Standard floats
@@ -3,10 +3,10 @@
 use crate::ast::{Token, Value};
 use crate::error::{Error, Result};
 use crate::parser::string::parse_string_token;
-use crate::parser::Parser;
+use crate::parser::{Parser, ParserCfg};
 use rustc_hash::FxHashMap;
 
-impl<'a> Parser<'a> {
+impl<'a, C: ParserCfg> Parser<'a, C> {
     pub(super) fn parse_object(&mut self) -> Result<Value> {
         self.check_depth()?;
         self.state.depth += 1;
@@ -45,7 +45,8 @@ impl<'a> Parser<'a> {
             console::log_1(
                 &format!(
                     "DEBUG: current_token = {:?}, allow_unquoted_keys = {}",
-                    self.current_token, self.options.allow_unquoted_keys
+                    self.current_token,
+                    self.allow_unquoted_keys()
                 )
                 .into(),
             );
@@ -60,7 +61,7 @@ impl<'a> Parser<'a> {
                     self.advance()?;
                     k
                 }
-                Some((Token::UnquotedString, span)) if self.options.allow_unquoted_keys => {
+                Some((Token::UnquotedString, span)) if self.allow_unquoted_keys() => {
                     // Extract the unquoted string content from the span
                     let k = self.original_input[span.start..span.end].to_string();
                     self.advance()?;
@@ -182,17 +183,17 @@ impl<'a> Parser<'a> {
                     self.skip_comments_and_newlines()?;
                     // Check for trailing comma
                     if matches!(self.current_token, Some((Token::RightBrace, _)))
-                        && !self.options.allow_trailing_commas
+                        && !self.allow_trailing_commas()
                     {
                         return Err(Error::TrailingComma(self.lexer.position()));
                     }
                 }
-                Some((Token::Newline, _)) if self.options.newline_as_comma => {
+                Some((Token::Newline, _)) if self.newline_as_comma() => {
                     self.advance()?;
                     self.skip_comments_and_newlines()?;
                     // Check for trailing newline
                     if matches!(self.current_token, Some((Token::RightBrace, _)))
-                        && !self.options.allow_trailing_commas
+                        && !self.allow_trailing_commas()
                     {
                         return Err(Error::TrailingComma(self.lexer.position()));
                     }
@@ -201,7 +202,7 @@ impl<'a> Parser<'a> {
                 _ => {
                     // If we have newline_as_comma enabled, try skipping comments and newlines
                     // to see if we find a separator or end token after comments
-                    if self.options.newline_as_comma {
+                    if self.newline_as_comma() {
                         // Save the current state in case we need to restore
                         let _saved_pos = self.lexer.position();
                         let saved_token = self.current_token;
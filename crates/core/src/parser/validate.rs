@@ -0,0 +1,335 @@
+// this_file: src/parser/validate.rs
+
+//! Allocation-free validation of strict JSON.
+//!
+//! [`is_strict_json`] checks a document against RFC 8259 without building
+//! any values. Container nesting is tracked in the bits of a `u64`, numbers
+//! run through a table-driven DFA, and whitespace and string bodies are
+//! skipped with the SIMD scanners from [`crate::optimization::simd`].
+//!
+//! Strict JSON is a subset of what [`parse`](super::parse) accepts, so a
+//! `true` answer settles that a document is valid without parsing it. A
+//! `false` answer only means the full parser has to decide.
+
+use crate::optimization::simd::{find_json_escape, leading_whitespace};
+
+/// Deepest nesting the validator tracks, one bit of the container stack per
+/// level. Deeper documents are left to the parser and its own depth limit.
+const MAX_DEPTH: u32 = u64::BITS;
+
+/// Byte classes of the number DFA; every other byte ends the number.
+const ZERO: u8 = 0;
+const ONE_NINE: u8 = 1;
+const MINUS: u8 = 2;
+const PLUS: u8 = 3;
+const DOT: u8 = 4;
+const EXP: u8 = 5;
+const NOT_NUMBER: u8 = 6;
+
+const NUMBER_CLASS: [u8; 256] = {
+    let mut table = [NOT_NUMBER; 256];
+    table[b'0' as usize] = ZERO;
+    let mut digit = b'1';
+    while digit <= b'9' {
+        table[digit as usize] = ONE_NINE;
+        digit += 1;
+    }
+    table[b'-' as usize] = MINUS;
+    table[b'+' as usize] = PLUS;
+    table[b'.' as usize] = DOT;
+    table[b'e' as usize] = EXP;
+    table[b'E' as usize] = EXP;
+    table
+};
+
+/// Number DFA states: `-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?`.
+const START: u8 = 0;
+const REJECT: u8 = 9;
+
+/// `NUMBER_DFA[state][class]`, states in the order start, minus, zero,
+/// integer, dot, fraction, exponent, exponent sign, exponent digits.
+const NUMBER_DFA: [[u8; 6]; 9] = [
+    [2, 3, 1, REJECT, REJECT, REJECT],
+    [2, 3, REJECT, REJECT, REJECT, REJECT],
+    [REJECT, REJECT, REJECT, REJECT, 4, 6],
+    [3, 3, REJECT, REJECT, 4, 6],
+    [5, 5, REJECT, REJECT, REJECT, REJECT],
+    [5, 5, REJECT, REJECT, REJECT, 6],
+    [8, 8, 7, 7, REJECT, REJECT],
+    [8, 8, REJECT, REJECT, REJECT, REJECT],
+    [8, 8, REJECT, REJECT, REJECT, REJECT],
+];
+
+/// States in which a number may end: zero, integer, fraction, exponent digits.
+const NUMBER_ACCEPT: u16 = 1 << 2 | 1 << 3 | 1 << 5 | 1 << 8;
+
+/// What the validator expects after skipping whitespace.
+#[derive(Clone, Copy)]
+enum Expect {
+    /// Any value
+    Value,
+    /// A value or `]` right after `[`
+    ValueOrEnd,
+    /// A key or `}` right after `{`
+    KeyOrEnd,
+    /// A key after `,` in an object
+    Key,
+    /// The `:` after a key
+    Colon,
+    /// `,` or the end of the open container
+    CommaOrEnd,
+}
+
+/// Whether `input` is strict JSON that the parser accepts.
+///
+/// Returns `false` for anything else, including forgiving syntax, trailing
+/// content and empty input. Documents nested deeper than 64 levels or with
+/// surrogate `\u` escapes are conservatively reported as `false` too.
+///
+/// # Examples
+///
+/// ```
+/// use vexy_json_core::is_strict_json;
+///
+/// assert!(is_strict_json(br#"{"valid": [true, 1.5e3, null]}"#));
+/// assert!(!is_strict_json(b"{valid: true}"));
+/// ```
+pub fn is_strict_json(input: &[u8]) -> bool {
+    let mut pos = 0;
+    // Bit `i` is set when the container at depth `i + 1` is an object
+    let mut objects = 0u64;
+    let mut depth = 0u32;
+    let mut expect = Expect::Value;
+
+    loop {
+        pos += leading_whitespace(&input[pos..]);
+        let Some(&byte) = input.get(pos) else {
+            return false;
+        };
+
+        match expect {
+            Expect::Value | Expect::ValueOrEnd => {
+                if byte == b']' && matches!(expect, Expect::ValueOrEnd) {
+                    depth -= 1;
+                    pos += 1;
+                } else {
+                    match byte {
+                        b'{' | b'[' => {
+                            if depth == MAX_DEPTH {
+                                return false;
+                            }
+                            let is_object = byte == b'{';
+                            objects = objects & !(1 << depth) | (is_object as u64) << depth;
+                            depth += 1;
+                            pos += 1;
+                            expect = if is_object {
+                                Expect::KeyOrEnd
+                            } else {
+                                Expect::ValueOrEnd
+                            };
+                            continue;
+                        }
+                        b'"' => match skip_string(input, pos + 1) {
+                            Some(end) => pos = end,
+                            None => return false,
+                        },
+                        b't' | b'f' | b'n' => {
+                            let literal: &[u8] = match byte {
+                                b't' => b"true",
+                                b'f' => b"false",
+                                _ => b"null",
+                            };
+                            if !input[pos..].starts_with(literal) {
+                                return false;
+                            }
+                            pos += literal.len();
+                        }
+                        b'-' | b'0'..=b'9' => match skip_number(input, pos) {
+                            Some(end) => pos = end,
+                            None => return false,
+                        },
+                        _ => return false,
+                    }
+                }
+            }
+            Expect::KeyOrEnd | Expect::Key => {
+                if byte == b'}' && matches!(expect, Expect::KeyOrEnd) {
+                    depth -= 1;
+                    pos += 1;
+                } else if byte == b'"' {
+                    match skip_string(input, pos + 1) {
+                        Some(end) => pos = end,
+                        None => return false,
+                    }
+                    expect = Expect::Colon;
+                    continue;
+                } else {
+                    return false;
+                }
+            }
+            Expect::Colon => {
+                if byte != b':' {
+                    return false;
+                }
+                pos += 1;
+                expect = Expect::Value;
+                continue;
+            }
+            Expect::CommaOrEnd => {
+                let in_object = objects >> (depth - 1) & 1 == 1;
+                match (byte, in_object) {
+                    (b',', true) => expect = Expect::Key,
+                    (b',', false) => expect = Expect::Value,
+                    (b'}', true) | (b']', false) => depth -= 1,
+                    _ => return false,
+                }
+                pos += 1;
+                if byte == b',' {
+                    continue;
+                }
+            }
+        }
+
+        // A value just ended, either a scalar or a closed container
+        if depth == 0 {
+            pos += leading_whitespace(&input[pos..]);
+            return pos == input.len();
+        }
+        expect = Expect::CommaOrEnd;
+    }
+}
+
+/// Offset just past the closing quote of the string whose body starts at
+/// `pos`, or `None` if the string is invalid.
+#[inline]
+fn skip_string(input: &[u8], mut pos: usize) -> Option<usize> {
+    loop {
+        pos += find_json_escape(&input[pos..])?;
+        match input[pos] {
+            b'"' => return Some(pos + 1),
+            b'\\' => match *input.get(pos + 1)? {
+                b'"' | b'\\' | b'/' | b'b' | b'f' | b'n' | b'r' | b't' => pos += 2,
+                b'u' => {
+                    let hex = input.get(pos + 2..pos + 6)?;
+                    let hex = std::str::from_utf8(hex).ok()?;
+                    if !hex.bytes().all(|b| b.is_ascii_hexdigit()) {
+                        return None;
+                    }
+                    // Surrogates are left to the parser's own pairing rules
+                    let code = u32::from_str_radix(hex, 16).ok()?;
+                    if (0xD800..=0xDFFF).contains(&code) {
+                        return None;
+                    }
+                    pos += 6;
+                }
+                _ => return None,
+            },
+            // A raw control character
+            _ => return None,
+        }
+    }
+}
+
+/// Offset just past the number starting at `pos`, or `None` if it is not a
+/// strict JSON number.
+#[inline]
+fn skip_number(input: &[u8], mut pos: usize) -> Option<usize> {
+    let mut state = START;
+    while let Some(&byte) = input.get(pos) {
+        let class = NUMBER_CLASS[byte as usize];
+        if class == NOT_NUMBER {
+            break;
+        }
+        state = NUMBER_DFA[state as usize][class as usize];
+        if state == REJECT {
+            return None;
+        }
+        pos += 1;
+    }
+    (NUMBER_ACCEPT >> state & 1 == 1).then_some(pos)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_accepts_strict_json() {
+        let cases = [
+            "null",
+            " true ",
+            "false",
+            "0",
+            "-0",
+            "-12.5e+3",
+            "1E9",
+            "0.25",
+            r#""""#,
+            r#""with \"escapes\" \\ \/ \b\f\n\r\t é and ünïcödé""#,
+            "[]",
+            "{}",
+            "[1, [2, [3]], {}]",
+            "{\"a\": {\"b\": [true, false, null]}, \"c\": \"d\"}\n",
+            "\t{ \"k\" : [ ] , \"l\" : { } }\r\n",
+        ];
+        for case in cases {
+            assert!(is_strict_json(case.as_bytes()), "{case:?}");
+        }
+
+        let long = format!("[{}1]", "\"a fairly long string to scan\", ".repeat(50));
+        assert!(is_strict_json(long.as_bytes()));
+    }
+
+    #[test]
+    fn test_rejects_everything_else() {
+        let cases = [
+            "",
+            "   ",
+            "invalid",
+            "tru",
+            "nul",
+            "01",
+            "1.",
+            ".5",
+            "1e",
+            "--1",
+            "+1",
+            "0x10",
+            "[1,]",
+            "[1 2]",
+            "{\"a\" 1}",
+            "{\"a\": 1,}",
+            "{a: 1}",
+            "{'a': 1}",
+            "[1] // comment",
+            "[1] [2]",
+            "[1}",
+            "{\"a\": 1]",
+            "[",
+            "]",
+            "{\"a\"",
+            "\"unterminated",
+            "\"raw\nnewline\"",
+            r#""\x""#,
+            r#""\u12g4""#,
+            r#""\ud83d\ude00""#,
+            "[1]x",
+        ];
+        for case in cases {
+            assert!(!is_strict_json(case.as_bytes()), "{case:?}");
+        }
+    }
+
+    #[test]
+    fn test_depth_limit() {
+        let depth = MAX_DEPTH as usize;
+        let nested = format!("{}{}", "[".repeat(depth), "]".repeat(depth));
+        assert!(is_strict_json(nested.as_bytes()));
+
+        let deeper = format!("[{nested}]");
+        assert!(!is_strict_json(deeper.as_bytes()));
+
+        let objects = format!("{}1{}", "{\"k\":".repeat(depth), "}".repeat(depth));
+        assert!(is_strict_json(objects.as_bytes()));
+    }
+}
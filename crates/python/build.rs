@@ -1,6 +1,9 @@
 use std::process::Command;
 
 fn main() {
+    // Expose the interpreter cfgs (Py_LIMITED_API, PyPy, ...) to the crate
+    pyo3_build_config::use_pyo3_cfgs();
+
     // Get version from git tag or Cargo.toml
     let version = get_version();
 
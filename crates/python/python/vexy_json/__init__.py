@@ -16,15 +16,19 @@ Features:
 - Streaming parser for large files
 - pandas DataFrame integration
 - JSON repair functionality
+- Large inputs are parsed with the GIL released, so threads parse in parallel
 """
 
 from ._vexy_json import (
     parse_json as parse,
+    parse_many,
     parse_with_options_py as parse_with_options,
     is_valid,
     dumps,
     load,
     dump,
+    intern_keys,
+    KeySet,
     loads_numpy,
     loads_numpy_zerocopy,
     loads_dataframe,
@@ -40,11 +44,14 @@ loads = parse
 __all__ = [
     "parse",
     "loads",
+    "parse_many",
     "parse_with_options",
     "is_valid",
     "dumps",
     "load",
     "dump",
+    "intern_keys",
+    "KeySet",
     "loads_numpy",
     "loads_numpy_zerocopy",
     "loads_dataframe",
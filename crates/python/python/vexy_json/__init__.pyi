@@ -6,7 +6,8 @@ Type stubs for vexy_json Python bindings.
 This file provides type hints for the vexy_json Python module, which is implemented in Rust.
 """
 
-from typing import Any, Dict, List, Union, Optional, IO, Iterator, ContextManager
+import os
+from typing import Any, Dict, Iterable, List, Union, Optional, IO, Iterator, ContextManager
 from typing_extensions import Literal
 import numpy as np
 import pandas as pd
@@ -38,6 +39,58 @@ def parse_json(input: str) -> JSONValue:
     """
     ...
 
+def parse_many(inputs: List[str]) -> List[JSONValue]:
+    """
+    Parse a list of JSON strings with default options in a single call.
+    
+    Args:
+        inputs: The JSON strings to parse
+        
+    Returns:
+        The parsed values, in the same order as inputs
+        
+    Raises:
+        ValueError: If any input is not valid JSON
+        TypeError: If an item is not a string
+        
+    Example:
+        >>> import vexy_json
+        >>> vexy_json.parse_many(['{"a": 1}', '[1, 2]', 'true'])
+        [{'a': 1}, [1, 2], True]
+    """
+    ...
+
+class KeySet:
+    """
+    A fixed set of object keys declared with `intern_keys`.
+    """
+
+    def __len__(self) -> int: ...
+    def __contains__(self, key: str) -> bool: ...
+
+def intern_keys(keys: Iterable[str]) -> KeySet:
+    """
+    Declare the object keys of a known schema.
+    
+    Pass the returned set as ``known_keys`` to `parse_with_options`, `load` or
+    `StreamingParser.parse_lines`. Each of these keys then becomes the same
+    interned ``str`` in every parsed dict, so looking it up with a string
+    literal takes the identity fast path, and no key string is created for it.
+    
+    Args:
+        keys: An iterable of key strings
+        
+    Returns:
+        The declared keys
+        
+    Example:
+        >>> import vexy_json
+        >>> keys = vexy_json.intern_keys(["id", "name"])
+        >>> vexy_json.parse_with_options('{"id": 1}', known_keys=keys)
+        {'id': 1}
+    """
+    ...
+
 def parse_with_options_py(
     input: str,
     allow_comments: bool = True,
@@ -51,6 +104,9 @@ def parse_with_options_py(
     max_repairs: int = 100,
     fast_repair: bool = False,
     report_repairs: bool = True,
+    key_cache: bool = True,
+    value_cache: bool = False,
+    known_keys: Optional[KeySet] = None,
 ) -> JSONValue:
     """
     Parse a JSON string with custom options.
@@ -68,6 +124,13 @@ def parse_with_options_py(
         max_repairs: Maximum number of repairs to attempt. Defaults to 100.
         fast_repair: Prefer speed over repair quality. Defaults to False.
         report_repairs: Report all repairs made. Defaults to True.
+        key_cache: Reuse Python strings for repeated object keys. Defaults to True;
+            turn it off for documents whose keys are mostly unique.
+        value_cache: Reuse Python strings for repeated short ASCII string values,
+            such as flags and enum-like fields. Defaults to False. The cache stops
+            itself while values rarely repeat.
+        known_keys: Keys declared with `intern_keys`. Each of them is the same
+            interned string in every parsed dict.
         
     Returns:
         The parsed JSON as a Python object
@@ -126,12 +189,18 @@ def dumps(obj: Any, indent: Optional[int] = None) -> str:
     """
     ...
 
-def load(fp: FileObject, **kwargs: Any) -> JSONValue:
+def load(fp: Union[FileObject, str, "os.PathLike[str]"], **kwargs: Any) -> JSONValue:
     """
-    Load JSON from a file-like object.
+    Load JSON from a file-like object or a file path.
+    
+    A path is read and parsed from Rust with the GIL released, so several
+    threads can load files concurrently. Files of 64 KiB or more are
+    memory-mapped and parsed straight from the page cache, so they must not
+    be modified while they load. The text returned by a file object is
+    parsed where it is, without copying it first.
     
     Args:
-        fp: A file-like object supporting .read()
+        fp: A text or binary file-like object supporting .read(), or a path (str or os.PathLike)
         **kwargs: Additional arguments passed to parse_with_options
         
     Returns:
@@ -139,31 +208,41 @@ def load(fp: FileObject, **kwargs: Any) -> JSONValue:
         
     Raises:
         ValueError: If the content is not valid JSON
+        UnicodeDecodeError: If a binary file or the file at a path does not contain UTF-8
+        OSError: If the file cannot be read
         
     Example:
         >>> import vexy_json
         >>> with open('data.json', 'r') as f:
         ...     result = vexy_json.load(f)
+        >>> result = vexy_json.load('data.json')
     """
     ...
 
-def dump(obj: Any, fp: FileObject, indent: Optional[int] = None) -> None:
+def dump(
+    obj: Any, fp: Union[FileObject, str, "os.PathLike[str]"], indent: Optional[int] = None
+) -> None:
     """
-    Dump JSON to a file-like object.
+    Dump JSON to a file-like object or a file path.
+    
+    Output is written in chunks while it is serialized. A path is opened and
+    written directly from Rust.
     
     Args:
         obj: The Python object to serialize
-        fp: A file-like object supporting .write()
+        fp: A file-like object supporting .write(), or a path
         indent: Number of spaces for indentation
         
     Raises:
         TypeError: If the object cannot be serialized
+        OSError: If the file cannot be written
         
     Example:
         >>> import vexy_json
         >>> data = {'key': 'value'}
         >>> with open('output.json', 'w') as f:
         ...     vexy_json.dump(data, f, indent=2)
+        >>> vexy_json.dump(data, 'output.json', indent=2)
     """
     ...
 
@@ -171,6 +250,10 @@ def loads_numpy(input: str, dtype: Optional[str] = None) -> np.ndarray:
     """
     Parse JSON array directly to NumPy array (if NumPy is available).
     
+    Flat numeric arrays with a dtype of ``float64`` (the default),
+    ``float32``, ``int64``, ``int32`` or ``int16`` are parsed straight into
+    that type.
+    
     Args:
         input: The JSON array string to parse
         dtype: NumPy dtype for the array. Defaults to auto-detection.
@@ -194,6 +277,12 @@ def loads_numpy_zerocopy(input: str, dtype: Optional[str] = None) -> np.ndarray:
     """
     Parse JSON array with zero-copy optimization for numeric data.
     
+    Flat numeric arrays are parsed in one pass into memory that NumPy wraps
+    without copying. The result is read-only; call ``.copy()`` for a
+    writable array. With a ``dtype`` of ``float64``, ``float32``, ``int64``,
+    ``int32`` or ``int16`` the numbers are parsed straight into that type and
+    wrapped the same way; other dtypes are converted by NumPy.
+    
     Args:
         input: The JSON array string to parse
         dtype: Target dtype for the array
@@ -211,6 +300,11 @@ def loads_dataframe(input: str, orient: str = "records") -> pd.DataFrame:
     """
     Convert JSON object to pandas DataFrame (if pandas is available).
     
+    An array of records that all share the same keys is split into columns
+    in Rust, in the key order of the first record, and numeric columns reach
+    pandas as typed NumPy arrays. Any other input is passed to
+    ``pandas.DataFrame`` as parsed.
+    
     Args:
         input: The JSON string to parse (should be an object or array of objects)
         orient: DataFrame orientation. Defaults to 'records'.
@@ -303,12 +397,20 @@ class StreamingParser:
         """
         ...
     
-    def parse_lines(self, fp: FileObject) -> Iterator[JSONValue]:
+    def parse_lines(
+        self, fp: FileObject, chunk_size: int = 1 << 20, known_keys: Optional[KeySet] = None
+    ) -> Iterator[JSONValue]:
         """
         Parse lines from a file as individual JSON objects (NDJSON format).
         
+        The file is read in chunks and every complete line of a chunk is
+        parsed in one pass. Pass a small ``chunk_size`` for interactive
+        streams that should yield each line as soon as it arrives.
+        
         Args:
-            fp: A file-like object supporting .readline()
+            fp: A file-like object supporting .read()
+            chunk_size: Characters to read at a time. Defaults to 1 MiB.
+            known_keys: Keys declared with `intern_keys`, shared by every record
             
         Returns:
             Iterator of parsed JSON objects
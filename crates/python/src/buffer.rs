@@ -0,0 +1,171 @@
+// this_file: crates/python/src/buffer.rs
+
+//! Rust-owned numeric buffers exposed through the Python buffer protocol.
+//!
+//! Numeric arrays are parsed straight into a `Vec<i64>` or `Vec<f64>` and
+//! handed to `numpy.frombuffer`, which wraps the memory without copying and
+//! keeps the [`NumericBuffer`] alive as the array's `base`. This avoids
+//! building a Python list of floats just so NumPy can convert it again.
+//!
+//! When the caller names a dtype, [`typed_parser`] picks a parser
+//! specialized for its element type, so the numbers are converted while
+//! they are parsed instead of by NumPy afterwards.
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::PyBufferError;
+use pyo3::ffi;
+use pyo3::prelude::*;
+use std::os::raw::{c_int, c_void};
+use vexy_json_core::{parse_number_array_as, NumberArray};
+
+/// Parsed numbers, stored in the element type NumPy will see.
+pub(crate) enum NumericData {
+    /// Every element was an integer
+    I64(Vec<i64>),
+    /// At least one element was a float
+    F64(Vec<f64>),
+    /// Integers parsed for an `int32` array
+    I32(Vec<i32>),
+    /// Integers parsed for an `int16` array
+    I16(Vec<i16>),
+    /// Numbers parsed for a `float32` array
+    F32(Vec<f32>),
+}
+
+impl From<NumberArray> for NumericData {
+    fn from(numbers: NumberArray) -> Self {
+        match numbers {
+            NumberArray::I64(v) => NumericData::I64(v),
+            NumberArray::F64(v) => NumericData::F64(v),
+        }
+    }
+}
+
+impl NumericData {
+    /// NumPy dtype matching the stored elements.
+    pub(crate) fn dtype(&self) -> &'static str {
+        match self {
+            NumericData::I64(_) => "int64",
+            NumericData::F64(_) => "float64",
+            NumericData::I32(_) => "int32",
+            NumericData::I16(_) => "int16",
+            NumericData::F32(_) => "float32",
+        }
+    }
+
+    fn as_bytes_ptr(&self) -> (*const c_void, usize) {
+        fn bytes<T>(v: &[T]) -> (*const c_void, usize) {
+            (v.as_ptr().cast(), std::mem::size_of_val(v))
+        }
+
+        match self {
+            NumericData::I64(v) => bytes(v),
+            NumericData::F64(v) => bytes(v),
+            NumericData::I32(v) => bytes(v),
+            NumericData::I16(v) => bytes(v),
+            NumericData::F32(v) => bytes(v),
+        }
+    }
+
+    /// Wrap the numbers in a read-only NumPy array without copying them. The
+    /// array's `base` is a [`NumericBuffer`] that keeps the memory alive.
+    pub(crate) fn into_array<'py>(
+        self,
+        py: Python<'py>,
+        numpy: &Bound<'py, PyModule>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let dtype = self.dtype();
+        let buffer = Py::new(py, NumericBuffer::new(self))?;
+        numpy.call_method1("frombuffer", (buffer, dtype))
+    }
+
+    /// Copy the numbers into a new NumPy array that NumPy owns, so unlike a
+    /// [`NumericBuffer`] view it is writable.
+    pub(crate) fn to_owned_array<'py>(
+        &self,
+        py: Python<'py>,
+        numpy: &Bound<'py, PyModule>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        fn fill<'py, T: Element>(
+            py: Python<'py>,
+            numpy: &Bound<'py, PyModule>,
+            dtype: &str,
+            v: &[T],
+        ) -> PyResult<Bound<'py, PyAny>> {
+            let array = numpy.call_method1("empty", (v.len(), dtype))?;
+            PyBuffer::<T>::get(&array)?.copy_from_slice(py, v)?;
+            Ok(array)
+        }
+
+        let dtype = self.dtype();
+        match self {
+            NumericData::I64(v) => fill(py, numpy, dtype, v),
+            NumericData::F64(v) => fill(py, numpy, dtype, v),
+            NumericData::I32(v) => fill(py, numpy, dtype, v),
+            NumericData::I16(v) => fill(py, numpy, dtype, v),
+            NumericData::F32(v) => fill(py, numpy, dtype, v),
+        }
+    }
+}
+
+/// A parser that reads a flat numeric array straight into the element type
+/// of `dtype`, if the dtype has one.
+///
+/// The parser returns `None` for input it does not handle (anything but a
+/// flat array of numbers, floats for an integer dtype, integers out of
+/// range), which is then left to NumPy's own conversion rules.
+pub(crate) fn typed_parser(dtype: &str) -> Option<fn(&str) -> Option<NumericData>> {
+    let parse: fn(&str) -> Option<NumericData> = match dtype {
+        "float64" => |input| parse_number_array_as(input).map(NumericData::F64),
+        "float32" => |input| parse_number_array_as(input).map(NumericData::F32),
+        "int64" => |input| parse_number_array_as(input).map(NumericData::I64),
+        "int32" => |input| parse_number_array_as(input).map(NumericData::I32),
+        "int16" => |input| parse_number_array_as(input).map(NumericData::I16),
+        _ => return None,
+    };
+    Some(parse)
+}
+
+/// Owner of the memory behind arrays returned by `loads_numpy_zerocopy`.
+#[pyclass(frozen, module = "vexy_json._vexy_json")]
+pub(crate) struct NumericBuffer {
+    data: NumericData,
+}
+
+impl NumericBuffer {
+    pub(crate) fn new(data: NumericData) -> Self {
+        NumericBuffer { data }
+    }
+}
+
+#[pymethods]
+impl NumericBuffer {
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+
+        let (ptr, len) = slf.get().data.as_bytes_ptr();
+        // Exported as read-only bytes; `numpy.frombuffer` applies the dtype.
+        // Every array made from this buffer shares its memory, so none of
+        // them may write to it.
+        if ffi::PyBuffer_FillInfo(
+            view,
+            slf.as_ptr(),
+            ptr as *mut c_void,
+            len as ffi::Py_ssize_t,
+            1,
+            flags,
+        ) == -1
+        {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        Ok(())
+    }
+
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {}
+}
@@ -0,0 +1,148 @@
+// this_file: crates/python/src/frame.rs
+
+//! Column-oriented conversion of record arrays for `loads_dataframe`.
+//!
+//! Handing pandas a list of row dicts makes it walk every row in Python to
+//! find the columns and infer their types. When every record in an array has
+//! the same keys, the records are split into columns in Rust instead: integer
+//! and float columns become NumPy arrays backed by a [`NumericBuffer`], other
+//! columns become one list each, and pandas receives a dict of columns.
+
+use crate::borrowed_to_python;
+use crate::buffer::NumericData;
+use crate::key_cache::{key_to_python, StringCaches};
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+use rustc_hash::FxHashMap;
+use vexy_json_core::ast::BorrowedValue;
+
+/// Values of one column, typed as tightly as its contents allow.
+pub(crate) enum Column<'v, 'a> {
+    /// Every value was an integer
+    I64(Vec<i64>),
+    /// Every value was a number and at least one was a float
+    F64(Vec<f64>),
+    /// Anything else; pandas infers the dtype
+    Values(Vec<&'v BorrowedValue<'a>>),
+}
+
+impl<'v, 'a> Column<'v, 'a> {
+    fn from_cells(cells: Vec<&'v BorrowedValue<'a>>) -> Self {
+        if cells.iter().all(|v| matches!(v, BorrowedValue::I64(_))) {
+            return Column::I64(
+                cells
+                    .iter()
+                    .map(|v| match v {
+                        BorrowedValue::I64(i) => *i,
+                        _ => unreachable!(),
+                    })
+                    .collect(),
+            );
+        }
+        let mut floats = Vec::with_capacity(cells.len());
+        for cell in &cells {
+            match cell {
+                BorrowedValue::I64(i) => floats.push(*i as f64),
+                BorrowedValue::F64(f) => floats.push(*f),
+                _ => return Column::Values(cells),
+            }
+        }
+        Column::F64(floats)
+    }
+}
+
+/// Records split into named columns, in the key order of the first record.
+pub(crate) struct Columns<'v, 'a> {
+    names: Vec<&'v str>,
+    columns: Vec<Column<'v, 'a>>,
+}
+
+/// Split an array of records into columns.
+///
+/// Returns `None` unless `value` is a non-empty array of objects that all
+/// have exactly the keys of the first one, each once. Empty records and any
+/// other input are left to pandas' own row handling.
+pub(crate) fn split_records<'v, 'a>(value: &'v BorrowedValue<'a>) -> Option<Columns<'v, 'a>> {
+    let BorrowedValue::Array(rows) = value else {
+        return None;
+    };
+    let Some(BorrowedValue::Object(first)) = rows.first() else {
+        return None;
+    };
+    if first.is_empty() {
+        return None;
+    }
+
+    let names: Vec<&str> = first.iter().map(|(k, _)| k.as_ref()).collect();
+    let mut index = FxHashMap::with_capacity_and_hasher(names.len(), Default::default());
+    for (i, name) in names.iter().enumerate() {
+        if index.insert(*name, i).is_some() {
+            return None;
+        }
+    }
+
+    let mut cells: Vec<Vec<&BorrowedValue>> = (0..names.len())
+        .map(|_| Vec::with_capacity(rows.len()))
+        .collect();
+    for (row, record) in rows.iter().enumerate() {
+        let BorrowedValue::Object(members) = record else {
+            return None;
+        };
+        if members.len() != names.len() {
+            return None;
+        }
+        for (i, (key, value)) in members.iter().enumerate() {
+            // Records usually list their keys in the same order
+            let column = if names[i] == key.as_ref() {
+                i
+            } else {
+                *index.get(key.as_ref())?
+            };
+            // A column that already has a value for this row means a
+            // repeated key, and with it some other key is missing
+            if cells[column].len() != row {
+                return None;
+            }
+            cells[column].push(value);
+        }
+    }
+
+    Some(Columns {
+        names,
+        columns: cells.into_iter().map(Column::from_cells).collect(),
+    })
+}
+
+impl Columns<'_, '_> {
+    /// Build the DataFrame from the columns.
+    pub(crate) fn into_dataframe<'py>(
+        self,
+        py: Python<'py>,
+        numpy: &Bound<'py, PyModule>,
+        pandas: &Bound<'py, PyModule>,
+    ) -> PyResult<PyObject> {
+        let data = PyDict::new(py);
+        for (name, column) in self.names.into_iter().zip(self.columns) {
+            let values = match column {
+                Column::I64(v) => NumericData::I64(v).into_array(py, numpy)?,
+                Column::F64(v) => NumericData::F64(v).into_array(py, numpy)?,
+                Column::Values(cells) => {
+                    let items = cells
+                        .into_iter()
+                        .map(|cell| borrowed_to_python(py, cell, StringCaches::KEYS))
+                        .collect::<PyResult<Vec<_>>>()?;
+                    PyList::new(py, items)?.into_any()
+                }
+            };
+            data.set_item(key_to_python(py, name)?, values)?;
+        }
+
+        // The numeric arrays are read-only views of Rust memory; copying
+        // them into pandas' own blocks keeps the frame writable
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("copy", true)?;
+        Ok(pandas
+            .call_method("DataFrame", (data,), Some(&kwargs))?
+            .unbind())
+    }
+}
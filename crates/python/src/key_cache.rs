@@ -0,0 +1,335 @@
+// this_file: crates/python/src/key_cache.rs
+
+//! Caches of Python strings for repeated object keys and short values.
+//!
+//! Real-world documents repeat the same handful of keys many times, and
+//! creating a fresh `str` for every occurrence dominates object-construction
+//! time. Short ASCII keys are looked up in a thread-local, direct-mapped
+//! table (as orjson does) and the cached string is reused by bumping its
+//! reference count.
+//!
+//! String values repeat less reliably: flags and enum-like fields do, ids
+//! and free text do not. The smaller, opt-in value cache therefore keeps a
+//! moving average of its hit rate and stops looking values up while that
+//! stays low, trying again after a while.
+//!
+//! Like msgspec, the caches are emptied every few full garbage collections
+//! so that strings from long-finished workloads do not stay alive forever.
+//! The collection only bumps a global generation; each thread's tables
+//! notice the change on their next lookup and clear themselves, so threads
+//! other than the collecting one are covered too.
+//!
+//! Callers that know their schema can also declare the keys up front with
+//! `intern_keys`, in the spirit of simd-json's known keys. Every dict then
+//! holds the very same interned string for such a key, whatever the caches
+//! do, so lookups with string literals succeed on the identity check.
+
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyString};
+use rustc_hash::{FxHashMap, FxHasher};
+use std::cell::RefCell;
+use std::hash::Hasher;
+use std::sync::atomic::{AtomicU32, Ordering};
+
+/// Number of key cache slots; must be a power of two.
+const CACHE_SIZE: usize = 2048;
+
+/// Longer keys are rarely repeated and are not cached.
+const MAX_KEY_LEN: usize = 64;
+
+/// Number of value cache slots; must be a power of two.
+const VALUE_CACHE_SIZE: usize = 256;
+
+/// Longer values are rarely repeated and are not cached.
+const MAX_VALUE_LEN: usize = 32;
+
+/// Fixed-point 1.0 for the value cache hit rate.
+const RATE_ONE: i32 = 1 << 16;
+
+/// Below this hit rate the value cache costs more than it saves.
+const MIN_HIT_RATE: i32 = RATE_ONE / 4;
+
+/// Each lookup moves the hit rate average by 1/32 of the difference.
+const RATE_SHIFT: u32 = 5;
+
+/// Values converted without the cache before a disabled cache tries again.
+const RETRY_AFTER: u32 = 4096;
+
+/// The caches are cleared after this many full (generation 2) collections.
+const CLEAR_EVERY_FULL_GCS: u32 = 10;
+
+/// Which string caches a conversion to Python objects uses.
+#[derive(Clone, Copy)]
+pub(crate) struct StringCaches<'k> {
+    /// Reuse strings for repeated object keys
+    pub(crate) keys: bool,
+    /// Reuse strings for repeated short string values
+    pub(crate) values: bool,
+    /// Keys declared with `intern_keys`, checked before the key cache
+    pub(crate) known: Option<&'k KeySet>,
+}
+
+impl StringCaches<'_> {
+    /// Keys only, the default for every entry point.
+    pub(crate) const KEYS: StringCaches<'static> = StringCaches {
+        keys: true,
+        values: false,
+        known: None,
+    };
+
+    /// Convert an object key, through the known keys and the key cache if
+    /// enabled.
+    pub(crate) fn key<'py>(self, py: Python<'py>, key: &str) -> PyResult<Bound<'py, PyString>> {
+        if let Some(string) = self.known.and_then(|known| known.keys.get(key)) {
+            return Ok(string.bind(py).clone());
+        }
+        if self.keys {
+            key_to_python(py, key)
+        } else {
+            new_string(py, key)
+        }
+    }
+
+    /// Convert a string value, through the value cache if enabled.
+    pub(crate) fn value<'py>(self, py: Python<'py>, value: &str) -> PyResult<Bound<'py, PyString>> {
+        if self.values {
+            string_value_to_python(py, value)
+        } else {
+            new_string(py, value)
+        }
+    }
+}
+
+/// A fixed set of object keys whose Python strings are shared by every
+/// parse that is given the set.
+#[pyclass(frozen, module = "vexy_json._vexy_json")]
+pub(crate) struct KeySet {
+    keys: FxHashMap<Box<str>, Py<PyString>>,
+}
+
+#[pymethods]
+impl KeySet {
+    fn __len__(&self) -> usize {
+        self.keys.len()
+    }
+
+    fn __contains__(&self, key: &str) -> bool {
+        self.keys.contains_key(key)
+    }
+}
+
+/// Declare the object keys of a known schema
+///
+/// Pass the returned set as `known_keys` to `parse_with_options`, `load` or
+/// `StreamingParser.parse_lines`. Each of these keys then becomes the same
+/// interned `str` in every parsed dict, so looking it up with a string
+/// literal takes the identity fast path, and no key string is created for it.
+///
+/// Args:
+///     keys: An iterable of key strings
+///
+/// Returns:
+///     KeySet: The declared keys
+///
+/// Example:
+///     >>> import vexy_json
+///     >>> keys = vexy_json.intern_keys(["id", "name"])
+///     >>> vexy_json.parse_with_options('{"id": 1}', known_keys=keys)
+///     {'id': 1}
+#[pyfunction]
+pub(crate) fn intern_keys(keys: &Bound<'_, PyAny>) -> PyResult<KeySet> {
+    let mut set = FxHashMap::default();
+    for key in keys.try_iter()? {
+        let key = key?;
+        let text = key.downcast::<PyString>()?.to_str()?;
+        set.insert(text.into(), PyString::intern(key.py(), text).unbind());
+    }
+    Ok(KeySet { keys: set })
+}
+
+struct CachedString {
+    hash: u64,
+    text: Box<str>,
+    string: Py<PyString>,
+}
+
+/// A direct-mapped table of Python strings.
+struct StringTable {
+    slots: Vec<Option<CachedString>>,
+    /// Value of [`CLEAR_GENERATION`] when the table was last cleared
+    generation: u32,
+}
+
+impl StringTable {
+    fn new(size: usize) -> Self {
+        StringTable {
+            slots: (0..size).map(|_| None).collect(),
+            generation: CLEAR_GENERATION.load(Ordering::Relaxed),
+        }
+    }
+
+    /// Look `text` up, inserting it on a miss. Also returns whether it hit.
+    fn get<'py>(&mut self, py: Python<'py>, text: &str) -> PyResult<(Bound<'py, PyString>, bool)> {
+        let mut hasher = FxHasher::default();
+        hasher.write(text.as_bytes());
+        let hash = hasher.finish();
+        let slot = hash as usize & (self.slots.len() - 1);
+
+        let generation = CLEAR_GENERATION.load(Ordering::Relaxed);
+        if generation != self.generation {
+            self.clear();
+            self.generation = generation;
+        }
+
+        if let Some(entry) = &self.slots[slot] {
+            if entry.hash == hash && &*entry.text == text {
+                return Ok((entry.string.bind(py).clone(), true));
+            }
+        }
+
+        // Miss or collision: the newest string takes over the slot.
+        let string = new_string(py, text)?;
+        self.slots[slot] = Some(CachedString {
+            hash,
+            text: text.into(),
+            string: string.clone().unbind(),
+        });
+        Ok((string, false))
+    }
+
+    fn clear(&mut self) {
+        self.slots.iter_mut().for_each(|slot| *slot = None);
+    }
+}
+
+/// The value table with its moving average hit rate.
+struct ValueCache {
+    table: StringTable,
+    hit_rate: i32,
+    skipped: u32,
+}
+
+impl ValueCache {
+    fn new() -> Self {
+        ValueCache {
+            table: StringTable::new(VALUE_CACHE_SIZE),
+            // Start undecided so a cold cache has time to fill up
+            hit_rate: RATE_ONE / 2,
+            skipped: 0,
+        }
+    }
+}
+
+thread_local! {
+    static KEY_CACHE: RefCell<StringTable> = RefCell::new(StringTable::new(CACHE_SIZE));
+
+    static VALUE_CACHE: RefCell<ValueCache> = RefCell::new(ValueCache::new());
+}
+
+/// Full collections since the caches were last cleared.
+static FULL_GCS: AtomicU32 = AtomicU32::new(0);
+
+/// Bumped to tell every thread's tables to clear themselves.
+static CLEAR_GENERATION: AtomicU32 = AtomicU32::new(0);
+
+/// Create a Python string from `text`.
+///
+/// ASCII text is copied straight into a new compact ASCII string, which
+/// skips CPython's UTF-8 decoder. Empty and single-character strings go
+/// through `PyString::new` so they still come from CPython's singletons.
+/// A failed allocation is returned as the `MemoryError` CPython set.
+#[cfg(not(any(Py_LIMITED_API, PyPy, GraalPy)))]
+pub(crate) fn new_string<'py>(py: Python<'py>, text: &str) -> PyResult<Bound<'py, PyString>> {
+    use pyo3::ffi;
+
+    if text.len() < 2 || !text.is_ascii() {
+        return Ok(PyString::new(py, text));
+    }
+    // SAFETY: `PyUnicode_New` with a maximum character of 127 returns a new
+    // compact ASCII string with room for `text.len()` bytes, or null with an
+    // exception set. ASCII bytes are exactly its one-byte characters, and
+    // the string is filled before anything else can see it.
+    unsafe {
+        let string = Bound::from_owned_ptr_or_err(
+            py,
+            ffi::PyUnicode_New(text.len() as ffi::Py_ssize_t, 127),
+        )?;
+        std::ptr::copy_nonoverlapping(
+            text.as_ptr(),
+            ffi::PyUnicode_1BYTE_DATA(string.as_ptr()),
+            text.len(),
+        );
+        Ok(string.downcast_into_unchecked())
+    }
+}
+
+/// The limited API and other interpreters only offer the decoding path.
+#[cfg(any(Py_LIMITED_API, PyPy, GraalPy))]
+pub(crate) fn new_string<'py>(py: Python<'py>, text: &str) -> PyResult<Bound<'py, PyString>> {
+    Ok(PyString::new(py, text))
+}
+
+/// Convert an object key to a Python string, reusing a cached one if possible.
+pub(crate) fn key_to_python<'py>(py: Python<'py>, key: &str) -> PyResult<Bound<'py, PyString>> {
+    if key.len() > MAX_KEY_LEN || !key.is_ascii() {
+        return new_string(py, key);
+    }
+    KEY_CACHE.with(|cache| Ok(cache.borrow_mut().get(py, key)?.0))
+}
+
+/// Convert a string value to a Python string, reusing a cached one while
+/// values keep repeating.
+fn string_value_to_python<'py>(py: Python<'py>, value: &str) -> PyResult<Bound<'py, PyString>> {
+    if value.len() > MAX_VALUE_LEN || !value.is_ascii() {
+        return new_string(py, value);
+    }
+
+    VALUE_CACHE.with(|cache| {
+        let mut cache = cache.borrow_mut();
+        if cache.hit_rate < MIN_HIT_RATE {
+            cache.skipped += 1;
+            if cache.skipped < RETRY_AFTER {
+                return new_string(py, value);
+            }
+            cache.skipped = 0;
+            cache.hit_rate = RATE_ONE / 2;
+        }
+
+        let (string, hit) = cache.table.get(py, value)?;
+        cache.hit_rate += (i32::from(hit) * RATE_ONE - cache.hit_rate) >> RATE_SHIFT;
+        Ok(string)
+    })
+}
+
+/// Hook for `gc.callbacks` that clears the caches of every thread
+/// periodically.
+#[pyfunction]
+fn collect_key_cache(phase: &str, info: &Bound<'_, PyDict>) -> PyResult<()> {
+    if phase != "stop" {
+        return Ok(());
+    }
+    let generation = info.get_item("generation")?;
+    if generation.map(|g| g.extract::<u32>()).transpose()? != Some(2) {
+        return Ok(());
+    }
+
+    if FULL_GCS.fetch_add(1, Ordering::Relaxed) + 1 < CLEAR_EVERY_FULL_GCS {
+        return Ok(());
+    }
+    FULL_GCS.store(0, Ordering::Relaxed);
+    // The tables belong to other threads too, and a collection can start
+    // while a string is being converted, so they clear themselves on their
+    // next lookup instead
+    CLEAR_GENERATION.fetch_add(1, Ordering::Relaxed);
+    Ok(())
+}
+
+/// Register the cache-clearing hook with the garbage collector.
+pub(crate) fn register_gc_hook(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    let hook = wrap_pyfunction!(collect_key_cache, m)?;
+    m.py()
+        .import("gc")?
+        .getattr("callbacks")?
+        .call_method1("append", (hook,))?;
+    Ok(())
+}
@@ -6,15 +6,137 @@
 //! allowing Python users to parse forgiving JSON with the same capabilities
 //! as the Rust library.
 
+use bumpalo::Bump;
+use memmap2::Mmap;
 use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::marker::Ungil;
 use pyo3::prelude::*;
-use pyo3::types::{PyBool, PyDict, PyList};
+use pyo3::types::{PyBool, PyBytes, PyDict, PyFloat, PyInt, PyList, PyString};
 use rustc_hash::FxHashMap;
-use vexy_json_core::ast::Value;
-use vexy_json_core::{parse, parse_with_options, ParserOptions};
+use std::cell::Cell;
+use std::collections::VecDeque;
+use std::fmt::Write;
+use std::fs::File;
+use std::io::{Read as _, Write as _};
+use std::path::{Path, PathBuf};
+use vexy_json_core::ast::{BorrowedValue, Value};
+use vexy_json_core::optimization::simd::{escape_json_string, init_dispatch};
+use vexy_json_core::{
+    is_strict_json, parse, parse_borrowed, parse_borrowed_in, parse_with_options, ParserOptions,
+};
+
+mod buffer;
+mod frame;
+mod key_cache;
+
+use buffer::{typed_parser, NumericData};
+use frame::split_records;
+use key_cache::{intern_keys, new_string, register_gc_hook, KeySet, StringCaches};
+
+thread_local! {
+    /// Arena for escaped object keys, reset before every parse on this thread.
+    static KEY_ARENA: Cell<Bump> = Cell::new(Bump::new());
+}
+
+/// A key arena that grew beyond this many bytes is freed after its parse
+/// instead of being kept for the next one on the thread.
+const ARENA_RETAIN_MAX: usize = 1 << 20;
+
+/// Run `f` with the thread's [`KEY_ARENA`], reset for it.
+///
+/// The arena is taken out for the duration of the call: converting can run
+/// arbitrary Python code (e.g. finalizers on garbage collection) that parses
+/// again, and such a nested call simply starts with an empty arena.
+/// Resetting keeps the arena's largest chunk, so after a document with
+/// unusually many escaped keys the arena is dropped rather than put back.
+fn with_key_arena<R>(f: impl FnOnce(&Bump) -> R) -> R {
+    let mut arena = KEY_ARENA.take();
+    arena.reset();
+    let result = f(&arena);
+    if arena.allocated_bytes() <= ARENA_RETAIN_MAX {
+        KEY_ARENA.set(arena);
+    }
+    result
+}
+
+/// Inputs at least this long are parsed, and outputs estimated at least this
+/// long serialized, with the GIL released. For shorter ones the release and
+/// reacquire round trip costs more than it frees up.
+const RELEASE_GIL_MIN_LEN: usize = 4 * 1024;
+
+/// Run `f` with the GIL released when `len` bytes of input make it worthwhile.
+fn allow_threads_for<T, F>(py: Python, len: usize, f: F) -> T
+where
+    T: Ungil,
+    F: Ungil + FnOnce() -> T,
+{
+    if len >= RELEASE_GIL_MIN_LEN {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
+/// Lets the thread's key arena into `allow_threads`.
+///
+/// `Bump` is not `Sync`, so `&Bump` is not `Send`. `allow_threads` runs its
+/// closure on the calling thread, though, so the arena is never actually
+/// shared between threads.
+struct ArenaRef<'a>(&'a Bump);
+
+unsafe impl Send for ArenaRef<'_> {}
+
+impl<'a> ArenaRef<'a> {
+    fn get(&self) -> &'a Bump {
+        self.0
+    }
+}
+
+/// Parse `input` with default options and convert it to Python objects.
+///
+/// The document is parsed without the GIL; only the conversion to Python
+/// objects holds it. Keys are interned in the thread's key arena (see
+/// [`with_key_arena`]).
+fn parse_to_python(
+    py: Python,
+    input: &str,
+    caches: StringCaches<'_>,
+) -> vexy_json_core::Result<PyResult<PyObject>> {
+    with_key_arena(|arena| {
+        let shared = ArenaRef(arena);
+        allow_threads_for(py, input.len(), move || {
+            parse_borrowed_in(input, shared.get())
+        })
+        .map(|value| borrowed_to_python(py, &value, caches))
+    })
+}
+
+/// An empty dict with room for `len` items, so filling it never resizes.
+#[cfg(not(any(Py_LIMITED_API, PyPy, GraalPy)))]
+fn dict_with_capacity(py: Python<'_>, len: usize) -> PyResult<Bound<'_, PyDict>> {
+    use pyo3::ffi;
+
+    // SAFETY: `_PyDict_NewPresized` returns a new reference to a dict, or
+    // null with an exception set.
+    unsafe {
+        Ok(
+            Bound::from_owned_ptr_or_err(py, ffi::_PyDict_NewPresized(len as ffi::Py_ssize_t))?
+                .downcast_into_unchecked(),
+        )
+    }
+}
+
+/// The limited API and other interpreters have no presized constructor.
+#[cfg(any(Py_LIMITED_API, PyPy, GraalPy))]
+fn dict_with_capacity(py: Python<'_>, _len: usize) -> PyResult<Bound<'_, PyDict>> {
+    Ok(PyDict::new(py))
+}
 
 /// Convert a vexy_json Value to a Python object
-fn value_to_python(py: Python, value: &Value) -> PyResult<PyObject> {
+///
+/// `caches` selects whether keys and short string values come from the
+/// shared string caches; fresh strings are cheaper when they rarely repeat.
+fn value_to_python(py: Python, value: &Value, caches: StringCaches<'_>) -> PyResult<PyObject> {
     match value {
         Value::Null => Ok(py.None()),
         Value::Bool(b) => Ok(PyBool::new(py, *b).as_any().clone().unbind()),
@@ -22,20 +144,52 @@ fn value_to_python(py: Python, value: &Value) -> PyResult<PyObject> {
             vexy_json_core::ast::Number::Integer(i) => Ok((*i).into_pyobject(py)?.unbind().into()),
             vexy_json_core::ast::Number::Float(f) => Ok((*f).into_pyobject(py)?.unbind().into()),
         },
-        Value::String(s) => Ok(s.as_str().into_pyobject(py)?.unbind().into()),
+        Value::String(s) => Ok(caches.value(py, s)?.into_any().unbind()),
         Value::Array(arr) => {
-            let py_list = PyList::empty(py);
-            for item in arr {
-                let py_item = value_to_python(py, item)?;
-                py_list.append(py_item)?;
-            }
-            Ok(py_list.as_any().clone().unbind())
+            // Converting first lets the list be allocated at its final size
+            let items = arr
+                .iter()
+                .map(|item| value_to_python(py, item, caches))
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyList::new(py, items)?.into_any().unbind())
         }
         Value::Object(obj) => {
-            let py_dict = PyDict::new(py);
+            let py_dict = dict_with_capacity(py, obj.len())?;
             for (key, value) in obj {
-                let py_value = value_to_python(py, value)?;
-                py_dict.set_item(key, py_value)?;
+                let py_value = value_to_python(py, value, caches)?;
+                py_dict.set_item(caches.key(py, key)?, py_value)?;
+            }
+            Ok(py_dict.as_any().clone().unbind())
+        }
+    }
+}
+
+/// Convert a borrowed vexy_json value to a Python object
+fn borrowed_to_python(
+    py: Python,
+    value: &BorrowedValue<'_>,
+    caches: StringCaches<'_>,
+) -> PyResult<PyObject> {
+    match value {
+        BorrowedValue::Null => Ok(py.None()),
+        BorrowedValue::Bool(b) => Ok(PyBool::new(py, *b).as_any().clone().unbind()),
+        BorrowedValue::I64(i) => Ok((*i).into_pyobject(py)?.unbind().into()),
+        BorrowedValue::F64(f) => Ok((*f).into_pyobject(py)?.unbind().into()),
+        BorrowedValue::Str(s) => Ok(caches.value(py, s)?.into_any().unbind()),
+        BorrowedValue::Array(items) => {
+            // Converting first lets the list be allocated at its final size
+            let items = items
+                .iter()
+                .map(|item| borrowed_to_python(py, item, caches))
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyList::new(py, items)?.into_any().unbind())
+        }
+        BorrowedValue::Object(members) => {
+            // Repeated keys leave some room unused, which is harmless
+            let py_dict = dict_with_capacity(py, members.len())?;
+            for (key, value) in members {
+                let py_value = borrowed_to_python(py, value, caches)?;
+                py_dict.set_item(caches.key(py, key)?, py_value)?;
             }
             Ok(py_dict.as_any().clone().unbind())
         }
@@ -43,32 +197,66 @@ fn value_to_python(py: Python, value: &Value) -> PyResult<PyObject> {
 }
 
 /// Convert a Python object to a vexy_json Value
+///
+/// `size` accumulates a rough estimate of the serialized length (string
+/// bytes plus one per node), so `dumps` can decide up front whether
+/// releasing the GIL is worth it.
 #[allow(clippy::only_used_in_recursion)]
-fn python_to_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+fn python_to_value(py: Python, obj: &Bound<'_, PyAny>, size: &mut usize) -> PyResult<Value> {
+    *size += 1;
+    // The built-in types are matched by exact type, a pointer compare each,
+    // so that neither they nor unsupported objects go through the chain of
+    // failed extractions below, each of which builds an exception.
     if obj.is_none() {
-        Ok(Value::Null)
-    } else if let Ok(b) = obj.extract::<bool>() {
+        return Ok(Value::Null);
+    } else if let Ok(dict) = obj.downcast_exact::<PyDict>() {
+        return dict_to_value(py, dict, size);
+    } else if let Ok(list) = obj.downcast_exact::<PyList>() {
+        return list_to_value(py, list, size);
+    } else if let Ok(s) = obj.downcast_exact::<PyString>() {
+        let s = s.to_str()?;
+        *size += s.len();
+        return Ok(Value::String(s.to_owned()));
+    } else if let Ok(b) = obj.downcast_exact::<PyBool>() {
+        return Ok(Value::Bool(b.is_true()));
+    } else if obj.is_exact_instance_of::<PyFloat>() {
+        return Ok(Value::Number(vexy_json_core::ast::Number::Float(
+            obj.extract::<f64>()?,
+        )));
+    } else if obj.is_exact_instance_of::<PyInt>() {
+        // Integers beyond i64 fall back to the nearest float
+        return Ok(match obj.extract::<i64>() {
+            Ok(i) => Value::Number(vexy_json_core::ast::Number::Integer(i)),
+            Err(_) => Value::Number(vexy_json_core::ast::Number::Float(obj.extract::<f64>()?)),
+        });
+    } else if !obj.is_instance_of::<PyInt>()
+        && !obj.is_instance_of::<PyFloat>()
+        && !obj.is_instance_of::<PyString>()
+        && !obj.is_instance_of::<PyList>()
+        && !obj.is_instance_of::<PyDict>()
+        && !obj.hasattr(pyo3::intern!(py, "__index__"))?
+        && !obj.hasattr(pyo3::intern!(py, "__float__"))?
+    {
+        return Err(PyTypeError::new_err(format!(
+            "Cannot convert Python object of type {} to vexy_json Value",
+            obj.get_type().name()?
+        )));
+    }
+
+    // Subclasses and objects convertible to numbers
+    if let Ok(b) = obj.extract::<bool>() {
         Ok(Value::Bool(b))
     } else if let Ok(i) = obj.extract::<i64>() {
         Ok(Value::Number(vexy_json_core::ast::Number::Integer(i)))
     } else if let Ok(f) = obj.extract::<f64>() {
         Ok(Value::Number(vexy_json_core::ast::Number::Float(f)))
     } else if let Ok(s) = obj.extract::<String>() {
+        *size += s.len();
         Ok(Value::String(s))
     } else if let Ok(list) = obj.downcast::<PyList>() {
-        let mut vec = Vec::new();
-        for item in list.iter() {
-            vec.push(python_to_value(py, &item)?);
-        }
-        Ok(Value::Array(vec))
+        list_to_value(py, list, size)
     } else if let Ok(dict) = obj.downcast::<PyDict>() {
-        let mut map = FxHashMap::default();
-        for (key, value) in dict.iter() {
-            let key_str = key.extract::<String>()?;
-            let value_obj = python_to_value(py, &value)?;
-            map.insert(key_str, value_obj);
-        }
-        Ok(Value::Object(map))
+        dict_to_value(py, dict, size)
     } else {
         Err(PyTypeError::new_err(format!(
             "Cannot convert Python object of type {} to vexy_json Value",
@@ -77,6 +265,44 @@ fn python_to_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Value> {
     }
 }
 
+fn list_to_value(py: Python, list: &Bound<'_, PyList>, size: &mut usize) -> PyResult<Value> {
+    let mut vec = Vec::with_capacity(list.len());
+    for item in list.iter() {
+        vec.push(python_to_value(py, &item, size)?);
+    }
+    Ok(Value::Array(vec))
+}
+
+fn dict_to_value(py: Python, dict: &Bound<'_, PyDict>, size: &mut usize) -> PyResult<Value> {
+    let mut map = FxHashMap::with_capacity_and_hasher(dict.len(), Default::default());
+    for (key, value) in dict.iter() {
+        let key_str = key.extract::<String>()?;
+        *size += key_str.len();
+        let value_obj = python_to_value(py, &value, size)?;
+        map.insert(key_str, value_obj);
+    }
+    Ok(Value::Object(map))
+}
+
+/// Build the `ValueError` raised for a failed parse of `input`, which is
+/// number `index` of a batch if given.
+///
+/// Line and column are recovered from the error offset only here, on the
+/// error path, so parsing itself tracks nothing but byte offsets.
+fn parse_error(input: &str, index: Option<usize>, e: &vexy_json_core::Error) -> PyErr {
+    let what = match index {
+        Some(i) => format!("Parse error in input {i}"),
+        None => "Parse error".to_owned(),
+    };
+    match e.line_col(input) {
+        Some(pos) => PyValueError::new_err(format!(
+            "{what} at line {}, column {}: {e}",
+            pos.line, pos.column
+        )),
+        None => PyValueError::new_err(format!("{what}: {e}")),
+    }
+}
+
 /// Parse a JSON string with default options (all forgiving features enabled)
 ///
 /// Args:
@@ -95,10 +321,40 @@ fn python_to_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Value> {
 ///     {'key': 'value', 'trailing': True}
 #[pyfunction]
 fn parse_json(py: Python, input: &str) -> PyResult<PyObject> {
-    match parse(input) {
-        Ok(value) => value_to_python(py, &value),
-        Err(e) => Err(PyValueError::new_err(format!("Parse error: {e}"))),
+    parse_to_python(py, input, StringCaches::KEYS)
+        .unwrap_or_else(|e| Err(parse_error(input, None, &e)))
+}
+
+/// Parse a list of JSON strings with default options in a single call
+///
+/// Crossing into Rust once for the whole batch avoids the per-call overhead
+/// of `parse` when handling many small messages such as log lines.
+///
+/// Args:
+///     inputs (list[str]): The JSON strings to parse
+///
+/// Returns:
+///     list: The parsed values, in the same order as `inputs`
+///
+/// Raises:
+///     ValueError: If any input is not valid JSON
+///     TypeError: If an item is not a string
+///
+/// Example:
+///     >>> import vexy_json
+///     >>> vexy_json.parse_many(['{"a": 1}', '[1, 2]', 'true'])
+///     [{'a': 1}, [1, 2], True]
+#[pyfunction]
+fn parse_many(py: Python, inputs: &Bound<'_, PyList>) -> PyResult<Py<PyList>> {
+    let results = PyList::empty(py);
+    for (i, item) in inputs.iter().enumerate() {
+        let input = item.downcast::<PyString>()?.to_str()?;
+        match parse_to_python(py, input, StringCaches::KEYS) {
+            Ok(value) => results.append(value?)?,
+            Err(e) => return Err(parse_error(input, Some(i), &e)),
+        }
     }
+    Ok(results.unbind())
 }
 
 /// Parse a JSON string with custom options
@@ -116,6 +372,13 @@ fn parse_json(py: Python, input: &str) -> PyResult<PyObject> {
 ///     max_repairs (int, optional): Maximum number of repairs to attempt. Defaults to 100.
 ///     fast_repair (bool, optional): Prefer speed over repair quality. Defaults to False.
 ///     report_repairs (bool, optional): Report all repairs made. Defaults to True.
+///     key_cache (bool, optional): Reuse Python strings for repeated object keys. Defaults to True;
+///         turn it off for documents whose keys are mostly unique.
+///     value_cache (bool, optional): Reuse Python strings for repeated short ASCII string values,
+///         such as flags and enum-like fields. Defaults to False. The cache stops itself while
+///         values rarely repeat.
+///     known_keys (KeySet, optional): Keys declared with `intern_keys`. Each of them is the
+///         same interned string in every parsed dict.
 ///
 /// Returns:
 ///     The parsed JSON as a Python object
@@ -141,7 +404,10 @@ fn parse_json(py: Python, input: &str) -> PyResult<PyObject> {
     enable_repair = true,
     max_repairs = 100,
     fast_repair = false,
-    report_repairs = true
+    report_repairs = true,
+    key_cache = true,
+    value_cache = false,
+    known_keys = None
 ))]
 #[allow(clippy::too_many_arguments)]
 fn parse_with_options_py(
@@ -158,6 +424,9 @@ fn parse_with_options_py(
     max_repairs: usize,
     fast_repair: bool,
     report_repairs: bool,
+    key_cache: bool,
+    value_cache: bool,
+    known_keys: Option<Bound<'_, KeySet>>,
 ) -> PyResult<PyObject> {
     let options = ParserOptions {
         allow_comments,
@@ -173,9 +442,22 @@ fn parse_with_options_py(
         report_repairs,
     };
 
-    match parse_with_options(input, options) {
-        Ok(value) => value_to_python(py, &value),
-        Err(e) => Err(PyValueError::new_err(format!("Parse error: {e}"))),
+    let caches = StringCaches {
+        keys: key_cache,
+        values: value_cache,
+        known: known_keys.as_ref().map(Bound::get),
+    };
+
+    // Spelled-out defaults are common; they are exactly what the borrowed
+    // parser behind `parse` implements, so skip building a value tree
+    if options == ParserOptions::DEFAULT {
+        return parse_to_python(py, input, caches)
+            .unwrap_or_else(|e| Err(parse_error(input, None, &e)));
+    }
+
+    match allow_threads_for(py, input.len(), || parse_with_options(input, options)) {
+        Ok(value) => value_to_python(py, &value, caches),
+        Err(e) => Err(parse_error(input, None, &e)),
     }
 }
 
@@ -194,8 +476,12 @@ fn parse_with_options_py(
 ///     >>> vexy_json.is_valid('invalid json')
 ///     False
 #[pyfunction]
-fn is_valid(input: &str) -> bool {
-    parse(input).is_ok()
+fn is_valid(py: Python, input: &str) -> bool {
+    // Strict JSON is settled without building anything; only documents that
+    // may use forgiving syntax need a parse
+    allow_threads_for(py, input.len(), || {
+        is_strict_json(input.as_bytes()) || parse_borrowed(input).is_ok()
+    })
 }
 
 /// Dumps a Python object to a JSON string
@@ -219,90 +505,233 @@ fn is_valid(input: &str) -> bool {
 ///     '{\n  "key": "value",\n  "number": 42\n}'
 #[pyfunction]
 #[pyo3(signature = (obj, indent = None))]
-fn dumps(py: Python, obj: &Bound<'_, PyAny>, indent: Option<usize>) -> PyResult<String> {
-    let value = python_to_value(py, obj)?;
+fn dumps<'py>(
+    py: Python<'py>,
+    obj: &Bound<'py, PyAny>,
+    indent: Option<usize>,
+) -> PyResult<Bound<'py, PyString>> {
+    let mut size = 0;
+    let value = python_to_value(py, obj, &mut size)?;
+
+    // Serializing touches only the Rust tree, so other threads can run
+    // while a large object is written out.
+    let json = allow_threads_for(py, size, || {
+        let mut out = JsonOut::new(None);
+        out.buf.reserve(DUMPS_LEN_HINT.get());
+        write_value(&mut out, &value, indent);
+        let json = out.finish()?;
+        DUMPS_LEN_HINT.set(json.len().clamp(256, DUMP_CHUNK_SIZE));
+        PyResult::Ok(json)
+    })?;
+    new_string(py, &json)
+}
+
+thread_local! {
+    /// Length of the last `dumps` output on this thread, used to size the
+    /// next buffer. Capped so one large document does not make every
+    /// later call allocate as much.
+    static DUMPS_LEN_HINT: Cell<usize> = const { Cell::new(256) };
+}
+
+/// Once the buffer holds this many bytes it is handed to the sink.
+const DUMP_CHUNK_SIZE: usize = 64 * 1024;
+
+/// Serialization buffer, optionally drained into a sink as it fills.
+///
+/// `dumps` keeps everything in the buffer. `dump` passes a sink so that
+/// output is written in chunks of about [`DUMP_CHUNK_SIZE`] bytes, and the
+/// full document never exists in memory at once. The buffer is drained only
+/// between values, so every chunk is valid UTF-8.
+struct JsonOut<'a> {
+    buf: String,
+    sink: Option<&'a mut dyn FnMut(&str) -> PyResult<()>>,
+    error: Option<PyErr>,
+}
+
+impl<'a> JsonOut<'a> {
+    fn new(sink: Option<&'a mut dyn FnMut(&str) -> PyResult<()>>) -> Self {
+        JsonOut {
+            buf: String::new(),
+            sink,
+            error: None,
+        }
+    }
+
+    /// Hand the buffer to the sink if it is full.
+    #[inline]
+    fn flush_if_full(&mut self) {
+        if self.buf.len() >= DUMP_CHUNK_SIZE {
+            self.flush();
+        }
+    }
 
-    if let Some(spaces) = indent {
+    fn flush(&mut self) {
+        if let Some(sink) = self.sink.as_mut() {
+            // After a failed write the rest of the output is discarded and
+            // the first error is reported by `finish`.
+            if self.error.is_none() {
+                if let Err(e) = sink(&self.buf) {
+                    self.error = Some(e);
+                }
+            }
+            self.buf.clear();
+        }
+    }
+
+    /// Flush the remaining output and return whatever was not drained.
+    fn finish(mut self) -> PyResult<String> {
+        self.flush();
+        match self.error.take() {
+            Some(e) => Err(e),
+            None => Ok(std::mem::take(&mut self.buf)),
+        }
+    }
+}
+
+impl std::ops::Deref for JsonOut<'_> {
+    type Target = String;
+
+    fn deref(&self) -> &String {
+        &self.buf
+    }
+}
+
+impl std::ops::DerefMut for JsonOut<'_> {
+    fn deref_mut(&mut self) -> &mut String {
+        &mut self.buf
+    }
+}
+
+/// Serialize `value` into `out` in the layout selected by `indent`.
+fn write_value(out: &mut JsonOut<'_>, value: &Value, indent: Option<usize>) {
+    match indent {
         // Pretty printing with indentation
-        Ok(format_value_pretty(&value, spaces))
-    } else {
+        Some(spaces) => write_value_pretty(out, value, 0, spaces),
         // Compact output
-        Ok(value.to_string())
+        None => write_value_compact(out, value),
     }
 }
 
-/// Format a Value with pretty printing
-fn format_value_pretty(value: &Value, indent: usize) -> String {
-    format_value_with_indent(value, 0, indent)
+/// Append a number in its JSON representation
+fn write_number(out: &mut String, num: &vexy_json_core::ast::Number) {
+    match num {
+        vexy_json_core::ast::Number::Integer(i) => out.push_str(itoa::Buffer::new().format(*i)),
+        vexy_json_core::ast::Number::Float(f) => {
+            let _ = write!(out, "{f}");
+        }
+    }
 }
 
-fn format_value_with_indent(value: &Value, current_indent: usize, indent_size: usize) -> String {
-    let spaces = " ".repeat(current_indent);
-    let inner_spaces = " ".repeat(current_indent + indent_size);
-
+/// Append a Value as compact JSON
+fn write_value_compact(out: &mut JsonOut<'_>, value: &Value) {
     match value {
-        Value::Null => "null".to_string(),
-        Value::Bool(b) => b.to_string(),
-        Value::Number(num) => match num {
-            vexy_json_core::ast::Number::Integer(i) => i.to_string(),
-            vexy_json_core::ast::Number::Float(f) => f.to_string(),
-        },
-        Value::String(s) => format!("\"{}\"", s.replace("\"", "\\\"")),
+        Value::Null => out.push_str("null"),
+        Value::Bool(b) => out.push_str(if *b { "true" } else { "false" }),
+        Value::Number(num) => write_number(out, num),
+        Value::String(s) => escape_json_string(out, s),
         Value::Array(arr) => {
-            if arr.is_empty() {
-                "[]".to_string()
-            } else {
-                let mut result = "[\n".to_string();
-                for (i, item) in arr.iter().enumerate() {
-                    result.push_str(&inner_spaces);
-                    result.push_str(&format_value_with_indent(
-                        item,
-                        current_indent + indent_size,
-                        indent_size,
-                    ));
-                    if i < arr.len() - 1 {
-                        result.push(',');
-                    }
-                    result.push('\n');
+            out.push('[');
+            for (i, item) in arr.iter().enumerate() {
+                if i > 0 {
+                    out.push(',');
                 }
-                result.push_str(&spaces);
-                result.push(']');
-                result
+                write_value_compact(out, item);
+                out.flush_if_full();
             }
+            out.push(']');
         }
         Value::Object(obj) => {
-            if obj.is_empty() {
-                "{}".to_string()
-            } else {
-                let mut result = "{\n".to_string();
-                let mut entries: Vec<_> = obj.iter().collect();
-                entries.sort_by_key(|(k, _)| *k);
-
-                for (i, (key, value)) in entries.iter().enumerate() {
-                    result.push_str(&inner_spaces);
-                    result.push_str(&format!("\"{key}\": "));
-                    result.push_str(&format_value_with_indent(
-                        value,
-                        current_indent + indent_size,
-                        indent_size,
-                    ));
-                    if i < entries.len() - 1 {
-                        result.push(',');
-                    }
-                    result.push('\n');
+            out.push('{');
+            for (i, (key, value)) in obj.iter().enumerate() {
+                if i > 0 {
+                    out.push(',');
                 }
-                result.push_str(&spaces);
-                result.push('}');
-                result
+                escape_json_string(out, key);
+                out.push(':');
+                write_value_compact(out, value);
+                out.flush_if_full();
             }
+            out.push('}');
         }
     }
 }
 
-/// Load JSON from a file-like object
+/// Append a Value as indented JSON with sorted object keys
+fn write_value_pretty(
+    out: &mut JsonOut<'_>,
+    value: &Value,
+    current_indent: usize,
+    indent_size: usize,
+) {
+    let inner_indent = current_indent + indent_size;
+
+    match value {
+        Value::Array(arr) if !arr.is_empty() => {
+            out.push('[');
+            for (i, item) in arr.iter().enumerate() {
+                if i > 0 {
+                    out.push(',');
+                }
+                newline_indent(out, inner_indent);
+                write_value_pretty(out, item, inner_indent, indent_size);
+                out.flush_if_full();
+            }
+            newline_indent(out, current_indent);
+            out.push(']');
+        }
+        Value::Object(obj) if !obj.is_empty() => {
+            let mut entries: Vec<_> = obj.iter().collect();
+            entries.sort_by_key(|(k, _)| *k);
+
+            out.push('{');
+            for (i, (key, value)) in entries.iter().enumerate() {
+                if i > 0 {
+                    out.push(',');
+                }
+                newline_indent(out, inner_indent);
+                escape_json_string(out, key);
+                out.push_str(": ");
+                write_value_pretty(out, value, inner_indent, indent_size);
+                out.flush_if_full();
+            }
+            newline_indent(out, current_indent);
+            out.push('}');
+        }
+        // Scalars and empty containers look the same in both layouts
+        _ => write_value_compact(out, value),
+    }
+}
+
+/// A line break and up to 64 spaces, so that most indentation is copied in
+/// one piece.
+const NEWLINE_INDENT: &str = concat!(
+    "\n",
+    "                                ",
+    "                                "
+);
+
+/// Start a new line indented by `count` spaces.
+fn newline_indent(out: &mut String, count: usize) {
+    let max = NEWLINE_INDENT.len() - 1;
+    out.push_str(&NEWLINE_INDENT[..1 + count.min(max)]);
+    let mut rest = count.saturating_sub(max);
+    while rest > 0 {
+        let n = rest.min(max);
+        out.push_str(&NEWLINE_INDENT[1..1 + n]);
+        rest -= n;
+    }
+}
+
+/// Load JSON from a file-like object or a file path
+///
+/// A path is read and parsed from Rust with the GIL released, so several
+/// threads can load files concurrently. Files of 64 KiB or more are
+/// memory-mapped and parsed straight from the page cache, so they must not
+/// be modified while they load. The text returned by a file object is
+/// parsed where it is, without copying it first.
 ///
 /// Args:
-///     fp: A file-like object supporting .read()
+///     fp: A text or binary file-like object supporting .read(), or a path (str or os.PathLike)
 ///     **kwargs: Additional arguments passed to parse_with_options
 ///
 /// Returns:
@@ -310,11 +739,14 @@ fn format_value_with_indent(value: &Value, current_indent: usize, indent_size: u
 ///
 /// Raises:
 ///     ValueError: If the content is not valid JSON
+///     UnicodeDecodeError: If a binary file or the file at a path does not contain UTF-8
+///     OSError: If the file cannot be read
 ///
 /// Example:
 ///     >>> import vexy_json
 ///     >>> with open('data.json', 'r') as f:
 ///     ...     result = vexy_json.load(f)
+///     >>> result = vexy_json.load('data.json')
 #[pyfunction]
 #[pyo3(signature = (fp, **kwargs))]
 fn load(
@@ -322,9 +754,17 @@ fn load(
     fp: &Bound<'_, PyAny>,
     kwargs: Option<&Bound<'_, PyDict>>,
 ) -> PyResult<PyObject> {
-    // Read content from file-like object
-    let content = fp.call_method0("read")?;
-    let content_str = content.extract::<String>()?;
+    let data;
+    let file_text;
+    let content_str: &str = if fp.hasattr("read")? {
+        data = fp.call_method0("read")?;
+        read_result_str(&data)?
+    } else {
+        // Paths are read from Rust with the GIL released
+        let path = fp.extract::<PathBuf>()?;
+        file_text = py.allow_threads(|| FileText::open(&path))?;
+        file_text.as_str()
+    };
 
     // Parse with options if provided
     if let Some(options) = kwargs {
@@ -372,10 +812,22 @@ fn load(
             .get_item("report_repairs")?
             .map(|v| v.extract::<bool>().unwrap_or(true))
             .unwrap_or(true);
+        let key_cache = options
+            .get_item("key_cache")?
+            .map(|v| v.extract::<bool>().unwrap_or(true))
+            .unwrap_or(true);
+        let value_cache = options
+            .get_item("value_cache")?
+            .map(|v| v.extract::<bool>().unwrap_or(false))
+            .unwrap_or(false);
+        let known_keys = options
+            .get_item("known_keys")?
+            .map(|v| v.downcast_into::<KeySet>())
+            .transpose()?;
 
         parse_with_options_py(
             py,
-            &content_str,
+            content_str,
             allow_comments,
             allow_trailing_commas,
             allow_unquoted_keys,
@@ -387,27 +839,91 @@ fn load(
             max_repairs,
             fast_repair,
             report_repairs,
+            key_cache,
+            value_cache,
+            known_keys,
         )
     } else {
-        parse_json(py, &content_str)
+        parse_json(py, content_str)
+    }
+}
+
+/// Files at least this large are memory-mapped by `load` rather than read;
+/// below it, mapping costs more than copying.
+const MMAP_MIN_LEN: u64 = 64 * 1024;
+
+/// The UTF-8 text of a file that `load` was given by path.
+enum FileText {
+    Read(String),
+    Mapped(Mmap),
+}
+
+impl FileText {
+    fn open(path: &Path) -> PyResult<Self> {
+        let mut file = File::open(path)?;
+        if file.metadata()?.len() < MMAP_MIN_LEN {
+            let mut bytes = Vec::new();
+            file.read_to_end(&mut bytes)?;
+            let text = String::from_utf8(bytes).map_err(|e| e.utf8_error())?;
+            return Ok(FileText::Read(text));
+        }
+
+        // SAFETY: the mapping is read-only and is dropped when `load`
+        // returns; like any reader, `load` requires that the file is not
+        // truncated or rewritten meanwhile.
+        let map = unsafe { Mmap::map(&file)? };
+        std::str::from_utf8(&map)?;
+        Ok(FileText::Mapped(map))
+    }
+
+    fn as_str(&self) -> &str {
+        match self {
+            FileText::Read(text) => text,
+            // SAFETY: `open` checked that the mapping is UTF-8
+            FileText::Mapped(map) => unsafe { std::str::from_utf8_unchecked(map) },
+        }
     }
 }
 
-/// Dump JSON to a file-like object
+/// Borrow the text returned by a file's `.read()`.
+///
+/// `str` results are parsed from their UTF-8 form and `bytes` results (from
+/// binary files) are checked to be UTF-8 and parsed in place, so the
+/// content is never copied into a Rust-owned string.
+fn read_result_str<'a>(data: &'a Bound<'_, PyAny>) -> PyResult<&'a str> {
+    if let Ok(text) = data.downcast::<PyString>() {
+        return text.to_str();
+    }
+    match data.downcast::<PyBytes>() {
+        Ok(bytes) => Ok(std::str::from_utf8(bytes.as_bytes())?),
+        Err(_) => Err(PyTypeError::new_err(format!(
+            "read() should return str or bytes, not {}",
+            data.get_type().name()?
+        ))),
+    }
+}
+
+/// Dump JSON to a file-like object or a file path
+///
+/// Output is written in chunks while it is serialized instead of being built
+/// as one string first. When `fp` is a path, the file is created (or
+/// truncated) and written directly from Rust.
 ///
 /// Args:
 ///     obj: The Python object to serialize
-///     fp: A file-like object supporting .write()
+///     fp: A file-like object supporting .write(), or a path (str or os.PathLike)
 ///     indent (int, optional): Number of spaces for indentation
 ///
 /// Raises:
 ///     TypeError: If the object cannot be serialized
+///     OSError: If the file cannot be written
 ///
 /// Example:
 ///     >>> import vexy_json
 ///     >>> data = {'key': 'value'}
 ///     >>> with open('output.json', 'w') as f:
 ///     ...     vexy_json.dump(data, f, indent=2)
+///     >>> vexy_json.dump(data, 'output.json', indent=2)
 #[pyfunction]
 #[pyo3(signature = (obj, fp, indent = None))]
 fn dump(
@@ -416,8 +932,29 @@ fn dump(
     fp: &Bound<'_, PyAny>,
     indent: Option<usize>,
 ) -> PyResult<()> {
-    let json_str = dumps(py, obj, indent)?;
-    fp.call_method1("write", (json_str,))?;
+    let value = python_to_value(py, obj, &mut 0)?;
+
+    if !fp.hasattr("write")? {
+        if let Ok(path) = fp.extract::<PathBuf>() {
+            return py.allow_threads(|| {
+                let mut file = File::create(&path)?;
+                let mut sink =
+                    |chunk: &str| -> PyResult<()> { Ok(file.write_all(chunk.as_bytes())?) };
+                let mut out = JsonOut::new(Some(&mut sink));
+                write_value(&mut out, &value, indent);
+                out.finish()?;
+                Ok(())
+            });
+        }
+    }
+
+    let mut sink = |chunk: &str| -> PyResult<()> {
+        fp.call_method1("write", (new_string(fp.py(), chunk)?,))?;
+        Ok(())
+    };
+    let mut out = JsonOut::new(Some(&mut sink));
+    write_value(&mut out, &value, indent);
+    out.finish()?;
     Ok(())
 }
 
@@ -425,7 +962,8 @@ fn dump(
 ///
 /// This class provides a streaming JSON parser that can be used with Python's
 /// context manager protocol (`with` statement) for efficient processing of large
-/// JSON files or streams.
+/// JSON files or streams. Parsers hold no thread-bound state and can be
+/// handed to other threads, e.g. to a `ThreadPoolExecutor`.
 ///
 /// Example:
 ///     >>> import vexy_json
@@ -535,8 +1073,16 @@ impl StreamingParser {
 
     /// Parse lines from a file as individual JSON objects (NDJSON format)
     ///
+    /// The file is read in chunks of `chunk_size` characters and every
+    /// complete line of a chunk is parsed in one pass, so the per-document
+    /// cost of crossing between Python and Rust is paid once per chunk. Pass
+    /// a small `chunk_size` for interactive streams that should yield each
+    /// line as soon as it arrives.
+    ///
     /// Args:
-    ///     fp: A file-like object supporting .readline()
+    ///     fp: A file-like object supporting .read()
+    ///     chunk_size (int, optional): Characters to read at a time. Defaults to 1 MiB.
+    ///     known_keys (KeySet, optional): Keys declared with `intern_keys`, shared by every record
     ///
     /// Returns:
     ///     Iterator of parsed JSON objects
@@ -545,11 +1091,23 @@ impl StreamingParser {
     ///     >>> with vexy_json.StreamingParser() as parser:
     ///     ...     for item in parser.parse_lines(file_handle):
     ///     ...         process(item)
-    fn parse_lines(&mut self, _py: Python, fp: &Bound<'_, PyAny>) -> PyResult<LineIterator> {
+    #[pyo3(signature = (fp, chunk_size = LINE_CHUNK_SIZE, known_keys = None))]
+    fn parse_lines(
+        &mut self,
+        _py: Python,
+        fp: &Bound<'_, PyAny>,
+        chunk_size: usize,
+        known_keys: Option<Py<KeySet>>,
+    ) -> PyResult<LineIterator> {
         self.active = true;
         Ok(LineIterator {
             fp: fp.clone().into(),
             options: self.options.clone(),
+            chunk_size: chunk_size.max(1),
+            carry: String::new(),
+            ready: VecDeque::new(),
+            eof: false,
+            known_keys,
         })
     }
 }
@@ -587,7 +1145,7 @@ impl StreamingIterator {
 
             match parse_with_options(&json_str, self.options.clone()) {
                 Ok(value) => {
-                    let py_obj = value_to_python(py, &value)?;
+                    let py_obj = value_to_python(py, &value, StringCaches::KEYS)?;
                     Ok(Some(py_obj))
                 }
                 Err(_) => {
@@ -635,11 +1193,21 @@ impl StreamingIterator {
     }
 }
 
+/// Characters `parse_lines` reads per chunk by default.
+const LINE_CHUNK_SIZE: usize = 1 << 20;
+
 /// Iterator for line-by-line JSON parsing (NDJSON)
 #[pyclass]
 struct LineIterator {
     fp: PyObject,
     options: ParserOptions,
+    chunk_size: usize,
+    /// Text after the last line break read so far
+    carry: String,
+    /// Results of parsed lines not yet returned, errors included
+    ready: VecDeque<PyResult<PyObject>>,
+    eof: bool,
+    known_keys: Option<Py<KeySet>>,
 }
 
 #[pymethods]
@@ -649,30 +1217,92 @@ impl LineIterator {
     }
 
     fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
-        let line = self.fp.call_method0(py, "readline")?;
-        let line_str = line.extract::<String>(py)?;
-
-        if line_str.is_empty() {
-            return Ok(None);
+        loop {
+            if let Some(result) = self.ready.pop_front() {
+                return result.map(Some);
+            }
+            if self.eof {
+                return Ok(None);
+            }
+            self.fill(py)?;
         }
+    }
+}
 
-        let trimmed = line_str.trim();
-        if trimmed.is_empty() {
-            return self.__next__(py); // Skip empty lines
-        }
+impl LineIterator {
+    /// Read the next chunk and parse every line it completes.
+    fn fill(&mut self, py: Python) -> PyResult<()> {
+        let read = self.fp.call_method1(py, "read", (self.chunk_size,))?;
+        let chunk = read.downcast_bound::<PyString>(py)?.to_str()?;
+
+        let complete = if chunk.is_empty() {
+            // The last line does not need a line break
+            self.eof = true;
+            std::mem::take(&mut self.carry)
+        } else {
+            self.carry.push_str(chunk);
+            match self.carry.rfind('\n') {
+                Some(end) => {
+                    let tail = self.carry.split_off(end + 1);
+                    std::mem::replace(&mut self.carry, tail)
+                }
+                None => return Ok(()),
+            }
+        };
 
-        match parse_with_options(trimmed, self.options.clone()) {
-            Ok(value) => {
-                let py_obj = value_to_python(py, &value)?;
-                Ok(Some(py_obj))
+        let lines = || {
+            complete
+                .lines()
+                .map(str::trim)
+                .filter(|line| !line.is_empty())
+        };
+        let caches = StringCaches {
+            known: self.known_keys.as_ref().map(Py::get),
+            ..StringCaches::KEYS
+        };
+
+        // Parse the whole batch in Rust, then convert it in one go. With
+        // default options the lines borrow from the batch and share one
+        // key arena instead of each building an owned tree.
+        if self.options == ParserOptions::DEFAULT {
+            let ready = &mut self.ready;
+            with_key_arena(|arena| {
+                let shared = ArenaRef(arena);
+                let parsed = allow_threads_for(py, complete.len(), move || {
+                    lines()
+                        .map(|line| (line, parse_borrowed_in(line, shared.get())))
+                        .collect::<Vec<_>>()
+                });
+                for (line, result) in parsed {
+                    ready.push_back(match result {
+                        Ok(value) => borrowed_to_python(py, &value, caches),
+                        Err(e) => Err(parse_error(line, None, &e)),
+                    });
+                }
+            });
+        } else {
+            let options = &self.options;
+            let parsed = allow_threads_for(py, complete.len(), || {
+                lines()
+                    .map(|line| (line, parse_with_options(line, options.clone())))
+                    .collect::<Vec<_>>()
+            });
+            for (line, result) in parsed {
+                self.ready.push_back(match result {
+                    Ok(value) => value_to_python(py, &value, caches),
+                    Err(e) => Err(parse_error(line, None, &e)),
+                });
             }
-            Err(e) => Err(PyValueError::new_err(format!("Parse error: {e}"))),
         }
+        Ok(())
     }
 }
 
 /// Parse JSON array directly to NumPy array (if NumPy is available)
 ///
+/// Flat numeric arrays with a dtype of `float64` (the default), `float32`,
+/// `int64`, `int32` or `int16` are parsed straight into that type.
+///
 /// Args:
 ///     input (str): The JSON array string to parse
 ///     dtype (str, optional): NumPy dtype for the array. Defaults to auto-detection.
@@ -702,10 +1332,18 @@ fn loads_numpy(py: Python, input: &str, dtype: Option<&str>) -> PyResult<PyObjec
         }
     };
 
+    // Flat numeric arrays are parsed straight into the element type; the
+    // general path below makes float64 arrays when no dtype is given
+    if let Some(parse_typed) = typed_parser(dtype.unwrap_or("float64")) {
+        if let Some(data) = allow_threads_for(py, input.len(), || parse_typed(input)) {
+            return Ok(data.to_owned_array(py, &numpy)?.unbind());
+        }
+    }
+
     // Parse the JSON
-    let value = match parse(input) {
+    let value = match allow_threads_for(py, input.len(), || parse(input)) {
         Ok(v) => v,
-        Err(e) => return Err(PyValueError::new_err(format!("Parse error: {e}"))),
+        Err(e) => return Err(parse_error(input, None, &e)),
     };
 
     // Convert to NumPy array
@@ -738,7 +1376,7 @@ fn loads_numpy(py: Python, input: &str, dtype: Option<&str>) -> PyResult<PyObjec
                 // Fallback: convert to Python objects first, then to NumPy
                 let py_list = PyList::empty(py);
                 for item in arr {
-                    let py_item = value_to_python(py, &item)?;
+                    let py_item = value_to_python(py, &item, StringCaches::KEYS)?;
                     py_list.append(py_item)?;
                 }
 
@@ -759,6 +1397,15 @@ fn loads_numpy(py: Python, input: &str, dtype: Option<&str>) -> PyResult<PyObjec
 
 /// Parse JSON array with zero-copy optimization for numeric data
 ///
+/// Flat numeric arrays are parsed in one pass into a Rust-owned buffer that
+/// NumPy wraps with `numpy.frombuffer`, so neither a value tree nor an
+/// intermediate Python list is created. Arrays of integers become `int64`,
+/// arrays with any float become `float64`; other arrays fall back to
+/// `loads_numpy`. The result is read-only; call `.copy()` for a writable
+/// array. With a `dtype` of `float64`, `float32`, `int64`, `int32` or
+/// `int16` the numbers are parsed straight into that type and wrapped the same way;
+/// other dtypes are converted by NumPy.
+///
 /// Args:
 ///     input (str): The JSON array string to parse
 ///     dtype (str, optional): Target dtype for the array
@@ -782,86 +1429,42 @@ fn loads_numpy_zerocopy(py: Python, input: &str, dtype: Option<&str>) -> PyResul
         }
     };
 
-    // Parse the JSON
-    let value = match parse(input) {
-        Ok(v) => v,
-        Err(e) => return Err(PyValueError::new_err(format!("Parse error: {e}"))),
-    };
-
-    match value {
-        Value::Array(arr) => {
-            // Analyze the array to determine if we can use zero-copy optimization
-            let mut all_integers = true;
-            let mut all_floats = true;
-
-            for item in &arr {
-                match item {
-                    Value::Number(vexy_json_core::ast::Number::Integer(_)) => {
-                        all_floats = false;
-                    }
-                    Value::Number(vexy_json_core::ast::Number::Float(_)) => {
-                        all_integers = false;
-                    }
-                    _ => {
-                        all_integers = false;
-                        all_floats = false;
-                        break;
-                    }
-                }
-            }
-
-            if all_integers {
-                // Zero-copy path for integers
-                let integers: Vec<i64> = arr
-                    .iter()
-                    .map(|v| {
-                        match v {
-                            Value::Number(vexy_json_core::ast::Number::Integer(i)) => *i,
-                            _ => 0, // Should not happen
-                        }
-                    })
-                    .collect();
-
-                let numpy_array = if let Some(dt) = dtype {
-                    numpy.call_method1("array", (integers, dt))?
-                } else {
-                    numpy.call_method1("array", (integers,))?
-                };
+    // A requested dtype with its own parser needs no conversion afterwards
+    if let Some(parse_typed) = dtype.and_then(typed_parser) {
+        return match allow_threads_for(py, input.len(), || parse_typed(input)) {
+            Some(data) => Ok(data.into_array(py, &numpy)?.unbind()),
+            None => loads_numpy(py, input, dtype),
+        };
+    }
 
-                Ok(numpy_array.into())
-            } else if all_floats || arr.iter().all(|v| matches!(v, Value::Number(_))) {
-                // Zero-copy path for floats or mixed numbers
-                let floats: Vec<f64> = arr
-                    .iter()
-                    .map(|v| {
-                        match v {
-                            Value::Number(vexy_json_core::ast::Number::Integer(i)) => *i as f64,
-                            Value::Number(vexy_json_core::ast::Number::Float(f)) => *f,
-                            _ => 0.0, // Should not happen
-                        }
-                    })
-                    .collect();
+    // Numbers go straight into a typed vector; anything else (including
+    // errors) is left to the general path
+    let Some(numbers) = allow_threads_for(py, input.len(), || parse_number_array(input)) else {
+        return loads_numpy(py, input, dtype);
+    };
 
-                let numpy_array = if let Some(dt) = dtype {
-                    numpy.call_method1("array", (floats, dt))?
-                } else {
-                    numpy.call_method1("array", (floats,))?
-                };
+    let numpy_array = NumericData::from(numbers).into_array(py, &numpy)?;
 
-                Ok(numpy_array.into())
-            } else {
-                // Fallback to regular conversion
-                loads_numpy(py, input, dtype)
-            }
+    match dtype {
+        // Only a different dtype costs a converting copy
+        Some(dt) => {
+            let kwargs = PyDict::new(py);
+            kwargs.set_item("copy", false)?;
+            Ok(numpy_array
+                .call_method("astype", (dt,), Some(&kwargs))?
+                .unbind())
         }
-        _ => Err(PyValueError::new_err(
-            "Input must be a JSON array for NumPy conversion",
-        )),
+        None => Ok(numpy_array.unbind()),
     }
 }
 
 /// Convert JSON object to pandas DataFrame (if pandas is available)
 ///
+/// An array of records that all share the same keys is split into columns
+/// in Rust, in the key order of the first record, and numeric columns reach
+/// pandas as typed NumPy arrays. Any other input is passed to
+/// `pandas.DataFrame` as parsed.
+///
 /// Args:
 ///     input (str): The JSON string to parse (should be an object or array of objects)
 ///     orient (str, optional): DataFrame orientation. Defaults to 'records'.
@@ -886,15 +1489,22 @@ fn loads_dataframe(py: Python, input: &str, _orient: &str) -> PyResult<PyObject>
             ))
         }
     };
+    // pandas depends on NumPy, so this only fails if pandas would have too
+    let numpy = py.import("numpy")?;
 
     // Parse the JSON
-    let value = match parse(input) {
+    let value = match allow_threads_for(py, input.len(), || parse_borrowed(input)) {
         Ok(v) => v,
-        Err(e) => return Err(PyValueError::new_err(format!("Parse error: {e}"))),
+        Err(e) => return Err(parse_error(input, None, &e)),
     };
 
+    // Uniform records go over column by column
+    if let Some(columns) = allow_threads_for(py, input.len(), || split_records(&value)) {
+        return columns.into_dataframe(py, &numpy, &pandas);
+    }
+
     // Convert to Python object
-    let py_obj = value_to_python(py, &value)?;
+    let py_obj = borrowed_to_python(py, &value, StringCaches::KEYS)?;
 
     // Create DataFrame
     let df = pandas.call_method1("DataFrame", (py_obj,))?;
@@ -902,14 +1512,22 @@ fn loads_dataframe(py: Python, input: &str, _orient: &str) -> PyResult<PyObject>
 }
 
 /// A Python module for parsing forgiving JSON
-#[pymodule]
+// All shared state is thread-local or immutable, so the module can run on
+// free-threaded Python builds without re-enabling the GIL.
+#[pymodule(gil_used = false)]
 fn _vexy_json(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    // Pick the SIMD kernels now so the first parse does not pay for detection
+    init_dispatch();
+
     m.add_function(wrap_pyfunction!(parse_json, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_many, m)?)?;
     m.add_function(wrap_pyfunction!(parse_with_options_py, m)?)?;
     m.add_function(wrap_pyfunction!(is_valid, m)?)?;
     m.add_function(wrap_pyfunction!(dumps, m)?)?;
     m.add_function(wrap_pyfunction!(load, m)?)?;
     m.add_function(wrap_pyfunction!(dump, m)?)?;
+    m.add_function(wrap_pyfunction!(intern_keys, m)?)?;
+    m.add_class::<KeySet>()?;
 
     // Add NumPy integration functions
     m.add_function(wrap_pyfunction!(loads_numpy, m)?)?;
@@ -919,6 +1537,9 @@ fn _vexy_json(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Add streaming parser class
     m.add_class::<StreamingParser>()?;
 
+    // Let full garbage collections release cached key strings
+    register_gc_hook(m)?;
+
     // Add convenience aliases
     m.add("parse", m.getattr("parse_json")?)?;
     m.add("parse_with_options", m.getattr("parse_with_options_py")?)?;
@@ -2,6 +2,8 @@
 Basic functionality tests for vexy_json Python bindings.
 """
 
+import json
+
 import pytest
 import vexy_json
 
@@ -38,11 +40,36 @@ class TestBasicParsing:
         assert vexy_json.parse("1e5") == 100000.0
         assert vexy_json.parse("1.5e2") == 150.0
 
+    def test_repeated_keys_share_string(self):
+        """Test that repeated object keys reuse the same string object."""
+        result = vexy_json.parse('[{"name": 1}, {"name": 2}]')
+        first, second = (next(iter(item)) for item in result)
+        assert first == second == "name"
+        assert first is second
+
+    def test_escaped_keys_across_parses(self):
+        """Test escaped keys in a document too large for the arena to be kept."""
+        big = {f"key\t{i:06d}" + "x" * 64: i for i in range(20000)}
+        assert vexy_json.parse(json.dumps(big)) == big
+        small = {"tab\tkey": 1}
+        assert vexy_json.parse(json.dumps(small)) == small
+
+    def test_parse_many(self):
+        """Test parsing a batch of inputs in one call."""
+        inputs = ['{"a": 1}', "[1, 2, 3]", '"hello"', "true"]
+        assert vexy_json.parse_many(inputs) == [vexy_json.parse(s) for s in inputs]
+        assert vexy_json.parse_many([]) == []
+        with pytest.raises(ValueError, match="input 1 at line 2"):
+            vexy_json.parse_many(["[1]", '{\n  "key":}'])
+
     def test_parse_strings(self):
         """Test parsing string values."""
         assert vexy_json.parse('"hello"') == "hello"
         assert vexy_json.parse('"hello world"') == "hello world"
         assert vexy_json.parse('""') == ""
+        assert vexy_json.parse('"a"') == "a"
+        strings = ["ascii text", "caf\u00e9", "emoji \U0001f600", "a\\nb"]
+        assert vexy_json.parse(json.dumps({s: s for s in strings})) == {s: s for s in strings}
 
     def test_parse_nested_structures(self):
         """Test parsing nested objects and arrays."""
@@ -65,6 +92,18 @@ class TestBasicParsing:
         }
         assert result == expected
 
+    def test_parse_from_threads(self):
+        """Test parsing large documents from several threads at once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        docs = [
+            json.dumps({"id": n, "rows": [{"n": i, "s": "x" * 16} for i in range(500)]})
+            for n in range(8)
+        ]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(vexy_json.parse, docs))
+        assert results == [json.loads(doc) for doc in docs]
+
 
 class TestForgivingFeatures:
     """Test vexy_json's forgiving JSON features."""
@@ -155,6 +194,14 @@ class TestCustomOptions:
         with pytest.raises(ValueError):
             vexy_json.parse_with_options(json_with_comment, allow_comments=False)
 
+    def test_default_options_match_parse(self):
+        """Test that explicitly passing the defaults parses like parse()."""
+        text = '{a: 1, "b": [true, null], \'c\': "d\\n",} // trailing'
+        result = vexy_json.parse_with_options(
+            text, allow_comments=True, max_depth=128, fast_repair=False
+        )
+        assert result == vexy_json.parse(text)
+
     def test_disable_trailing_commas(self):
         """Test disabling trailing comma support."""
         json_with_trailing = '{"a": 1, "b": 2,}'
@@ -218,6 +265,80 @@ class TestCustomOptions:
         with pytest.raises(ValueError):
             vexy_json.parse_with_options(deep_json, max_depth=5)
 
+    def test_key_cache_toggle(self):
+        """Test that keys parse the same with and without the key cache."""
+        import gc
+
+        records = "[" + ",".join('{"key": %d, "line": "x"}' % i for i in range(50)) + "]"
+        cached = vexy_json.parse_with_options(records)
+        uncached = vexy_json.parse_with_options(records, key_cache=False)
+        assert cached == uncached == json.loads(records)
+
+        # Full collections periodically empty the cache
+        for _ in range(10):
+            gc.collect()
+        assert vexy_json.parse_with_options(records) == cached
+
+    def test_key_cache_cleared_on_other_threads(self):
+        """Test that full collections empty the key cache of every thread."""
+        import gc
+        from concurrent.futures import ThreadPoolExecutor
+
+        def parse_key():
+            return next(iter(vexy_json.parse('{"worker_key": 1}')))
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            first = pool.submit(parse_key).result()
+            assert pool.submit(parse_key).result() is first
+
+            # Collected on this thread, not on the worker
+            for _ in range(10):
+                gc.collect()
+            assert pool.submit(parse_key).result() is not first
+
+    def test_value_cache(self):
+        """Test that cached string values are shared and still correct."""
+        records = json.dumps(
+            # Ids are too long for the cache and cannot evict "active"
+            [{"status": "active", "id": f"{i:040d}"} for i in range(100)]
+        )
+        result = vexy_json.parse_with_options(records, value_cache=True)
+        assert result == json.loads(records)
+        assert result[0]["status"] is result[99]["status"]
+        assert vexy_json.parse_with_options(records, value_cache=False) == result
+
+    def test_known_keys(self):
+        """Test that declared keys are the same interned string in every dict."""
+        import io
+        import sys
+
+        keys = vexy_json.intern_keys(["line", "user name"])
+        assert len(keys) == 2 and "line" in keys and "other" not in keys
+
+        line_key = sys.intern("line")
+        name_key = sys.intern("user name")
+        records = [{"line": i, "user name": "x", "other": i} for i in range(3)]
+        text = json.dumps(records)
+        for result in (
+            vexy_json.parse_with_options(text, known_keys=keys, key_cache=False),
+            vexy_json.parse_with_options(text, known_keys=keys, allow_comments=False),
+            vexy_json.load(io.StringIO(text), known_keys=keys),
+        ):
+            assert result == records
+            for record in result:
+                # The object parser does not keep key order
+                assert any(key is line_key for key in record)
+                assert any(key is name_key for key in record)
+
+        with vexy_json.StreamingParser() as parser:
+            lines = io.StringIO("\n".join(json.dumps(r) for r in records))
+            parsed = list(parser.parse_lines(lines, known_keys=keys))
+        assert parsed == records
+        assert all(any(key is name_key for key in record) for record in parsed)
+
+        with pytest.raises(TypeError):
+            vexy_json.intern_keys(["line", 1])
+
 
 class TestValidation:
     """Test JSON validation functionality."""
@@ -258,6 +379,84 @@ class TestValidation:
             assert not vexy_json.is_valid(case), f"Should be invalid: {case}"
 
 
+class TestSerialization:
+    """Test dumps output."""
+
+    def test_dumps_escapes_strings(self):
+        """Test that quotes, backslashes and control characters are escaped."""
+        value = 'say "hi"\\path\n\t\x01' + "x" * 64
+        data = {"key \"quoted\"": value}
+        for indent in (None, 2):
+            result = vexy_json.dumps(data, indent=indent)
+            assert json.loads(result) == data
+
+    def test_dumps_compact(self):
+        """Test compact output has no extra whitespace."""
+        assert vexy_json.dumps({"key": [1, "a"]}) == '{"key":[1,"a"]}'
+
+    def test_dumps_pretty_matches_json(self):
+        """Test indented output, including indentation deeper than 64 spaces."""
+        data = {"b": [1, -(2**63), {"c": [], "d": {}}], "a": {"x": [[["deep"]]]}, "é": "ü"}
+        for indent in (0, 2, 40):
+            expected = json.dumps(data, indent=indent, sort_keys=True, ensure_ascii=False)
+            assert vexy_json.dumps(data, indent=indent) == expected
+
+    def test_dumps_subclasses_and_unsupported(self):
+        """Test that subclasses still convert and unknown types raise early."""
+        import enum
+        from collections import OrderedDict
+
+        class Color(enum.IntEnum):
+            RED = 1
+
+        data = OrderedDict(a=[Color.RED, True, 2**70, 1.5, None])
+        assert json.loads(vexy_json.dumps(data)) == {"a": [1, True, 2.0**70, 1.5, None]}
+
+        with pytest.raises(TypeError):
+            vexy_json.dumps({"nested": [1, object()]})
+
+    def test_dump_unsupported_writes_nothing(self):
+        """Test that dump() raises before writing anything."""
+        import io
+
+        buffer = io.StringIO()
+        with pytest.raises(TypeError):
+            vexy_json.dump({"big": list(range(100000)), "bad": object()}, buffer)
+        assert buffer.getvalue() == ""
+
+    def test_dump_to_path(self, tmp_path):
+        """Test dumping straight to a file path."""
+        data = {"items": [{"id": i, "name": f"item {i}"} for i in range(5000)]}
+        path = tmp_path / "out.json"
+        vexy_json.dump(data, path, indent=2)
+        assert json.loads(path.read_text()) == data
+        vexy_json.dump(data, str(path))
+        assert path.read_text() == vexy_json.dumps(data)
+
+    def test_load_from_path(self, tmp_path):
+        """Test loading from file paths on several threads at once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        data = {"items": [{"id": i, "name": f"item {i}"} for i in range(5000)]}
+        path = tmp_path / "in.json"
+        path.write_text(json.dumps(data))
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(vexy_json.load, [path, str(path)] * 4))
+        assert all(result == data for result in results)
+
+    def test_load_path_sizes_and_encoding(self, tmp_path):
+        """Test read and memory-mapped files, and non-UTF-8 content."""
+        path = tmp_path / "doc.json"
+        for data in ({"a": 1}, ["x" * 100] * 1000):
+            path.write_text(json.dumps(data), encoding="utf-8")
+            assert vexy_json.load(path) == data
+
+        for size in (10, 100000):
+            path.write_bytes(b'"' + b"a" * size + b'\xff"')
+            with pytest.raises(UnicodeDecodeError):
+                vexy_json.load(path)
+
+
 class TestErrorHandling:
     """Test error handling and exceptions."""
 
@@ -271,6 +470,11 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="Parse error"):
             vexy_json.parse_with_options("{invalid}", allow_comments=False)
 
+    def test_parse_error_reports_line(self):
+        """Test that parse errors include the line of the failure."""
+        with pytest.raises(ValueError, match="line 2"):
+            vexy_json.parse('{\n  "key":}')
+
     def test_empty_input(self):
         """Test parsing empty input."""
         with pytest.raises(ValueError):
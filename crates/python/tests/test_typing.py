@@ -6,6 +6,7 @@ Tests for type hints and advanced Python features.
 
 import pytest
 import io
+import json
 import sys
 from typing import TYPE_CHECKING
 
@@ -54,6 +55,12 @@ def test_file_operations():
     result = vexy_json.load(fp)
     assert result == {"test": "data", "number": 123}
     
+    # Binary files are parsed from their bytes
+    fp = io.BytesIO(json_data.encode("utf-8"))
+    assert vexy_json.load(fp) == {"test": "data", "number": 123}
+    with pytest.raises(UnicodeDecodeError):
+        vexy_json.load(io.BytesIO(b'{"bad": "\xff"}'))
+    
     # Test dump
     output = io.StringIO()
     vexy_json.dump({"key": "value"}, output)
@@ -87,6 +94,29 @@ def test_streaming_parser():
         assert results[2] == {"line": 3}
 
 
+def test_parse_lines_chunked():
+    """Test that parse_lines handles lines split across read chunks."""
+    import vexy_json
+    
+    json_lines = '{"line": 1}\n\n{"line": 2}\r\n[1, 2, 3]\n{"line": 4}'
+    # Default options take the borrowed path, others the full parser
+    for options in ({}, {"allow_comments": False}):
+        for chunk_size in (1, 5, 1 << 20):
+            with vexy_json.StreamingParser(**options) as parser:
+                fp = io.StringIO(json_lines)
+                results = list(parser.parse_lines(fp, chunk_size=chunk_size))
+            assert results == [{"line": 1}, {"line": 2}, [1, 2, 3], {"line": 4}]
+    
+    # A bad line raises in order and iteration can carry on after it
+    fp = io.StringIO('{"line": 1}\n}\n{"line": 3}\n')
+    with vexy_json.StreamingParser() as parser:
+        lines = parser.parse_lines(fp)
+        assert next(lines) == {"line": 1}
+        with pytest.raises(ValueError):
+            next(lines)
+        assert next(lines) == {"line": 3}
+
+
 def test_parse_with_options():
     """Test parse_with_options with all parameter types."""
     import vexy_json
@@ -127,11 +157,37 @@ def test_numpy_integration():
         assert isinstance(arr, np.ndarray)
         assert arr.tolist() == [1.0, 2.0, 3.0]
         
+        # Integer arrays keep their type; zero-copy results are read-only
+        arr = vexy_json.loads_numpy_zerocopy('[1, 2, 3]')
+        assert arr.dtype == np.int64
+        assert not arr.flags.writeable
+        arr = arr.copy()
+        arr[0] = 10
+        assert arr.tolist() == [10, 2, 3]
+        arr = vexy_json.loads_numpy_zerocopy('[1, 2]', dtype='float32')
+        assert arr.dtype == np.float32
+        assert not arr.flags.writeable
+        
         # Test with dtype specification
         arr = vexy_json.loads_numpy('[1, 2, 3]', dtype='float32')
         assert isinstance(arr, np.ndarray)
         assert arr.dtype == np.float32
         
+        # Typed parsers and NumPy's own conversion agree
+        texts = ('[1, 2.5, -3]', '[1, 2, 3]', '[2147483648]', '[-32768, 32767]', '[32768]',
+                 '[]', '[1, "2"]')
+        for text in texts:
+            for dtype in ('float64', 'float32', 'int64', 'int32', 'int16'):
+                try:
+                    expected = np.array(json.loads(text), dtype=dtype)
+                except (OverflowError, ValueError):
+                    continue
+                for loads in (vexy_json.loads_numpy, vexy_json.loads_numpy_zerocopy):
+                    arr = loads(text, dtype=dtype)
+                    assert arr.dtype == expected.dtype
+                    assert arr.tolist() == expected.tolist()
+                assert vexy_json.loads_numpy(text, dtype=dtype).flags.writeable
+        
     except ImportError:
         pytest.skip("NumPy not available")
 
@@ -152,6 +208,21 @@ def test_pandas_integration():
         assert df.iloc[0]["a"] == 1
         assert df.iloc[1]["b"] == 4
         
+        # Uniform records are built column by column with native dtypes
+        df = vexy_json.loads_dataframe(
+            '[{"i": 1, "f": 1, "s": "x"}, {"s": "y", "f": 2.5, "i": 2}]'
+        )
+        assert df.columns.tolist() == ["i", "f", "s"]
+        assert str(df["i"].dtype) == "int64"
+        assert str(df["f"].dtype) == "float64"
+        assert df["s"].tolist() == ["x", "y"]
+        df.loc[0, "i"] = 10
+        assert df.iloc[0]["i"] == 10
+        
+        # Records with differing keys go through pandas' row handling
+        df = vexy_json.loads_dataframe('[{"a": 1}, {"b": 2}]')
+        assert df.shape == (2, 2)
+        
     except ImportError:
         pytest.skip("pandas not available")
 